@@ -2,9 +2,9 @@
 [JS-F001] jedisos.channels.telegram
 텔레그램 봇 채널 어댑터 - python-telegram-bot>=22.6 기반
 
-version: 1.1.0
+version: 1.2.0
 created: 2026-02-18
-modified: 2026-02-18
+modified: 2026-10-17
 dependencies: python-telegram-bot>=22.6
 """
 
@@ -39,6 +39,8 @@ logger = structlog.get_logger()
 # 사용자별 대화 히스토리 (최근 20턴)
 _MAX_HISTORY = 20
 _telegram_history: dict[str, list[dict[str, str]]] = defaultdict(list)
+# 히스토리가 있는 채팅 ID (int) - 알림 전송 시 키 복사/int 변환 없이 바로 사용
+_telegram_chat_ids: set[int] = set()
 
 
 def _md_to_telegram_html(text: str) -> str:  # [JS-F001.10]
@@ -169,6 +171,7 @@ class TelegramChannel:  # [JS-F001.1]
             response = await self._process_envelope(envelope)
             # 대화 히스토리에 추가
             history = _telegram_history[user_id]
+            _telegram_chat_ids.add(user.id)
             history.append({"role": "user", "content": content})
             history.append({"role": "assistant", "content": response})
             while len(history) > _MAX_HISTORY * 2:
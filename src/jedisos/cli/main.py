@@ -2,15 +2,16 @@
 [JS-H001] jedisos.cli.main
 Typer CLI 엔트리포인트 - JediSOS 커맨드라인 인터페이스
 
-version: 1.0.0
+version: 1.1.0
 created: 2026-02-18
-modified: 2026-02-18
+modified: 2026-10-17
 dependencies: typer>=0.23.1, rich>=14.3.2
 """
 
 from __future__ import annotations
 
 import asyncio
+import os
 import sys
 from pathlib import Path
 from typing import Annotated
@@ -197,20 +198,41 @@ timeout: 60
 def serve(
     host: Annotated[str, typer.Option("--host", "-h", help="바인딩 호스트")] = "0.0.0.0",  # nosec B104
     port: Annotated[int, typer.Option("--port", "-p", help="포트")] = 8866,
+    workers: Annotated[
+        int,
+        typer.Option("--workers", "-w", min=1, help="워커 프로세스 수 (gunicorn 있으면 preload)"),
+    ] = 1,
+    uds: Annotated[
+        str | None,
+        typer.Option("--uds", envvar="JEDISOS_UDS", help="UNIX 소켓 경로 (리버스 프록시 뒤)"),
+    ] = None,
+    fd: Annotated[
+        int | None, typer.Option("--fd", help="상속받은 소켓 파일 디스크립터 (systemd 소켓 활성화)")
+    ] = None,
+    access_log: Annotated[
+        bool | None,
+        typer.Option("--access-log/--no-access-log", help="요청별 액세스 로그 (기본: prod에서 끔)"),
+    ] = None,
 ) -> None:
     """JediSOS 웹 서버를 실행합니다. (API + Web UI)"""
+    address = f"fd {fd}" if fd is not None else uds or f"{host}:{port}"
+    lines = [f"JediSOS 서버가 [bold]{address}[/bold]에서 시작됩니다."]
+    # UNIX 소켓/상속 fd는 리버스 프록시 뒤라 TCP URL이 의미 없음
+    if fd is None and uds is None:
+        lines.append(f"웹 UI: http://{host}:{port}")
+        # prod에서는 /docs가 꺼져 있음
+        if os.environ.get("JEDISOS_ENV", "dev").lower() != "prod":
+            lines.append(f"API 문서: http://{host}:{port}/docs")
     console.print(
         Panel(
-            f"JediSOS 서버가 [bold]{host}:{port}[/bold]에서 시작됩니다.\n"
-            f"웹 UI: http://{host}:{port}\n"
-            f"API 문서: http://{host}:{port}/docs",
+            "\n".join(lines),
             title="JediSOS Server",
             border_style="blue",
         )
     )
     from jedisos.web.app import run_server
 
-    run_server(host=host, port=port)
+    run_server(host=host, port=port, workers=workers, uds=uds, fd=fd, access_log=access_log)
 
 
 @app.command()  # [JS-H001.7]
@@ -0,0 +1,53 @@
+"""
+[JS-A005] jedisos.core.log_config
+structlog 출력 설정 - 운영 환경용 orjson JSON 렌더러
+
+version: 1.0.0
+created: 2026-10-17
+modified: 2026-10-17
+dependencies: structlog>=25.5, orjson>=3.10
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+
+
+def configure_logging(fmt: str | None = None, level: str | None = None) -> bool:  # [JS-A005.1]
+    """JEDISOS_LOG_FORMAT=json이면 structlog를 orjson 기반 JSON 출력으로 설정합니다.
+
+    로그 한 줄마다 stdlib json 대신 orjson.dumps로 바로 bytes를 만들고,
+    BytesLoggerFactory로 인코딩 없이 stdout에 씁니다. 기본값(console)은
+    structlog 기본 설정(개발용 컬러 출력)을 그대로 둡니다.
+
+    Args:
+        fmt: "json" 또는 "console" (None이면 JEDISOS_LOG_FORMAT)
+        level: 최소 로그 레벨 (None이면 LOG_LEVEL, 기본 INFO)
+
+    Returns:
+        JSON 설정을 적용했으면 True
+    """
+    fmt = (fmt or os.environ.get("JEDISOS_LOG_FORMAT", "console")).lower()
+    if fmt != "json":
+        return False
+
+    import orjson
+    import structlog
+
+    level_name = (level or os.environ.get("LOG_LEVEL", "INFO")).upper()
+    structlog.configure(
+        processors=[
+            structlog.contextvars.merge_contextvars,
+            structlog.processors.add_log_level,
+            structlog.processors.TimeStamper(fmt="iso", utc=True),
+            structlog.processors.dict_tracebacks,
+            structlog.processors.JSONRenderer(serializer=orjson.dumps, default=str),
+        ],
+        wrapper_class=structlog.make_filtering_bound_logger(
+            logging.getLevelNamesMapping().get(level_name, logging.INFO)
+        ),
+        logger_factory=structlog.BytesLoggerFactory(),
+        cache_logger_on_first_use=True,
+    )
+    return True
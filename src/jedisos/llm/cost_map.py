@@ -0,0 +1,113 @@
+"""
+[JS-C005] jedisos.llm.cost_map
+LiteLLM 모델 비용/컨텍스트 맵 디스크 캐시 — stale-while-revalidate
+
+litellm은 import 시 GitHub에서 모델 비용 맵을 내려받습니다 (네트워크 대기, 오프라인 실패).
+시작 시에는 번들 맵으로 바로 뜨고, 디스크 캐시 적용과 원격 갱신은 백그라운드에서 합니다.
+
+version: 1.1.0
+created: 2026-10-17
+modified: 2026-10-17
+dependencies: litellm>=1.81.12, httpx>=0.28.1, orjson>=3.10
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from typing import TYPE_CHECKING, Any
+
+import orjson
+import structlog
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+logger = structlog.get_logger()
+
+_LOCAL_COST_MAP_ENV = "LITELLM_LOCAL_MODEL_COST_MAP"
+
+# 환경변수를 이 모듈이 설정했는지 (preload 후 fork된 워커도 값을 물려받음)
+_env_owned = False
+
+
+def use_local_cost_map() -> bool:  # [JS-C005.1]
+    """litellm import 전에 호출해 import 시 원격 fetch를 끕니다.
+
+    Returns:
+        백그라운드 갱신이 필요하면 True. 사용자가 환경변수를 직접 설정했다면
+        (오프라인 고정 또는 import 시 fetch) 그 선택을 따르고 False를 반환합니다.
+        이 함수가 이미 설정한 경우(예: preload 부모 프로세스)는 다시 True입니다.
+    """
+    global _env_owned
+    if _LOCAL_COST_MAP_ENV in os.environ:
+        return _env_owned
+    os.environ[_LOCAL_COST_MAP_ENV] = "True"
+    _env_owned = True
+    return True
+
+
+def load_cached_cost_map(cache_path: Path) -> int:  # [JS-C005.2]
+    """디스크 캐시의 비용 맵을 litellm에 등록합니다 (블로킹).
+
+    Returns:
+        등록한 모델 수 (캐시가 없거나 손상되었으면 0)
+    """
+    try:
+        data = orjson.loads(cache_path.read_bytes())
+    except FileNotFoundError:
+        return 0
+    except orjson.JSONDecodeError as e:
+        logger.warning("llm_cost_map_cache_corrupt", path=str(cache_path), error=str(e))
+        return 0
+    if not isinstance(data, dict):
+        return 0
+
+    _register(data)
+    logger.info("llm_cost_map_cache_loaded", path=str(cache_path), models=len(data))
+    return len(data)
+
+
+async def refresh_cost_map(cache_path: Path, timeout: float = 10.0) -> bool:  # [JS-C005.3]
+    """원격 비용 맵을 받아 디스크 캐시에 쓰고 litellm에 등록합니다.
+
+    실패하면 경고만 남기고 기존(stale) 맵을 그대로 사용합니다.
+    """
+    import httpx
+    import litellm
+
+    try:
+        async with httpx.AsyncClient(timeout=timeout) as client:
+            resp = await client.get(litellm.model_cost_map_url)
+            resp.raise_for_status()
+        data = orjson.loads(resp.content)
+        if not isinstance(data, dict) or not data:
+            raise ValueError("empty cost map")
+    except Exception as e:
+        logger.warning("llm_cost_map_refresh_failed", error=str(e))
+        return False
+
+    await asyncio.to_thread(_store, cache_path, resp.content, data)
+    logger.info("llm_cost_map_refreshed", models=len(data))
+    return True
+
+
+async def revalidate_cost_map(cache_path: Path) -> None:  # [JS-C005.4]
+    """디스크 캐시를 먼저 적용한 뒤 원격 맵으로 갱신합니다 (백그라운드 태스크용)."""
+    await asyncio.to_thread(load_cached_cost_map, cache_path)
+    await refresh_cost_map(cache_path)
+
+
+def _store(cache_path: Path, raw: bytes, data: dict[str, Any]) -> None:
+    """캐시 파일을 교체하고 새 맵을 등록합니다."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(raw)
+    os.replace(tmp, cache_path)
+    _register(data)
+
+
+def _register(data: dict[str, Any]) -> None:
+    import litellm
+
+    litellm.register_model(data)
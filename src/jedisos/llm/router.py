@@ -2,9 +2,9 @@
 [JS-C001] jedisos.llm.router
 LiteLLM 라우터 래퍼 - 멀티 LLM 프로바이더 폴백
 
-version: 2.0.0
+version: 2.1.0
 created: 2026-02-16
-modified: 2026-02-20
+modified: 2026-10-17
 dependencies: litellm>=1.81.12
 """
 
@@ -33,12 +33,14 @@ class LLMRouter:  # [JS-C001.1]
     폴백 체인을 config.models 리스트 순서로 시도합니다.
     역할별 모델 매핑은 프로바이더별 폴백 체인을 지원합니다:
       {"chat": ["gpt-5-mini", "gemini/gemini-3-flash"], ...}
+    역할 매핑이 바뀔 때마다 `roles_version`이 증가합니다.
     """
 
     def __init__(self, config: LLMConfig | None = None) -> None:
         self.config = config or LLMConfig()
         self._models = self._filter_available_models(self._load_models())
         self._role_models: dict[str, list[str]] = {}
+        self.roles_version = 0
         litellm.set_verbose = False
         litellm.drop_params = True
         if not self._models:
@@ -52,6 +54,7 @@ class LLMRouter:  # [JS-C001.1]
             mapping: {"reason": ["gpt-5.2-pro", "gemini/gemini-3-pro"], ...}
         """
         self._role_models = {k: list(v) for k, v in mapping.items()}
+        self.roles_version += 1
         logger.info("llm_role_models_set", mapping=self._role_models)
 
     def models_for(self, role: str) -> list[str]:  # [JS-C001.7]
@@ -2,14 +2,15 @@
 [JS-D003] jedisos.mcp.registry
 MCP 서버 검색 — 큐레이티드 리스트 + npm/PyPI API + mcp.so 폴백
 
-version: 1.0.0
+version: 1.1.0
 created: 2026-02-20
-modified: 2026-02-20
+modified: 2026-10-17
 dependencies: httpx>=0.28.1
 """
 
 from __future__ import annotations
 
+import asyncio
 import re
 from typing import Any
 
@@ -24,6 +25,10 @@ _NPM_SEARCH_URL = "https://registry.npmjs.org/-/v1/search"
 # mcp.so 검색
 _MCP_SO_URL = "https://mcp.so/servers"
 
+# 검색 공용 HTTP 클라이언트: (생성한 이벤트 루프, 클라이언트).
+# 검색마다 TCP/TLS 연결을 새로 맺지 않도록 연결 풀을 재사용합니다.
+_http: tuple[asyncio.AbstractEventLoop, httpx.AsyncClient] | None = None
+
 
 # ──────────────────────────────────────────────
 # 큐레이티드 인기 MCP 서버 목록
@@ -182,6 +187,27 @@ CURATED_SERVERS: list[dict[str, Any]] = [  # [JS-D003.1]
 ]
 
 
+def _http_client() -> httpx.AsyncClient:  # [JS-D003.8]
+    """공용 HTTP 클라이언트를 반환합니다.
+
+    httpx 연결 풀은 이벤트 루프에 묶이므로 루프가 바뀌면(asyncio.run 재호출 등)
+    새로 만듭니다.
+    """
+    global _http
+    loop = asyncio.get_running_loop()
+    if _http is None or _http[0] is not loop or _http[1].is_closed:
+        _http = (loop, httpx.AsyncClient(timeout=10.0, follow_redirects=True))
+    return _http[1]
+
+
+async def aclose_http_client() -> None:  # [JS-D003.9]
+    """공용 HTTP 클라이언트를 닫습니다 (앱 종료 시)."""
+    global _http
+    http, _http = _http, None
+    if http is not None and http[0] is asyncio.get_running_loop():
+        await http[1].aclose()
+
+
 async def search_curated(query: str) -> list[dict[str, Any]]:  # [JS-D003.2]
     """큐레이티드 리스트에서 검색합니다."""
     q = query.lower()
@@ -200,13 +226,12 @@ async def search_npm(query: str, size: int = 10) -> list[dict[str, Any]]:  # [JS
     """npm 레지스트리에서 MCP 서버를 검색합니다."""
     results: list[dict[str, Any]] = []
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.get(
-                _NPM_SEARCH_URL,
-                params={"text": f"modelcontextprotocol server {query}", "size": size},
-            )
-            resp.raise_for_status()
-            data = resp.json()
+        resp = await _http_client().get(
+            _NPM_SEARCH_URL,
+            params={"text": f"modelcontextprotocol server {query}", "size": size},
+        )
+        resp.raise_for_status()
+        data = resp.json()
 
         for obj in data.get("objects", []):
             pkg = obj.get("package", {})
@@ -237,13 +262,12 @@ async def search_pypi(query: str, size: int = 10) -> list[dict[str, Any]]:  # [J
     """PyPI에서 MCP 서버 패키지를 검색합니다."""
     results: list[dict[str, Any]] = []
     try:
-        async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
-            resp = await client.get(
-                "https://pypi.org/search/",
-                params={"q": f"mcp server {query}"},
-            )
-            resp.raise_for_status()
-            html = resp.text
+        resp = await _http_client().get(
+            "https://pypi.org/search/",
+            params={"q": f"mcp server {query}"},
+        )
+        resp.raise_for_status()
+        html = resp.text
 
         # 간단한 HTML 파싱 (정규식)
         # PyPI 검색 결과: <a class="package-snippet" href="/project/{name}/">
@@ -286,10 +310,9 @@ async def search_mcp_so(query: str, size: int = 10) -> list[dict[str, Any]]:  #
     """mcp.so에서 MCP 서버를 검색합니다 (HTML 크롤링, 폴백용)."""
     results: list[dict[str, Any]] = []
     try:
-        async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
-            resp = await client.get(_MCP_SO_URL, params={"q": query})
-            resp.raise_for_status()
-            html = resp.text
+        resp = await _http_client().get(_MCP_SO_URL, params={"q": query})
+        resp.raise_for_status()
+        html = resp.text
 
         # mcp.so 카드에서 서버 이름과 설명 추출
         # 패턴: /server/{name}/{author} 링크 + 설명 텍스트
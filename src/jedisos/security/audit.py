@@ -2,15 +2,17 @@
 [JS-G002] jedisos.security.audit
 감사 로그 - 도구 호출 및 보안 결정 기록
 
-version: 1.0.0
+version: 1.1.0
 created: 2026-02-17
-modified: 2026-02-17
+modified: 2026-10-17
 dependencies: structlog>=25.5.0
 """
 
 from __future__ import annotations
 
 import time
+from collections import deque
+from itertools import islice
 from typing import Any
 
 import structlog
@@ -22,11 +24,11 @@ class AuditLogger:  # [JS-G002.1]
     """도구 호출 및 보안 이벤트를 기록하는 감사 로거.
 
     structlog 기반으로 구조화된 감사 로그를 생성합니다.
-    인메모리 로그도 유지하여 최근 이벤트 조회가 가능합니다.
+    인메모리 로그(최대 max_entries개 링 버퍼)도 유지하여 최근 이벤트 조회가 가능합니다.
     """
 
     def __init__(self, max_entries: int = 1000) -> None:
-        self._entries: list[dict[str, Any]] = []
+        self._entries: deque[dict[str, Any]] = deque(maxlen=max_entries)
         self._max_entries = max_entries
         logger.info("audit_logger_init", max_entries=max_entries)
 
@@ -97,8 +99,13 @@ class AuditLogger:  # [JS-G002.1]
         logger.info("audit_agent_action", action=action, agent=agent_name, user_id=user_id)
 
     def get_recent(self, count: int = 50) -> list[dict[str, Any]]:  # [JS-G002.5]
-        """최근 감사 로그를 조회합니다."""
-        return list(self._entries[-count:])
+        """최근 감사 로그를 조회합니다.
+
+        뒤에서부터 count개만 읽어 전체 로그 크기와 무관하게 O(count)로 동작합니다.
+        """
+        if count <= 0:
+            return []
+        return list(islice(reversed(self._entries), count))[::-1]
 
     def get_by_user(self, user_id: str) -> list[dict[str, Any]]:  # [JS-G002.6]
         """특정 사용자의 감사 로그를 조회합니다."""
@@ -118,7 +125,5 @@ class AuditLogger:  # [JS-G002.1]
         return len(self._entries)
 
     def _append(self, entry: dict[str, Any]) -> None:
-        """엔트리를 추가하고 최대 크기를 유지합니다."""
+        """엔트리를 추가합니다. deque(maxlen)이 가장 오래된 엔트리를 제거합니다."""
         self._entries.append(entry)
-        if len(self._entries) > self._max_entries:
-            self._entries = self._entries[-self._max_entries :]
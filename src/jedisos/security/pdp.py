@@ -2,9 +2,9 @@
 [JS-G001] jedisos.security.pdp
 Policy Decision Point - 도구 호출 허용/차단 정책 엔진
 
-version: 1.0.0
+version: 1.1.0
 created: 2026-02-17
-modified: 2026-02-17
+modified: 2026-10-17
 dependencies: pydantic-settings>=2.13
 """
 
@@ -32,10 +32,14 @@ class PolicyDecisionPoint:  # [JS-G001.1]
     - allowed_tools: 화이트리스트 (빈 리스트 = 모두 허용)
     - blocked_tools: 블랙리스트 (항상 차단)
     - max_requests_per_minute: 속도 제한
+
+    정책을 변경하는 메서드는 `version`을 증가시키며, 정책 요약은 version 기준으로 캐시됩니다.
     """
 
     def __init__(self, config: SecurityConfig) -> None:
         self.config = config
+        self.version = 0
+        self._summary_cache: tuple[int, dict[str, Any]] | None = None
         self._request_counts: dict[str, list[float]] = defaultdict(list)
         logger.info(
             "pdp_init",
@@ -111,18 +115,29 @@ class PolicyDecisionPoint:  # [JS-G001.1]
         """블랙리스트에 도구를 추가합니다."""
         if tool_name not in self.config.blocked_tools:
             self.config.blocked_tools.append(tool_name)
+            self.version += 1
             logger.info("pdp_tool_blocked", tool=tool_name)
 
     def remove_blocked_tool(self, tool_name: str) -> None:  # [JS-G001.6]
         """블랙리스트에서 도구를 제거합니다."""
         if tool_name in self.config.blocked_tools:
             self.config.blocked_tools.remove(tool_name)
+            self.version += 1
             logger.info("pdp_tool_unblocked", tool=tool_name)
 
     def get_policy_summary(self) -> dict[str, Any]:  # [JS-G001.7]
-        """현재 정책 요약을 반환합니다."""
-        return {
+        """현재 정책 요약을 반환합니다.
+
+        정책 version이 같으면 이전에 만든 딕셔너리를 그대로 반환합니다 (호출자는 수정 금지).
+        """
+        cached = self._summary_cache
+        if cached is not None and cached[0] == self.version:
+            return cached[1]
+
+        summary = {
             "allowed_tools": list(self.config.allowed_tools),
             "blocked_tools": list(self.config.blocked_tools),
             "max_requests_per_minute": self.config.max_requests_per_minute,
         }
+        self._summary_cache = (self.version, summary)
+        return summary
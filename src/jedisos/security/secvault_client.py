@@ -2,18 +2,19 @@
 [JS-G005] jedisos.security.secvault_client
 SecVault 비동기 UDS 클라이언트 - 데몬과 통신하는 인터페이스
 
-version: 1.0.0
+version: 1.1.0
 created: 2026-02-19
-modified: 2026-02-19
+modified: 2026-10-17
+dependencies: orjson>=3.10
 """
 
 from __future__ import annotations
 
 import asyncio
-import json
 from pathlib import Path
 from typing import Any
 
+import orjson
 import structlog
 
 from jedisos.security.secvault import SECDATA_PATTERN
@@ -63,7 +64,7 @@ class SecVaultClient:  # [JS-G005.1]
             try:
                 reader, writer = await asyncio.open_unix_connection(str(self.socket_path))
                 try:
-                    writer.write(json.dumps(request).encode("utf-8"))
+                    writer.write(orjson.dumps(request))
                     await writer.drain()
 
                     data = await asyncio.wait_for(
@@ -73,7 +74,7 @@ class SecVaultClient:  # [JS-G005.1]
                     if not data:
                         raise ConnectionError("데몬으로부터 빈 응답")
 
-                    return json.loads(data.decode("utf-8"))
+                    return orjson.loads(data)
                 finally:
                     writer.close()
                     await writer.wait_closed()
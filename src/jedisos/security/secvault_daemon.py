@@ -2,10 +2,10 @@
 [JS-G004] jedisos.security.secvault_daemon
 SecVault 독립 복호화 데몬 - Unix Domain Socket 기반 IPC
 
-version: 1.0.0
+version: 1.1.0
 created: 2026-02-19
-modified: 2026-02-19
-dependencies: argon2-cffi>=23.1.0, cryptography>=46.0.5
+modified: 2026-10-17
+dependencies: argon2-cffi>=23.1.0, cryptography>=46.0.5, orjson>=3.10
 
 라이프사이클:
 1. 앱 시작 → SecVault 데몬 프로세스 spawn
@@ -18,25 +18,72 @@ dependencies: argon2-cffi>=23.1.0, cryptography>=46.0.5
 from __future__ import annotations
 
 import asyncio
-import json
 import os
 import signal
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from multiprocessing import Process
 from pathlib import Path
 from typing import Any
 
+import orjson
 import structlog
 
 from jedisos.security.secvault import MasterKeyFile, decrypt_data, encrypt_data
 
 logger = structlog.get_logger()
 
+# AES-GCM 암복호화 전용 스레드 풀 (기본 executor와 분리, 스레드는 첫 사용 시 생성)
+_crypto_pool = ThreadPoolExecutor(
+    max_workers=min(4, os.cpu_count() or 1),
+    thread_name_prefix="secvault-crypto",
+)
+_CRYPTO_OPS = frozenset({"encrypt", "decrypt"})
+
+_LOCKED_ERROR = "SecVault가 잠겨 있습니다. 먼저 unlock하세요."
+
 # UDS 프로토콜:
 # 요청: {"op": "encrypt|decrypt|unlock|setup|status|lock", "data": "...", "request_id": "uuid"}
 # 응답: {"ok": true|false, "data": "...", "error": "...", "request_id": "uuid"}
 
 
+class FrameWriter:  # [JS-G004.12]
+    """UDS 응답 JSON을 bytearray에 직접 기록하는 라이터.
+
+    응답 dict를 만든 뒤 직렬화하는 대신 필드를 순서대로 버퍼에 씁니다.
+    ASCII 안전이 보장된 값(SecVault 마커)은 이스케이프 없이 그대로 복사합니다.
+    """
+
+    __slots__ = ("_buf", "_sep")
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+        self._sep = b""
+
+    def start(self) -> None:
+        """JSON 객체를 엽니다."""
+        self._buf += b"{"
+        self._sep = b""
+
+    def field(self, key: str, value: Any) -> None:
+        """JSON 이스케이프가 필요한 필드를 기록합니다."""
+        self._buf += self._sep
+        self._buf += b'"' + key.encode("ascii") + b'":'
+        self._buf += orjson.dumps(value)
+        self._sep = b","
+
+    def raw_field(self, key: str, value: str) -> None:
+        """이스케이프가 필요 없는 ASCII 문자열 필드를 그대로 기록합니다."""
+        self._buf += self._sep
+        self._buf += b'"' + key.encode("ascii") + b'":"' + value.encode("ascii") + b'"'
+        self._sep = b","
+
+    def end(self) -> bytes:
+        """JSON 객체를 닫고 완성된 프레임을 반환합니다."""
+        self._buf += b"}"
+        return bytes(self._buf)
+
+
 class SecVaultDaemon:  # [JS-G004.1]
     """SecVault 독립 복호화 데몬.
 
@@ -111,14 +158,12 @@ class SecVaultDaemon:  # [JS-G004.1]
             if not data:
                 return
 
-            request = json.loads(data.decode("utf-8"))
-            response = self._dispatch(request)
-
-            writer.write(json.dumps(response).encode("utf-8"))
+            request = orjson.loads(data)
+            writer.write(await self._respond(request))
             await writer.drain()
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             error_resp = {"ok": False, "error": "유효하지 않은 JSON", "request_id": ""}
-            writer.write(json.dumps(error_resp).encode("utf-8"))
+            writer.write(orjson.dumps(error_resp))
             await writer.drain()
         except Exception as e:
             logger.error("secvault_connection_error", error=str(e))
@@ -127,7 +172,10 @@ class SecVaultDaemon:  # [JS-G004.1]
             await writer.wait_closed()
 
     def _dispatch(self, request: dict[str, Any]) -> dict[str, Any]:  # [JS-G004.3]
-        """요청을 적절한 핸들러로 디스패치합니다."""
+        """상태 관련 요청을 적절한 핸들러로 디스패치합니다.
+
+        encrypt/decrypt는 _dispatch_frame에서 처리합니다.
+        """
         op = request.get("op", "")
         data = request.get("data", "")
         request_id = request.get("request_id", "")
@@ -135,8 +183,6 @@ class SecVaultDaemon:  # [JS-G004.1]
         handlers = {
             "setup": self._handle_setup,
             "unlock": self._handle_unlock,
-            "encrypt": self._handle_encrypt,
-            "decrypt": self._handle_decrypt,
             "status": self._handle_status,
             "lock": self._handle_lock,
         }
@@ -146,13 +192,44 @@ class SecVaultDaemon:  # [JS-G004.1]
             return {"ok": False, "error": f"알 수 없는 작업: {op}", "request_id": request_id}
 
         try:
-            result = handler(data) if op in ("setup", "unlock", "encrypt", "decrypt") else handler()
+            result = handler(data) if op in ("setup", "unlock") else handler()
             result["request_id"] = request_id
             return result
         except Exception as e:
             logger.error("secvault_handler_error", op=op, error=str(e))
             return {"ok": False, "error": str(e), "request_id": request_id}
 
+    async def _respond(self, request: dict[str, Any]) -> bytes:  # [JS-G004.3.1]
+        """요청을 처리하고 직렬화된 응답 프레임을 반환합니다.
+
+        encrypt/decrypt는 crypto 스레드 풀에서 FrameWriter로 바로 직렬화하고,
+        상태를 변경하는 setup/unlock/lock 등은 경쟁 조건을 피하기 위해 루프에서 직렬 처리합니다.
+        """
+        if request.get("op") in _CRYPTO_OPS:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                _crypto_pool, self._dispatch_frame, request, FrameWriter()
+            )
+        return orjson.dumps(self._dispatch(request))
+
+    def _dispatch_frame(self, request: dict[str, Any], fw: FrameWriter) -> bytes:  # [JS-G004.3.2]
+        """encrypt/decrypt 요청을 처리하고 응답을 중간 dict 없이 기록합니다."""
+        op = request.get("op", "")
+        data = request.get("data", "")
+        request_id = request.get("request_id", "")
+        handler = self._handle_encrypt if op == "encrypt" else self._handle_decrypt
+
+        fw.start()
+        try:
+            handler(data, fw)
+        except Exception as e:
+            # 핸들러는 암복호화가 성공한 뒤에만 필드를 기록하므로 여기서 새로 씀
+            logger.error("secvault_handler_error", op=op, error=str(e))
+            fw.field("ok", False)
+            fw.field("error", str(e))
+        fw.field("request_id", request_id)
+        return fw.end()
+
     def _handle_setup(self, password: str) -> dict[str, Any]:  # [JS-G004.4]
         """최초 비밀번호 설정."""
         if self.master_key_file.exists():
@@ -202,21 +279,28 @@ class SecVaultDaemon:  # [JS-G004.1]
             remaining = self.MAX_ATTEMPTS - self._failed_attempts
             return {"ok": False, "error": f"비밀번호가 틀립니다. 남은 시도: {remaining}회"}
 
-    def _handle_encrypt(self, plaintext: str) -> dict[str, Any]:  # [JS-G004.6]
-        """평문을 암호화합니다."""
+    def _handle_encrypt(self, plaintext: str, fw: FrameWriter) -> None:  # [JS-G004.6]
+        """평문을 암호화해 응답 필드를 기록합니다."""
         if self._master_key is None:
-            return {"ok": False, "error": "SecVault가 잠겨 있습니다. 먼저 unlock하세요."}
+            fw.field("ok", False)
+            fw.field("error", _LOCKED_ERROR)
+            return
 
         marker = encrypt_data(plaintext, self._master_key)
-        return {"ok": True, "data": marker}
+        fw.field("ok", True)
+        # 마커는 base64와 구분자만 포함하므로 이스케이프 불필요
+        fw.raw_field("data", marker)
 
-    def _handle_decrypt(self, marker: str) -> dict[str, Any]:  # [JS-G004.7]
-        """SecVault 마커를 복호화합니다."""
+    def _handle_decrypt(self, marker: str, fw: FrameWriter) -> None:  # [JS-G004.7]
+        """SecVault 마커를 복호화해 응답 필드를 기록합니다."""
         if self._master_key is None:
-            return {"ok": False, "error": "SecVault가 잠겨 있습니다. 먼저 unlock하세요."}
+            fw.field("ok", False)
+            fw.field("error", _LOCKED_ERROR)
+            return
 
         plaintext = decrypt_data(marker, self._master_key)
-        return {"ok": True, "data": plaintext}
+        fw.field("ok", True)
+        fw.field("data", plaintext)
 
     def _handle_status(self) -> dict[str, Any]:  # [JS-G004.8]
         """현재 상태를 반환합니다."""
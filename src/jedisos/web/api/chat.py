@@ -2,14 +2,15 @@
 [JS-W002] jedisos.web.api.chat
 WebSocket 기반 실시간 채팅 API
 
-version: 1.2.0
+version: 1.4.0
 created: 2026-02-18
-modified: 2026-02-20
+modified: 2026-10-17
 dependencies: fastapi>=0.115
 """
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import json
 import os
@@ -17,10 +18,13 @@ from collections import defaultdict
 from pathlib import Path
 from typing import Any
 
+import orjson
 import structlog
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from pydantic import BaseModel
 
+from jedisos.web.app import get_app_state
+
 logger = structlog.get_logger()
 
 router = APIRouter()
@@ -30,6 +34,12 @@ _MAX_HISTORY_TURNS = 20
 _conversation_history: dict[str, list[dict[str, str]]] = defaultdict(list)
 _history_loaded = False
 _detector: Any = None
+# 스트리밍 토큰 프레임의 고정 접두어 (토큰 문자열만 orjson으로 인코딩해 이어 붙임)
+_STREAM_FRAME_PREFIX = '{"type":"stream","content":'
+# 연결별 알림 전송 큐 크기 (넘치면 느린 소비자로 보고 연결을 닫음)
+_SEND_QUEUE_SIZE = 64
+# 느린 소비자 연결을 닫을 때 쓰는 close 코드 (1013 Try Again Later)
+_SLOW_CONSUMER_CLOSE_CODE = 1013
 
 
 def _get_detector() -> Any:  # [JS-W002.17]
@@ -114,20 +124,80 @@ class ChatResponse(BaseModel):  # [JS-W002.2]
 
 
 class ConnectionManager:  # [JS-W002.3]
-    """WebSocket 연결 관리자."""
+    """WebSocket 연결 관리자.
+
+    알림은 연결마다 하나씩 있는 큐에 넣고, 연결별 전송 태스크가 순서대로 보냅니다.
+    브로드캐스트 경로에는 await가 없고 느린 소켓이 다른 연결을 막지 않습니다.
+    """
 
     def __init__(self) -> None:
         self.active_connections: list[WebSocket] = []
+        self._queues: dict[WebSocket, asyncio.Queue[str]] = {}
+        self._senders: dict[WebSocket, asyncio.Task[None]] = {}
+        # 진행 중인 close 태스크 (GC로 사라지지 않도록 강한 참조 유지)
+        self._closing: set[asyncio.Task[None]] = set()
 
     async def connect(self, websocket: WebSocket) -> None:
         await websocket.accept()
         self.active_connections.append(websocket)
+        queue: asyncio.Queue[str] = asyncio.Queue(maxsize=_SEND_QUEUE_SIZE)
+        self._queues[websocket] = queue
+        self._senders[websocket] = asyncio.create_task(self._sender(websocket, queue))
         logger.info("websocket_connected", total=len(self.active_connections))
 
     def disconnect(self, websocket: WebSocket) -> None:
-        self.active_connections.remove(websocket)
+        # 전송 실패/느린 소비자로 먼저 정리되었을 수 있음
+        if websocket in self.active_connections:
+            self.active_connections.remove(websocket)
+        self._queues.pop(websocket, None)
+        sender = self._senders.pop(websocket, None)
+        if sender is not None and sender is not asyncio.current_task():
+            sender.cancel()
         logger.info("websocket_disconnected", total=len(self.active_connections))
 
+    def broadcast(self, text: str) -> None:  # [JS-W002.19]
+        """직렬화된 메시지를 모든 연결의 전송 큐에 넣습니다.
+
+        큐가 가득 찬 연결(메시지를 읽지 못하는 느린 소비자)은 알림 대상에서 제외하고
+        소켓을 1013 코드로 닫아 클라이언트가 재연결하도록 합니다.
+        """
+        for conn in list(self.active_connections):
+            queue = self._queues.get(conn)
+            if queue is None:
+                continue
+            try:
+                queue.put_nowait(text)
+            except asyncio.QueueFull:
+                logger.warning("websocket_slow_consumer_dropped")
+                sender = self._senders.get(conn)
+                self.disconnect(conn)
+                task = asyncio.create_task(self._close_slow(conn, sender))
+                self._closing.add(task)
+                task.add_done_callback(self._closing.discard)
+
+    async def _sender(
+        self, websocket: WebSocket, queue: asyncio.Queue[str]
+    ) -> None:  # [JS-W002.20]
+        """연결 하나의 알림 큐를 비우며 순서대로 전송합니다."""
+        try:
+            while True:
+                await websocket.send_text(await queue.get())
+        except Exception as e:
+            logger.debug("websocket_broadcast_failed", error=str(e))
+            self.disconnect(websocket)
+
+    async def _close_slow(
+        self, websocket: WebSocket, sender: asyncio.Task[None] | None
+    ) -> None:  # [JS-W002.21]
+        """느린 소비자 소켓을 닫습니다.
+
+        취소된 전송 태스크가 끝난 뒤에 close 프레임을 보내 프레임이 섞이지 않게 합니다.
+        """
+        if sender is not None:
+            await asyncio.wait([sender])
+        with contextlib.suppress(Exception):
+            await websocket.close(code=_SLOW_CONSUMER_CLOSE_CODE)
+
     @property
     def connection_count(self) -> int:
         return len(self.active_connections)
@@ -152,7 +222,8 @@ async def websocket_chat(websocket: WebSocket) -> None:
         await _send_vault_status(websocket)
 
         while True:
-            data = await websocket.receive_json()
+            # 수신 프레임도 orjson으로 파싱 (Starlette receive_json은 stdlib json)
+            data = orjson.loads(await websocket.receive_text())
             msg_type = data.get("type", "")
 
             # SecVault 비밀번호 설정/해제 처리
@@ -184,20 +255,19 @@ async def websocket_chat(websocket: WebSocket) -> None:
                 full_response = ""
                 async for chunk in agent.run_stream(message, bank_id=bank_id, history=history):
                     full_response += chunk
-                    await websocket.send_json({"type": "stream", "content": chunk})
+                    await websocket.send_text(
+                        _STREAM_FRAME_PREFIX + orjson.dumps(chunk).decode() + "}"
+                    )
 
                 _add_to_history(bank_id, "assistant", full_response)
-                await websocket.send_json(
-                    {
-                        "type": "done",
-                        "response": full_response,
-                        "bank_id": bank_id,
-                    }
-                )
+                done = {"type": "done", "response": full_response, "bank_id": bank_id}
+                await websocket.send_text(orjson.dumps(done).decode())
             except Exception as e:
                 logger.error("websocket_agent_error", error=str(e))
                 await websocket.send_json({"error": f"처리 실패: {e}"})
     except WebSocketDisconnect:
+        pass
+    finally:
         manager.disconnect(websocket)
 
 
@@ -252,8 +322,6 @@ def clear_all_history() -> None:  # [JS-W002.10]
 
 def _get_or_create_agent() -> Any:  # [JS-W002.9]
     """캐시된 에이전트를 반환하거나 새로 생성합니다."""
-    from jedisos.web.app import get_app_state
-
     state = get_app_state()
 
     # 이미 캐시된 에이전트가 있으면 재사용
@@ -300,8 +368,6 @@ async def _run_agent(message: str, bank_id: str, model: str | None = None) -> st
 
 async def _send_vault_status(websocket: WebSocket) -> None:  # [JS-W002.11]
     """WebSocket 연결 시 SecVault 상태를 전송합니다."""
-    from jedisos.web.app import get_app_state
-
     state = get_app_state()
     vault_client = state.get("vault_client")
     if vault_client is None:
@@ -321,8 +387,6 @@ async def _send_vault_status(websocket: WebSocket) -> None:  # [JS-W002.11]
 
 async def _handle_vault_setup(websocket: WebSocket, password: str) -> None:  # [JS-W002.12]
     """SecVault 최초 비밀번호 설정을 처리합니다."""
-    from jedisos.web.app import get_app_state
-
     state = get_app_state()
     vault_client = state.get("vault_client")
     if vault_client is None:
@@ -341,8 +405,6 @@ async def _handle_vault_setup(websocket: WebSocket, password: str) -> None:  # [
 
 async def _handle_vault_unlock(websocket: WebSocket, password: str) -> None:  # [JS-W002.13]
     """SecVault 잠금 해제를 처리합니다."""
-    from jedisos.web.app import get_app_state
-
     state = get_app_state()
     vault_client = state.get("vault_client")
     if vault_client is None:
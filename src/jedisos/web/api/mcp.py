@@ -2,29 +2,44 @@
 [JS-W004] jedisos.web.api.mcp
 MCP 서버 관리 API - 검색, 설치, 삭제
 
-version: 1.0.0
+version: 1.1.0
 created: 2026-02-18
-modified: 2026-02-18
-dependencies: fastapi>=0.115
+modified: 2026-10-17
+dependencies: fastapi>=0.115, orjson>=3.10
 """
 
 from __future__ import annotations
 
-import json
+import asyncio
 import os
 from pathlib import Path
 from typing import Any
 
+import orjson
 import structlog
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+from jedisos.web.fileio import atomic_write_bytes
+from jedisos.web.responses import OrjsonResponse
 
 logger = structlog.get_logger()
 
-router = APIRouter()
+router = APIRouter(default_response_class=OrjsonResponse)
 
 _MCP_CONFIG_PATH = Path(os.environ.get("JEDISOS_DATA_DIR", ".")) / "config" / "mcp_servers.json"
 
+# mcp_servers.json 파싱 캐시: (경로, mtime_ns, size, config, 이름별 서버 인덱스)
+_config_cache: tuple[Path, int, int, dict[str, Any], dict[str, dict[str, Any]]] | None = None
+
+# mcp_servers.json 읽기-수정-쓰기 구간 직렬화. 읽기와 쓰기가 각각 스레드로 나가므로
+# 잠그지 않으면 동시 요청이 같은 스냅샷을 읽고 나중 쓰기가 앞의 변경을 덮어씀
+_config_lock = asyncio.Lock()
+
+# 설치 요청에서 저장할 필드 (subprocess 타입은 실행 정보까지 저장)
+_INSTALL_FIELDS = frozenset({"name", "url", "description", "server_type"})
+_SUBPROCESS_FIELDS = frozenset({"command", "args", "env"})
+
 
 class MCPServerInfo(BaseModel):  # [JS-W004.1]
     """MCP 서버 정보 모델."""
@@ -42,6 +57,8 @@ class MCPServerInfo(BaseModel):  # [JS-W004.1]
 class MCPServerInstall(BaseModel):  # [JS-W004.2]
     """MCP 서버 설치 요청."""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     name: str
     url: str = ""
     description: str = ""
@@ -52,52 +69,73 @@ class MCPServerInstall(BaseModel):  # [JS-W004.2]
 
 
 def _load_mcp_config() -> dict[str, Any]:  # [JS-W004.3]
-    """MCP 설정 파일을 로드합니다."""
-    if _MCP_CONFIG_PATH.exists():
-        return json.loads(_MCP_CONFIG_PATH.read_text())
-    return {"servers": []}
+    """MCP 설정 파일을 로드합니다.
+
+    파일 mtime/크기가 그대로면 캐시된 파싱 결과를 반환합니다. 반환값은 캐시와 공유되므로
+    제자리 수정하지 말고 새 리스트/딕셔너리를 만들어 `_save_mcp_config`로 저장하세요.
+    """
+    return _load_mcp_index()[0]
+
+
+def _load_mcp_index() -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:  # [JS-W004.8]
+    """MCP 설정과 이름 → 서버 항목 인덱스를 함께 반환합니다 (캐시 공유, 수정 금지)."""
+    global _config_cache
+    try:
+        st = _MCP_CONFIG_PATH.stat()
+    except FileNotFoundError:
+        return {"servers": []}, {}
+
+    cached = _config_cache
+    if (
+        cached is not None
+        and cached[0] == _MCP_CONFIG_PATH
+        and cached[1] == st.st_mtime_ns
+        and cached[2] == st.st_size
+    ):
+        return cached[3], cached[4]
+
+    config = orjson.loads(_MCP_CONFIG_PATH.read_bytes())
+    by_name = {s["name"]: s for s in config.get("servers", [])}
+    _config_cache = (_MCP_CONFIG_PATH, st.st_mtime_ns, st.st_size, config, by_name)
+    return config, by_name
 
 
 def _save_mcp_config(config: dict[str, Any]) -> None:
-    """MCP 설정 파일을 저장합니다."""
+    """MCP 설정 파일을 저장하고 파싱 캐시를 갱신합니다."""
+    global _config_cache
     _MCP_CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
-    _MCP_CONFIG_PATH.write_text(json.dumps(config, indent=2, ensure_ascii=False))
+    atomic_write_bytes(_MCP_CONFIG_PATH, orjson.dumps(config, option=orjson.OPT_INDENT_2))
+    st = _MCP_CONFIG_PATH.stat()
+    by_name = {s["name"]: s for s in config.get("servers", [])}
+    _config_cache = (_MCP_CONFIG_PATH, st.st_mtime_ns, st.st_size, config, by_name)
 
 
 @router.get("/servers")  # [JS-W004.4]
 async def list_servers() -> dict[str, Any]:
     """설치된 MCP 서버 목록을 반환합니다."""
-    config = _load_mcp_config()
+    config = await asyncio.to_thread(_load_mcp_config)
     return {"servers": config.get("servers", []), "total": len(config.get("servers", []))}
 
 
 @router.post("/servers")  # [JS-W004.5]
 async def install_server(request: MCPServerInstall) -> dict[str, str]:
     """MCP 서버를 설치합니다."""
-    config = _load_mcp_config()
-    servers = config.get("servers", [])
+    fields = _INSTALL_FIELDS
+    if request.server_type == "subprocess":
+        fields = _INSTALL_FIELDS | _SUBPROCESS_FIELDS
+    entry: dict[str, Any] = {"enabled": True, **request.model_dump(include=fields)}
 
-    # 중복 체크
-    for s in servers:
-        if s["name"] == request.name:
+    async with _config_lock:
+        config, by_name = await asyncio.to_thread(_load_mcp_index)
+
+        # 중복 체크
+        if request.name in by_name:
             raise HTTPException(
                 status_code=409, detail=f"서버 '{request.name}'이(가) 이미 설치되어 있습니다."
             )
 
-    entry: dict[str, Any] = {
-        "name": request.name,
-        "url": request.url,
-        "description": request.description,
-        "enabled": True,
-        "server_type": request.server_type,
-    }
-    if request.server_type == "subprocess":
-        entry["command"] = request.command
-        entry["args"] = request.args
-        entry["env"] = request.env
-    servers.append(entry)
-    config["servers"] = servers
-    _save_mcp_config(config)
+        servers = config.get("servers", [])
+        await asyncio.to_thread(_save_mcp_config, {**config, "servers": [*servers, entry]})
 
     logger.info("mcp_server_installed", name=request.name)
     return {"status": "installed", "name": request.name}
@@ -106,17 +144,13 @@ async def install_server(request: MCPServerInstall) -> dict[str, str]:
 @router.delete("/servers/{name}")  # [JS-W004.6]
 async def uninstall_server(name: str) -> dict[str, str]:
     """MCP 서버를 삭제합니다."""
-    config = _load_mcp_config()
-    servers = config.get("servers", [])
+    async with _config_lock:
+        config, by_name = await asyncio.to_thread(_load_mcp_index)
+        if name not in by_name:
+            raise HTTPException(status_code=404, detail=f"서버 '{name}'을(를) 찾을 수 없습니다.")
 
-    original_count = len(servers)
-    servers = [s for s in servers if s["name"] != name]
-
-    if len(servers) == original_count:
-        raise HTTPException(status_code=404, detail=f"서버 '{name}'을(를) 찾을 수 없습니다.")
-
-    config["servers"] = servers
-    _save_mcp_config(config)
+        servers = [s for s in config.get("servers", []) if s["name"] != name]
+        await asyncio.to_thread(_save_mcp_config, {**config, "servers": servers})
 
     logger.info("mcp_server_uninstalled", name=name)
     return {"status": "uninstalled", "name": name}
@@ -125,14 +159,16 @@ async def uninstall_server(name: str) -> dict[str, str]:
 @router.put("/servers/{name}/toggle")  # [JS-W004.7]
 async def toggle_server(name: str) -> dict[str, Any]:
     """MCP 서버 활성화/비활성화를 토글합니다."""
-    config = _load_mcp_config()
-    servers = config.get("servers", [])
-
-    for s in servers:
-        if s["name"] == name:
-            s["enabled"] = not s.get("enabled", True)
-            _save_mcp_config(config)
-            logger.info("mcp_server_toggled", name=name, enabled=s["enabled"])
-            return {"name": name, "enabled": s["enabled"]}
-
-    raise HTTPException(status_code=404, detail=f"서버 '{name}'을(를) 찾을 수 없습니다.")
+    async with _config_lock:
+        config, by_name = await asyncio.to_thread(_load_mcp_index)
+        target = by_name.get(name)
+        if target is None:
+            raise HTTPException(status_code=404, detail=f"서버 '{name}'을(를) 찾을 수 없습니다.")
+
+        enabled = not target.get("enabled", True)
+        updated = [
+            {**s, "enabled": enabled} if s is target else s for s in config.get("servers", [])
+        ]
+        await asyncio.to_thread(_save_mcp_config, {**config, "servers": updated})
+    logger.info("mcp_server_toggled", name=name, enabled=enabled)
+    return {"name": name, "enabled": enabled}
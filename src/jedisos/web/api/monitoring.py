@@ -2,9 +2,9 @@
 [JS-W005] jedisos.web.api.monitoring
 상태 모니터링 + 감사 로그 API
 
-version: 1.0.0
+version: 1.1.0
 created: 2026-02-18
-modified: 2026-02-18
+modified: 2026-10-17
 dependencies: fastapi>=0.115
 """
 
@@ -17,20 +17,22 @@ import structlog
 from fastapi import APIRouter
 
 from jedisos import __version__
+from jedisos.web.app import Resources  # noqa: TC001 - FastAPI resolves Depends at runtime
+from jedisos.web.responses import OrjsonResponse
 
 logger = structlog.get_logger()
 
-router = APIRouter()
+router = APIRouter(default_response_class=OrjsonResponse)
+
+# /audit 조회 최대 건수
+_MAX_AUDIT_LIMIT = 1000
 
 
 @router.get("/status")  # [JS-W005.1]
-async def get_status() -> dict[str, Any]:
+async def get_status(res: Resources) -> dict[str, Any]:
     """시스템 상태를 반환합니다."""
-    from jedisos.web.app import get_app_state
-
-    state = get_app_state()
-    memory = state.get("memory")
-    llm = state.get("llm")
+    memory = res.memory
+    llm = res.llm
 
     # 메모리 시스템 상태
     memory_ok = False
@@ -52,27 +54,21 @@ async def get_status() -> dict[str, Any]:
 
 
 @router.get("/audit")  # [JS-W005.2]
-async def get_audit_log(limit: int = 50) -> dict[str, Any]:
+async def get_audit_log(res: Resources, limit: int = 50) -> dict[str, Any]:
     """감사 로그를 반환합니다."""
-    from jedisos.web.app import get_app_state
-
-    state = get_app_state()
-    audit = state.get("audit")
+    audit = res.audit
 
     if not audit:
         return {"entries": [], "total": 0}
 
-    entries = audit.get_recent(limit)
+    entries = audit.get_recent(min(limit, _MAX_AUDIT_LIMIT))
     return {"entries": entries, "total": audit.entry_count}
 
 
 @router.get("/audit/denied")  # [JS-W005.3]
-async def get_denied_log() -> dict[str, Any]:
+async def get_denied_log(res: Resources) -> dict[str, Any]:
     """차단된 요청 로그를 반환합니다."""
-    from jedisos.web.app import get_app_state
-
-    state = get_app_state()
-    audit = state.get("audit")
+    audit = res.audit
 
     if not audit:
         return {"entries": [], "total": 0}
@@ -82,12 +78,9 @@ async def get_denied_log() -> dict[str, Any]:
 
 
 @router.get("/policy")  # [JS-W005.4]
-async def get_policy() -> dict[str, Any]:
+async def get_policy(res: Resources) -> dict[str, Any]:
     """현재 보안 정책을 반환합니다."""
-    from jedisos.web.app import get_app_state
-
-    state = get_app_state()
-    pdp = state.get("pdp")
+    pdp = res.pdp
 
     if not pdp:
         return {"blocked_tools": [], "allowed_tools": [], "max_requests_per_minute": 0}
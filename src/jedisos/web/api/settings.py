@@ -2,30 +2,59 @@
 [JS-W003] jedisos.web.api.settings
 설정 관리 API - .env, llm_config.yaml, MCP 설정 편집
 
-version: 1.0.0
+version: 1.1.0
 created: 2026-02-18
-modified: 2026-02-18
+modified: 2026-10-17
 dependencies: fastapi>=0.115
 """
 
 from __future__ import annotations
 
+import asyncio
 import os
+import re
 from pathlib import Path
 from typing import Any
 
 import structlog
+import yaml
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+from jedisos.web.app import Resources  # noqa: TC001 - FastAPI resolves Depends at runtime
+from jedisos.web.fileio import atomic_write_text
+from jedisos.web.responses import OrjsonResponse
+
+try:
+    from yaml import CSafeDumper as _YamlDumper  # libyaml C 확장
+except ImportError:  # libyaml 없이 빌드된 PyYAML
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
 
 logger = structlog.get_logger()
 
-router = APIRouter()
+router = APIRouter(default_response_class=OrjsonResponse)
 
 # 설정 파일 기본 경로 (Docker: JEDISOS_DATA_DIR=/data, JEDISOS_CONFIG_DIR=/config)
 _DATA_DIR = Path(os.environ.get("JEDISOS_DATA_DIR", "."))
 _CONFIG_DIR = Path(os.environ.get("JEDISOS_CONFIG_DIR", str(_DATA_DIR / "config")))
 _ENV_PATH = _DATA_DIR / ".env"
+# API 키가 들어가므로 소유자만 읽기/쓰기
+_ENV_FILE_MODE = 0o600
+
+# .env의 KEY=VALUE 줄 (주석/빈 줄 제외)
+_ENV_LINE_RE = re.compile(r"^[ \t]*([^#=\s][^=\n]*?)[ \t]*=(.*)$", re.MULTILINE)
+
+# .env 텍스트 캐시: (경로, mtime_ns, size, text)
+_env_cache: tuple[Path, int, int, str] | None = None
+
+# .env 읽기-치환-쓰기 구간 직렬화 (동시 PUT /env가 서로의 변경을 덮어쓰지 않도록)
+_env_lock = asyncio.Lock()
+
+# GET 응답 캐시: (LLMConfig, 응답) / (LLMRouter, roles_version, 응답)
+_llm_settings_cache: tuple[Any, dict[str, Any]] | None = None
+_roles_cache: tuple[Any, int, dict[str, Any]] | None = None
+
+_ROLES = ("reason", "code", "chat", "classify", "extract")
 
 # [JS-W003.8] 웹 UI에서 수정 가능한 환경변수 키 목록
 _ALLOWED_ENV_KEYS: set[str] = {
@@ -42,9 +71,33 @@ _ALLOWED_ENV_KEYS: set[str] = {
 }
 
 
+def _read_env_text() -> str:  # [JS-W003.13]
+    """.env 파일 내용을 반환합니다. mtime/크기가 그대로면 캐시를 사용합니다."""
+    global _env_cache
+    try:
+        st = _ENV_PATH.stat()
+    except FileNotFoundError:
+        return ""
+
+    cached = _env_cache
+    if (
+        cached is not None
+        and cached[0] == _ENV_PATH
+        and cached[1] == st.st_mtime_ns
+        and cached[2] == st.st_size
+    ):
+        return cached[3]
+
+    text = _ENV_PATH.read_text()
+    _env_cache = (_ENV_PATH, st.st_mtime_ns, st.st_size, text)
+    return text
+
+
 class LLMSettingsUpdate(BaseModel):  # [JS-W003.1]
     """LLM 설정 업데이트 모델."""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     models: list[str] | None = None
     temperature: float | None = None
     max_tokens: int | None = None
@@ -54,72 +107,84 @@ class LLMSettingsUpdate(BaseModel):  # [JS-W003.1]
 class RoleModelsUpdate(BaseModel):  # [JS-W003.9]
     """역할별 모델 매핑 업데이트 모델."""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     roles: dict[str, list[str]]
 
 
 class EnvUpdate(BaseModel):  # [JS-W003.2]
     """환경변수 업데이트 모델."""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     key: str
     value: str
 
 
-@router.get("/llm")  # [JS-W003.3]
-async def get_llm_settings() -> dict[str, Any]:
-    """현재 LLM 설정을 반환합니다."""
-    from jedisos.web.app import get_app_state
+def _current_llm_settings(config: Any) -> dict[str, Any]:  # [JS-W003.14]
+    """앱 config에서 현재 LLM 설정 딕셔너리를 만듭니다.
 
-    state = get_app_state()
-    config = state.get("config")
+    같은 LLMConfig 객체면 이전에 만든 딕셔너리를 그대로 반환합니다 (호출자는 수정 금지).
+    """
+    global _llm_settings_cache
     if not config:
         return {"models": [], "temperature": 0.7, "max_tokens": 8192, "timeout": 60}
 
-    return {
-        "models": list(config.llm.models),
-        "temperature": config.llm.temperature,
-        "max_tokens": config.llm.max_tokens,
-        "timeout": config.llm.timeout,
+    llm_config = config.llm
+    cached = _llm_settings_cache
+    if cached is not None and cached[0] is llm_config:
+        return cached[1]
+
+    settings = {
+        "models": list(llm_config.models),
+        "temperature": llm_config.temperature,
+        "max_tokens": llm_config.max_tokens,
+        "timeout": llm_config.timeout,
     }
+    _llm_settings_cache = (llm_config, settings)
+    return settings
+
+
+@router.get("/llm")  # [JS-W003.3]
+async def get_llm_settings(res: Resources) -> dict[str, Any]:
+    """현재 LLM 설정을 반환합니다."""
+    return _current_llm_settings(res.config)
 
 
 @router.put("/llm")  # [JS-W003.4]
-async def update_llm_settings(settings: LLMSettingsUpdate) -> dict[str, str]:
+async def update_llm_settings(settings: LLMSettingsUpdate, res: Resources) -> dict[str, str]:
     """LLM 설정을 업데이트합니다. llm_config.yaml에 저장."""
     config_path = _CONFIG_DIR / "llm_config.yaml"
     config_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # 현재 설정 로드
-    current = await get_llm_settings()
-
-    if settings.models is not None:
-        current["models"] = settings.models
-    if settings.temperature is not None:
-        current["temperature"] = settings.temperature
-    if settings.max_tokens is not None:
-        current["max_tokens"] = settings.max_tokens
-    if settings.timeout is not None:
-        current["timeout"] = settings.timeout
+    # 현재 설정 로드 (캐시된 딕셔너리는 수정하지 않음)
+    current = {
+        **_current_llm_settings(res.config),
+        **settings.model_dump(exclude_none=True),
+    }
 
     # YAML로 저장
-    lines = ["# JediSOS LLM 설정\n", "models:\n"]
-    for m in current["models"]:
-        lines.append(f"  - {m}\n")
-    lines.append(f"\ntemperature: {current['temperature']}\n")
-    lines.append(f"max_tokens: {current['max_tokens']}\n")
-    lines.append(f"timeout: {current['timeout']}\n")
-
-    config_path.write_text("".join(lines))
+    body = yaml.dump(
+        {
+            "models": current["models"],
+            "temperature": current["temperature"],
+            "max_tokens": current["max_tokens"],
+            "timeout": current["timeout"],
+        },
+        Dumper=_YamlDumper,
+        allow_unicode=True,
+        sort_keys=False,
+        default_flow_style=False,
+    )
+    await asyncio.to_thread(atomic_write_text, config_path, "# JediSOS LLM 설정\n" + body)
     logger.info("llm_settings_updated", models=current["models"])
     return {"status": "updated"}
 
 
 @router.get("/security")  # [JS-W003.5]
-async def get_security_settings() -> dict[str, Any]:
+async def get_security_settings(res: Resources) -> dict[str, Any]:
     """보안 설정을 반환합니다."""
-    from jedisos.web.app import get_app_state
-
-    state = get_app_state()
-    pdp = state.get("pdp")
+    pdp = res.pdp
     if not pdp:
         return {"blocked_tools": [], "allowed_tools": [], "max_requests_per_minute": 30}
 
@@ -134,14 +199,11 @@ async def get_env_keys() -> dict[str, Any]:
     """
     known_keys = sorted(_ALLOWED_ENV_KEYS)
     # 실제 설정된 키 확인
-    configured = []
-    if _ENV_PATH.exists():
-        for line in _ENV_PATH.read_text().splitlines():
-            line = line.strip()
-            if line and not line.startswith("#") and "=" in line:
-                key = line.split("=", 1)[0].strip()
-                has_value = bool(line.split("=", 1)[1].strip())
-                configured.append({"key": key, "configured": has_value})
+    text = await asyncio.to_thread(_read_env_text)
+    configured = [
+        {"key": m.group(1), "configured": bool(m.group(2).strip())}
+        for m in _ENV_LINE_RE.finditer(text)
+    ]
 
     return {"known_keys": known_keys, "configured": configured}
 
@@ -153,60 +215,54 @@ async def update_env_var(update: EnvUpdate) -> dict[str, str]:
     if update.key not in _ALLOWED_ENV_KEYS:
         raise HTTPException(status_code=400, detail=f"허용되지 않는 키입니다: {update.key}")
 
-    # .env 파일 업데이트
-    lines: list[str] = []
-    found = False
-    if _ENV_PATH.exists():
-        for line in _ENV_PATH.read_text().splitlines():
-            if line.strip().startswith(f"{update.key}="):
-                lines.append(f"{update.key}={update.value}")
-                found = True
-            else:
-                lines.append(line)
-
-    if not found:
-        lines.append(f"{update.key}={update.value}")
-
-    _ENV_PATH.write_text("\n".join(lines) + "\n")
+    # .env 파일 업데이트 (기존 KEY= 줄 치환, 없으면 끝에 추가)
+    entry = f"{update.key}={update.value}"
+    pattern = re.compile(rf"^[ \t]*{re.escape(update.key)}=.*$", re.MULTILINE)
+    async with _env_lock:
+        text = await asyncio.to_thread(_read_env_text)
+        # 값에 백슬래시가 있어도 그대로 쓰도록 치환 함수 사용
+        new_text, count = pattern.subn(lambda _m: entry, text)
+        if count == 0:
+            prefix = new_text.rstrip("\n")
+            new_text = f"{prefix}\n{entry}\n" if prefix else f"{entry}\n"
+
+        await asyncio.to_thread(atomic_write_text, _ENV_PATH, new_text, _ENV_FILE_MODE)
     logger.info("env_var_updated", key=update.key)
     return {"status": "updated", "key": update.key}
 
 
 @router.get("/llm/roles")  # [JS-W003.10]
-async def get_model_roles() -> dict[str, Any]:
-    """현재 역할별 모델 매핑을 반환합니다."""
-    from jedisos.web.app import get_app_state
+async def get_model_roles(res: Resources) -> dict[str, Any]:
+    """현재 역할별 모델 매핑을 반환합니다.
 
-    state = get_app_state()
-    llm = state.get("llm")
+    LLM 라우터의 roles_version이 같으면 캐시된 응답을 반환합니다.
+    """
+    global _roles_cache
+    llm = res.llm
     if not llm:
         return {"roles": {}, "fallback_models": []}
 
-    roles: dict[str, list[str]] = {}
-    for role in ("reason", "code", "chat", "classify", "extract"):
-        roles[role] = llm.models_for(role)
+    cached = _roles_cache
+    if cached is not None and cached[0] is llm and cached[1] == llm.roles_version:
+        return cached[2]
 
-    return {
-        "roles": roles,
+    response = {
+        "roles": {role: llm.models_for(role) for role in _ROLES},
         "fallback_models": llm.models,
     }
+    _roles_cache = (llm, llm.roles_version, response)
+    return response
 
 
 @router.put("/llm/roles")  # [JS-W003.11]
-async def update_model_roles(update: RoleModelsUpdate) -> dict[str, str]:
+async def update_model_roles(update: RoleModelsUpdate, res: Resources) -> dict[str, str]:
     """역할별 모델 매핑을 수동으로 업데이트합니다."""
-    import yaml
-
-    from jedisos.web.app import get_app_state
-
-    state = get_app_state()
-    llm = state.get("llm")
+    llm = res.llm
     if not llm:
         raise HTTPException(status_code=503, detail="LLM 라우터가 초기화되지 않았습니다")
 
-    valid_roles = {"reason", "code", "chat", "classify", "extract"}
     for role in update.roles:
-        if role not in valid_roles:
+        if role not in _ROLES:
             raise HTTPException(status_code=400, detail=f"잘못된 역할: {role}")
 
     llm.set_role_models(update.roles)
@@ -214,9 +270,12 @@ async def update_model_roles(update: RoleModelsUpdate) -> dict[str, str]:
     # model_roles.yaml에 캐시 저장
     cache_path = _DATA_DIR / "model_roles.yaml"
     try:
-        cache_path.write_text(
-            yaml.dump(update.roles, allow_unicode=True, default_flow_style=False),
-            encoding="utf-8",
+        await asyncio.to_thread(
+            atomic_write_text,
+            cache_path,
+            yaml.dump(
+                update.roles, Dumper=_YamlDumper, allow_unicode=True, default_flow_style=False
+            ),
         )
     except Exception as e:
         logger.warning("model_roles_cache_save_failed", error=str(e))
@@ -226,12 +285,9 @@ async def update_model_roles(update: RoleModelsUpdate) -> dict[str, str]:
 
 
 @router.post("/llm/reconfigure")  # [JS-W003.12]
-async def reconfigure_models() -> dict[str, Any]:
+async def reconfigure_models(res: Resources) -> dict[str, Any]:
     """모델 자동 구성을 다시 실행합니다 (캐시 삭제 후)."""
-    from jedisos.web.app import get_app_state
-
-    state = get_app_state()
-    llm = state.get("llm")
+    llm = res.llm
     if not llm:
         raise HTTPException(status_code=503, detail="LLM 라우터가 초기화되지 않았습니다")
 
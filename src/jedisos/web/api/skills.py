@@ -2,14 +2,16 @@
 [JS-W007] jedisos.web.api.skills
 Skill(도구) 관리 API - 목록, 삭제, 활성/비활성
 
-version: 1.0.0
+version: 1.3.0
 created: 2026-02-18
-modified: 2026-02-18
+modified: 2026-10-17
 dependencies: fastapi>=0.115
 """
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import os
 import re
 import shutil
@@ -20,14 +22,33 @@ import structlog
 import yaml
 from fastapi import APIRouter, HTTPException
 
+from jedisos.web.app import get_app_state
+from jedisos.web.responses import OrjsonResponse
+
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml C 확장
+except ImportError:  # libyaml 없이 빌드된 PyYAML
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 logger = structlog.get_logger()
 
-router = APIRouter()
+router = APIRouter(default_response_class=OrjsonResponse)
 
 # Skill 디렉토리: tools/ + tools/generated/
 _TOOLS_DIR = Path(os.environ.get("JEDISOS_DATA_DIR", ".")) / "tools"
 _BUILTIN_TOOLS_DIR = Path("tools")  # 프로젝트 루트의 tools/
 
+# 하위 skill을 담는 카테고리 디렉토리 / 스캔에서 제외할 디렉토리
+_CATEGORY_DIRS = frozenset({"skills", "generated"})
+_SKIP_DIRS = frozenset({"__pycache__"})
+# Skill 이름 형식 (삭제 요청 검증용)
+_SKILL_NAME_RE = re.compile(r"^[a-zA-Z0-9_\-]+\Z")
+
+# _scan_skills() 결과 캐시: (디렉토리 mtime 시그니처, skill 목록, 이름 → skill)
+_scan_cache: (
+    tuple[tuple[tuple[str, int], ...], list[dict[str, Any]], dict[str, dict[str, Any]]] | None
+) = None
+
 
 def _get_tools_dirs() -> list[Path]:  # [JS-W007.1]
     """모든 Skill 검색 디렉토리를 반환합니다."""
@@ -38,36 +59,112 @@ def _get_tools_dirs() -> list[Path]:  # [JS-W007.1]
     return dirs
 
 
+@functools.lru_cache(maxsize=8)
+def _generated_dirs(tools_dir: Path) -> tuple[Path, ...]:  # [JS-W007.11]
+    """삭제가 허용되는 generated 디렉토리의 절대 경로를 반환합니다.
+
+    서버 실행 중 작업 디렉토리와 데이터 디렉토리는 바뀌지 않으므로 tools_dir별로
+    한 번만 resolve합니다 (삭제 요청마다 경로 정규화 syscall을 하지 않음).
+    """
+    return (
+        (_BUILTIN_TOOLS_DIR / "generated").resolve(),
+        (tools_dir / "generated").resolve(),
+    )
+
+
+def _tools_signature() -> tuple[tuple[str, int], ...]:  # [JS-W007.9]
+    """tools 디렉토리와 skills/, generated/ 카테고리 디렉토리의 mtime 시그니처를 만듭니다."""
+    sig: list[tuple[str, int]] = []
+    for tools_dir in _get_tools_dirs():
+        sig.append((str(tools_dir), tools_dir.stat().st_mtime_ns))
+        for category in ("generated", "skills"):
+            try:
+                sig.append((category, (tools_dir / category).stat().st_mtime_ns))
+            except FileNotFoundError:
+                sig.append((category, 0))
+    return tuple(sig)
+
+
+def _invalidate_skill_cache() -> None:  # [JS-W007.10]
+    """Skill 디렉토리를 변경한 뒤 스캔 캐시를 비웁니다."""
+    global _scan_cache
+    _scan_cache = None
+
+
 def _scan_skills() -> list[dict[str, Any]]:  # [JS-W007.2]
-    """모든 Skill을 스캔하여 메타데이터 목록을 반환합니다."""
-    skills: list[dict[str, Any]] = []
-    seen_names: set[str] = set()
+    """모든 Skill을 스캔하여 메타데이터 목록을 반환합니다.
+
+    디렉토리 mtime 시그니처가 같으면 캐시된 목록을 반환합니다 (호출자는 수정 금지).
+    skill 디렉토리 내부 파일 변경은 디렉토리 mtime에 드러나지 않으므로,
+    프로세스 안에서 skill을 변경하는 코드는 `_invalidate_skill_cache()`를 호출해야 합니다.
+    """
+    global _scan_cache
+    signature = _tools_signature()
+    if _scan_cache is not None and _scan_cache[0] == signature:
+        return _scan_cache[1]
+
+    # name → info (삽입 순서 유지, 먼저 발견된 skill 우선)
+    found: dict[str, dict[str, Any]] = {}
 
     for tools_dir in _get_tools_dirs():
         for category_dir in sorted(tools_dir.iterdir()):
-            if not category_dir.is_dir():
-                continue
-            if category_dir.name.startswith(".") or category_dir.name == "__pycache__":
+            cname = category_dir.name
+            if cname[:1] == "." or cname in _SKIP_DIRS or not category_dir.is_dir():
                 continue
 
             # skills/, generated/ 등 카테고리 디렉토리 내부 검색
-            if category_dir.name in ("skills", "generated"):
+            if cname in _CATEGORY_DIRS:
                 for skill_dir in sorted(category_dir.iterdir()):
+                    # 이미 발견된 이름은 tool.yaml 파싱 전에 건너뜀
+                    if skill_dir.name in found:
+                        continue
                     if skill_dir.is_dir() and (skill_dir / "tool.py").exists():
-                        info = _read_skill_info(skill_dir, category_dir.name)
-                        if info and info["name"] not in seen_names:
-                            skills.append(info)
-                            seen_names.add(info["name"])
-            elif (category_dir / "tool.py").exists():
+                        info = _read_skill_info(skill_dir, cname)
+                        if info:
+                            found[info["name"]] = info
+            elif cname not in found and (category_dir / "tool.py").exists():
                 # 루트 레벨 skill (tools/weather/ 등)
                 info = _read_skill_info(category_dir, "custom")
-                if info and info["name"] not in seen_names:
-                    skills.append(info)
-                    seen_names.add(info["name"])
+                if info:
+                    found[info["name"]] = info
 
+    skills = list(found.values())
+    _scan_cache = (signature, skills, found)
     return skills
 
 
+def _scan_skills_indexed() -> dict[str, dict[str, Any]]:  # [JS-W007.12]
+    """`_scan_skills()` 결과를 이름으로 색인한 dict를 반환합니다 (캐시 공유, 수정 금지)."""
+    skills = _scan_skills()
+    if _scan_cache is not None and _scan_cache[1] is skills:
+        return _scan_cache[2]
+    return {s["name"]: s for s in skills}
+
+
+def _find_skill(name: str) -> dict[str, Any] | None:  # [JS-W007.8]
+    """이름으로 Skill 하나를 찾습니다.
+
+    전체 스캔 대신 `<tools>/generated/<name>`, `<tools>/skills/<name>`, `<tools>/<name>`
+    후보만 확인하며, `_scan_skills()`와 같은 우선순위(디렉토리 순 → 카테고리 이름 순)를 따릅니다.
+    """
+    if not name or name.startswith(".") or Path(name).name != name:
+        return None
+
+    for tools_dir in _get_tools_dirs():
+        # (정렬 키, 후보 디렉토리, 카테고리)
+        candidates = [
+            ("generated", tools_dir / "generated" / name, "generated"),
+            ("skills", tools_dir / "skills" / name, "skills"),
+        ]
+        if name not in _CATEGORY_DIRS and name not in _SKIP_DIRS:
+            candidates.append((name, tools_dir / name, "custom"))
+
+        for _, skill_dir, category in sorted(candidates, key=lambda c: c[0]):
+            if skill_dir.is_dir() and (skill_dir / "tool.py").exists():
+                return _read_skill_info(skill_dir, category)
+    return None
+
+
 def _read_skill_info(skill_dir: Path, category: str) -> dict[str, Any] | None:  # [JS-W007.3]
     """Skill 디렉토리에서 메타데이터를 읽습니다."""
     tool_py = skill_dir / "tool.py"
@@ -90,7 +187,7 @@ def _read_skill_info(skill_dir: Path, category: str) -> dict[str, Any] | None:
     yaml_path = skill_dir / "tool.yaml"
     if yaml_path.exists():
         try:
-            data = yaml.safe_load(yaml_path.read_text())
+            data = yaml.load(yaml_path.read_text(), Loader=_YamlLoader)  # nosec B506
             if data:
                 info["description"] = data.get("description", "")
                 info["version"] = data.get("version", "1.0.0")
@@ -106,7 +203,7 @@ def _read_skill_info(skill_dir: Path, category: str) -> dict[str, Any] | None:
 @router.get("/")  # [JS-W007.4]
 async def list_skills() -> dict[str, Any]:
     """설치된 Skill 목록을 반환합니다."""
-    skills = _scan_skills()
+    skills = await asyncio.to_thread(_scan_skills)
     return {
         "skills": skills,
         "total": len(skills),
@@ -117,8 +214,11 @@ async def list_skills() -> dict[str, Any]:
 @router.delete("/{name}")  # [JS-W007.5]
 async def delete_skill(name: str) -> dict[str, str]:
     """Skill을 삭제합니다. 자동 생성된 Skill만 삭제 가능합니다."""
-    skills = _scan_skills()
-    skill = next((s for s in skills if s["name"] == name), None)
+    # I/O 전에 이름 형식부터 검증
+    if not _SKILL_NAME_RE.match(name):
+        raise HTTPException(status_code=400, detail="잘못된 Skill 이름 형식입니다.")
+
+    skill = await asyncio.to_thread(_find_skill, name)
 
     if not skill:
         raise HTTPException(status_code=404, detail=f"Skill '{name}'을(를) 찾을 수 없습니다.")
@@ -126,28 +226,24 @@ async def delete_skill(name: str) -> dict[str, str]:
     if not skill.get("auto_generated"):
         raise HTTPException(status_code=403, detail="수동으로 설치한 Skill은 삭제할 수 없습니다.")
 
+    # 심볼릭 링크까지 한 번에 정규화 (없으면 404)
+    try:
+        skill_path = Path(skill["path"]).resolve(strict=True)
+    except FileNotFoundError:
+        raise HTTPException(
+            status_code=404, detail=f"Skill 디렉토리를 찾을 수 없습니다: {skill['path']}"
+        ) from None
+
     # 경로 traversal 방지: generated 디렉토리 안에 있는지 검증
-    skill_path = Path(skill["path"]).resolve()
-    allowed_dirs = [
-        (_BUILTIN_TOOLS_DIR / "generated").resolve(),
-        (_TOOLS_DIR / "generated").resolve(),
-    ]
-    if not any(str(skill_path).startswith(str(d)) for d in allowed_dirs):
+    if not any(skill_path.is_relative_to(d) for d in _generated_dirs(_TOOLS_DIR)):
         logger.warning("skill_delete_path_traversal_blocked", name=name, path=str(skill_path))
         raise HTTPException(status_code=403, detail="허용되지 않은 경로입니다.")
 
-    if not re.match(r"^[a-zA-Z0-9_\-]+$", name):
-        raise HTTPException(status_code=400, detail="잘못된 Skill 이름 형식입니다.")
-
-    if not skill_path.exists():
-        raise HTTPException(
-            status_code=404, detail=f"Skill 디렉토리를 찾을 수 없습니다: {skill_path}"
-        )
-
     # 삭제 전 메타정보 보존 (메모리 기록용)
     description = skill.get("description", "")
 
-    shutil.rmtree(skill_path)
+    await asyncio.to_thread(shutil.rmtree, skill_path)
+    _invalidate_skill_cache()
     logger.info("skill_deleted", name=name, path=str(skill_path))
 
     # 메모리에 삭제 이력 기록 (재생성 방지)
@@ -159,8 +255,7 @@ async def delete_skill(name: str) -> dict[str, str]:
 @router.put("/{name}/toggle")  # [JS-W007.6]
 async def toggle_skill(name: str) -> dict[str, Any]:
     """Skill 활성화/비활성화를 토글합니다."""
-    skills = _scan_skills()
-    skill = next((s for s in skills if s["name"] == name), None)
+    skill = await asyncio.to_thread(_find_skill, name)
 
     if not skill:
         raise HTTPException(status_code=404, detail=f"Skill '{name}'을(를) 찾을 수 없습니다.")
@@ -174,6 +269,7 @@ async def toggle_skill(name: str) -> dict[str, Any]:
     else:
         disabled_marker.touch()
         enabled = False
+    _invalidate_skill_cache()
 
     logger.info("skill_toggled", name=name, enabled=enabled)
     return {"name": name, "enabled": enabled}
@@ -184,14 +280,23 @@ async def _record_skill_deletion(name: str, description: str) -> None:  # [JS-W0
 
     SkillGenerator.retain_skill_deletion()을 호출하여 동일 스킬 재생성을 방지합니다.
     메모리 연결 실패 시에도 삭제 자체는 완료됩니다.
+    앱 상태에 초기화된 메모리가 있으면 재사용하고 (닫지 않음),
+    없을 때만 임시 ZvecMemory를 만들어 사용 후 닫습니다.
     """
     try:
         from jedisos.forge.generator import SkillGenerator
-        from jedisos.memory.zvec_memory import ZvecMemory
 
-        memory = ZvecMemory()
-        generator = SkillGenerator(memory=memory)
-        await generator.retain_skill_deletion(tool_name=name, description=description)
-        await memory.close()
+        memory = get_app_state().get("memory")
+        owned = memory is None
+        if owned:
+            from jedisos.memory.zvec_memory import ZvecMemory
+
+            memory = ZvecMemory()
+        try:
+            generator = SkillGenerator(memory=memory)
+            await generator.retain_skill_deletion(tool_name=name, description=description)
+        finally:
+            if owned:
+                await memory.close()
     except Exception as e:
         logger.warning("skill_deletion_record_failed", name=name, error=str(e))
@@ -2,9 +2,9 @@
 [JS-W007] jedisos.web.api.vault
 SecVault REST API - 마스터 비밀번호 설정/해제/상태 조회
 
-version: 1.0.0
+version: 1.1.0
 created: 2026-02-19
-modified: 2026-02-19
+modified: 2026-10-17
 dependencies: fastapi>=0.115
 """
 
@@ -12,24 +12,27 @@ from __future__ import annotations
 
 import structlog
 from fastapi import APIRouter
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+from jedisos.web.app import get_app_state
+from jedisos.web.responses import OrjsonResponse
 
 logger = structlog.get_logger()
 
-router = APIRouter()
+router = APIRouter(default_response_class=OrjsonResponse)
 
 
 class VaultPasswordRequest(BaseModel):  # [JS-W007.1]
     """비밀번호 요청 모델."""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     password: str
 
 
 @router.get("/status")  # [JS-W007.2]
 async def vault_status() -> dict:
     """SecVault 상태를 반환합니다."""
-    from jedisos.web.app import get_app_state
-
     state = get_app_state()
     vault_client = state.get("vault_client")
     if vault_client is None:
@@ -46,8 +49,6 @@ async def vault_status() -> dict:
 @router.post("/setup")  # [JS-W007.3]
 async def vault_setup(request: VaultPasswordRequest) -> dict:
     """SecVault 마스터 비밀번호를 최초 설정합니다."""
-    from jedisos.web.app import get_app_state
-
     state = get_app_state()
     vault_client = state.get("vault_client")
     if vault_client is None:
@@ -72,8 +73,6 @@ async def vault_setup(request: VaultPasswordRequest) -> dict:
 @router.post("/unlock")  # [JS-W007.4]
 async def vault_unlock(request: VaultPasswordRequest) -> dict:
     """SecVault 잠금을 해제합니다."""
-    from jedisos.web.app import get_app_state
-
     state = get_app_state()
     vault_client = state.get("vault_client")
     if vault_client is None:
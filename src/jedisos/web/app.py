@@ -2,119 +2,224 @@
 [JS-W001] jedisos.web.app
 FastAPI 메인 애플리케이션 + 라우터 등록
 
-version: 1.0.0
+version: 1.1.0
 created: 2026-02-18
-modified: 2026-02-18
-dependencies: fastapi>=0.115, uvicorn>=0.34
+modified: 2026-10-17
+dependencies: fastapi>=0.115, uvicorn[standard]>=0.34, orjson>=3.10
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import functools
+import hashlib
+import importlib
 import os
+import re
+import shutil
+import sys
+import time
+import weakref
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Annotated, Any
 
-import structlog
-from fastapi import FastAPI, Request
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse
+import orjson
+from fastapi import Depends, FastAPI, Request
+from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
+from starlette.routing import Route
 
 from jedisos import __version__
+from jedisos.web.middleware import FastCORSMiddleware, RequestIDMiddleware
+from jedisos.web.responses import OrjsonResponse
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine, Mapping
 
-logger = structlog.get_logger()
+    from jedisos.core.config import JedisosConfig
+    from jedisos.llm.router import LLMRouter
+    from jedisos.memory.zvec_memory import ZvecMemory
+    from jedisos.security.audit import AuditLogger
+    from jedisos.security.pdp import PolicyDecisionPoint
+
+
+class _LazyLogger:  # [JS-W001.24]
+    """첫 로그 호출 때 structlog를 import하고 모듈 전역 logger를 실제 로거로 교체합니다.
+
+    structlog import(structlog.dev → rich)는 수백 ms가 걸려, CLI --help나 모듈
+    introspection처럼 로그를 남기지 않는 import 경로에서는 비용만 듭니다.
+    모듈 __getattr__는 모듈 내부 함수의 전역 조회에 쓰이지 않으므로 프록시를 둡니다.
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        import structlog
+
+        global logger
+        logger = structlog.get_logger()
+        return getattr(logger, name)
+
+
+logger: Any = _LazyLogger()
 
 # 웹 디렉토리 경로
 _WEB_DIR = Path(__file__).parent
 
-# Jinja2 템플릿 엔진
-_templates = Jinja2Templates(directory=str(_WEB_DIR / "templates"))
+# Jinja2 템플릿 엔진 (첫 "/" 요청 시 생성, jinja2 import 지연)
+_templates: Any = None
 
-# 앱 상태 (lifespan에서 초기화)
+# 앱 상태 (lifespan에서 초기화) - 런타임에 바뀌는 값과 요청 밖 코드(채널, 도구)용
 _app_state: dict[str, Any] = {}
 
-# 백그라운드 태스크 참조 (GC 방지)
+
+@dataclass(slots=True, frozen=True)
+class AppResources:  # [JS-W001.20]
+    """lifespan에서 한 번 만들어 app.state.resources에 두는 핵심 서비스 묶음.
+
+    라우터는 `Resources` 의존성으로 받아 속성 접근만 합니다. vault 상태, 채널,
+    에이전트 캐시처럼 실행 중에 바뀌는 값은 계속 `_app_state`에 둡니다.
+    """
+
+    config: JedisosConfig | None = None
+    memory: ZvecMemory | None = None
+    llm: LLMRouter | None = None
+    pdp: PolicyDecisionPoint | None = None
+    audit: AuditLogger | None = None
+
+
+# lifespan 전(테스트 등)에 사용하는 빈 리소스
+_NO_RESOURCES = AppResources()
+
+
+def get_resources(request: Request) -> AppResources:  # [JS-W001.21]
+    """요청한 앱의 핵심 서비스 묶음을 반환합니다 (FastAPI 의존성)."""
+    return getattr(request.app.state, "resources", _NO_RESOURCES)
+
+
+Resources = Annotated[AppResources, Depends(get_resources)]
+
+# 백그라운드 태스크 참조 (GC 방지). 이벤트 루프는 태스크를 약한 참조로만 들고 있으므로
+# WeakSet으로 바꾸면 실행 중인 태스크가 수거될 수 있음 - 강한 참조 집합을 유지
 _background_tasks: set[asyncio.Task[None]] = set()
 
 
+def _spawn(coro: Coroutine[Any, Any, None]) -> asyncio.Task[None]:  # [JS-W001.38]
+    """백그라운드 태스크를 시작하고 끝날 때까지 참조를 유지합니다."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+def _data_dir(default: str = ".") -> Path:  # [JS-W001.36]
+    """JEDISOS_DATA_DIR 경로를 반환합니다 (환경변수 값별로 같은 Path 객체 재사용)."""
+    return _data_path(os.environ.get("JEDISOS_DATA_DIR", default))
+
+
+@functools.lru_cache(maxsize=4)
+def _data_path(raw: str) -> Path:  # [JS-W001.37]
+    return Path(raw)
+
+
+# .env의 KEY=VALUE 줄 (주석/빈 줄 제외, 키/값 앞뒤 공백 제외) - web.api.settings와 같은 문법
+_ENV_LINE_RE = re.compile(r"^[ \t]*([^#=\s][^=\n]*?)[ \t]*=[ \t]*(.*?)[ \t\r]*$", re.M)
+
+
 def _load_env_from_data_dir() -> None:  # [JS-W001.7]
-    """JEDISOS_DATA_DIR/.env에서 환경변수를 로드합니다 (이미 설정된 것은 덮어쓰지 않음)."""
-    data_dir = Path(os.environ.get("JEDISOS_DATA_DIR", "."))
-    env_path = data_dir / ".env"
-    if not env_path.exists():
+    """JEDISOS_DATA_DIR/.env에서 환경변수를 로드합니다 (이미 설정된 것은 덮어쓰지 않음).
+
+    줄 나누기/strip/partition을 줄마다 하지 않고 컴파일된 정규식 한 번으로 파일 전체를 훑습니다.
+    """
+    try:
+        text = (_data_dir() / ".env").read_text(encoding="utf-8")
+    except FileNotFoundError:
         return
-    for line in env_path.read_text().splitlines():
-        line = line.strip()
-        if not line or line.startswith("#") or "=" not in line:
-            continue
-        key, value = line.split("=", 1)
-        key, value = key.strip(), value.strip()
-        if value and key not in os.environ:
-            os.environ[key] = value
+    for key, value in _ENV_LINE_RE.findall(text):
+        # setdefault는 새로 설정했을 때만 같은 객체를 돌려줌
+        if value and os.environ.setdefault(key, value) is value:
             logger.debug("env_loaded_from_data", key=key)
 
 
 async def _start_channels() -> None:  # [JS-W001.8]
-    """설정된 채널 봇을 백그라운드로 시작합니다."""
-    from jedisos.agents.react import ReActAgent
-    from jedisos.llm.prompts import get_identity_prompt
+    """설정된 채널 봇을 백그라운드로 시작합니다.
+
+    에이전트(langgraph 포함)와 채널 모듈은 토큰이 설정된 채널이 있을 때만 import합니다.
+    """
+    # Discord (채널 모듈 구현 후 활성화)
+    if os.environ.get("DISCORD_BOT_TOKEN", ""):
+        logger.info("discord_token_found_but_channel_not_implemented")
+
+    # Slack (채널 모듈 구현 후 활성화)
+    if os.environ.get("SLACK_BOT_TOKEN", ""):
+        logger.info("slack_token_found_but_channel_not_implemented")
+
+    # Telegram
+    telegram_token = os.environ.get("TELEGRAM_BOT_TOKEN", "")
+    if not telegram_token or "telegram_app" in _app_state:
+        return
 
     memory = _app_state.get("memory")
     llm = _app_state.get("llm")
-    pdp = _app_state.get("pdp")
-    audit = _app_state.get("audit")
-    builtin_tools = _app_state.get("builtin_tools", [])
-    tool_executor = _app_state.get("tool_executor")
-
     if not memory or not llm:
         return
 
+    from jedisos.agents.react import ReActAgent
+    from jedisos.llm.prompts import get_identity_prompt
+
     agent = ReActAgent(
         memory=memory,
         llm=llm,
-        tools=builtin_tools,
-        tool_executor=tool_executor,
+        tools=_app_state.get("builtin_tools", []),
+        tool_executor=_app_state.get("tool_executor"),
         identity_prompt=get_identity_prompt(),
         dspy_bridge=_app_state.get("dspy_bridge"),
     )
 
-    # Telegram
-    telegram_token = os.environ.get("TELEGRAM_BOT_TOKEN", "")
-    if telegram_token and "telegram_app" not in _app_state:
-        try:
-            from jedisos.channels.telegram import TelegramChannel
-
-            tg = TelegramChannel(token=telegram_token, agent=agent, pdp=pdp, audit=audit)
-            tg_app = tg.build_app()
-            await tg_app.initialize()
-            await tg_app.start()
-            if tg_app.updater:
-                await tg_app.updater.start_polling(drop_pending_updates=True)
-            _app_state["telegram_app"] = tg_app
-            logger.info("telegram_bot_started")
-        except Exception as e:
-            logger.error("telegram_bot_start_failed", error=str(e))
+    try:
+        from jedisos.channels.telegram import TelegramChannel
+
+        tg = TelegramChannel(
+            token=telegram_token,
+            agent=agent,
+            pdp=_app_state.get("pdp"),
+            audit=_app_state.get("audit"),
+        )
+        tg_app = tg.build_app()
+    except Exception as e:
+        logger.error("telegram_bot_start_failed", error=str(e))
+    else:
+        # 봇 핸드셰이크(get_me 등 네트워크 왕복)는 기다리지 않고 백그라운드로 진행
+        _app_state["telegram_app"] = tg_app
+        _app_state["telegram_task"] = _spawn(_bootstrap_telegram(tg_app))
 
-    # Discord (채널 모듈 구현 후 활성화)
-    discord_token = os.environ.get("DISCORD_BOT_TOKEN", "")
-    if discord_token:
-        logger.info("discord_token_found_but_channel_not_implemented")
 
-    # Slack (채널 모듈 구현 후 활성화)
-    slack_bot_token = os.environ.get("SLACK_BOT_TOKEN", "")
-    if slack_bot_token:
-        logger.info("slack_token_found_but_channel_not_implemented")
+async def _bootstrap_telegram(tg_app: Any) -> None:  # [JS-W001.33]
+    """텔레그램 봇을 초기화하고 polling을 시작합니다 (백그라운드 태스크).
+
+    세 단계는 앞 단계 결과에 의존하므로 순서대로 실행합니다. 실패하면
+    telegram_app을 상태에서 제거해 다음 `_start_channels()`에서 다시 시도할 수 있게 합니다.
+    """
+    try:
+        await tg_app.initialize()
+        await tg_app.start()
+        if tg_app.updater:
+            await tg_app.updater.start_polling(drop_pending_updates=True)
+    except Exception as e:
+        if _app_state.get("telegram_app") is tg_app:
+            del _app_state["telegram_app"]
+        logger.error("telegram_bot_start_failed", error=str(e))
+        return
+    logger.info("telegram_bot_started")
 
 
 class ToolDef:  # [JS-W001.11]
     """OpenAI function calling 형식 도구 래퍼."""
 
+    __slots__ = ("_def",)
+
     def __init__(self, definition: dict) -> None:
         self._def = definition
 
@@ -122,15 +227,58 @@ class ToolDef:  # [JS-W001.11]
         return self._def
 
 
+# OpenAI에서 허용하는 JSON Schema 타입
+_JSON_SCHEMA_TYPES = frozenset({"string", "integer", "number", "boolean", "array", "object"})
+
+# Python 타입 이름(소문자) → JSON Schema 타입 (읽기 전용)
+_PY_TO_JSON: Mapping[str, str] = MappingProxyType(
+    {
+        "str": "string",
+        "string": "string",
+        "int": "integer",
+        "integer": "integer",
+        "float": "number",
+        "number": "number",
+        "bool": "boolean",
+        "boolean": "boolean",
+        "list": "array",
+        "array": "array",
+        "tuple": "array",
+        "set": "array",
+        "sequence": "array",
+        "dict": "object",
+        "object": "object",
+        "mapping": "object",
+    }
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _py_type_to_json(ptype: str) -> str:  # [JS-W001.30]
+    """Python 타입 표현을 기본 JSON Schema 타입으로 매핑합니다.
+
+    예: "str | None" → string, "Optional[int]" → integer, "list[str]" → array,
+    "<class 'tuple'>" → array. 알 수 없는 타입은 string입니다.
+    스킬 파라미터의 타입 표현은 몇 가지로 반복되므로 결과를 문자열별로 캐시합니다.
+    """
+    t = ptype.replace(" ", "").lower()
+    if t.startswith("<class'"):
+        t = t[7:-2]
+    if t.startswith(("optional[", "typing.optional[")):
+        t = t[t.index("[") + 1 : -1]
+    for part in t.split("|"):
+        base = part.split("[", 1)[0].rpartition(".")[2]
+        if base not in ("none", "nonetype"):
+            return _PY_TO_JSON.get(base, "string")
+    return "string"
+
+
 def _skill_func_to_openai_def(func: Any) -> dict[str, Any]:  # [JS-W001.12]
     """@tool 데코레이터 함수를 OpenAI function calling 형식으로 변환합니다."""
     name = getattr(func, "_tool_name", func.__name__)
     description = getattr(func, "_tool_description", func.__doc__ or "")
     params = getattr(func, "_tool_parameters", {})
 
-    # OpenAI에서 허용하는 JSON Schema 타입
-    valid_types = {"string", "integer", "number", "boolean", "array", "object"}
-
     properties: dict[str, Any] = {}
     required: list[str] = []
 
@@ -140,21 +288,8 @@ def _skill_func_to_openai_def(func: Any) -> dict[str, Any]:  # [JS-W001.12]
         # Python 타입 표현을 JSON Schema로 변환
         if not isinstance(ptype, str):
             ptype = "string"
-        elif ptype not in valid_types:
-            # "str | None", "Optional[str]", "list[str]", etc → 기본 타입으로 매핑
-            ptype_lower = ptype.lower().replace(" ", "")
-            if "int" in ptype_lower:
-                ptype = "integer"
-            elif "float" in ptype_lower or "number" in ptype_lower:
-                ptype = "number"
-            elif "bool" in ptype_lower:
-                ptype = "boolean"
-            elif "list" in ptype_lower or "array" in ptype_lower:
-                ptype = "array"
-            elif "dict" in ptype_lower or "object" in ptype_lower:
-                ptype = "object"
-            else:
-                ptype = "string"
+        elif ptype not in _JSON_SCHEMA_TYPES:
+            ptype = _py_type_to_json(ptype)
 
         properties[pname] = {"type": ptype, "description": pname}
         if pinfo.get("required"):
@@ -174,694 +309,853 @@ def _skill_func_to_openai_def(func: Any) -> dict[str, Any]:  # [JS-W001.12]
     }
 
 
-async def _register_builtin_tools(  # [JS-W001.10]
-    memory: Any,
-    llm: Any,
-    mcp_manager: Any | None = None,
-) -> tuple[list[Any], Any]:
-    """내장 도구 + 생성된 Skill + MCP 도구를 등록합니다.
-
-    Returns:
-        (tool_definitions, tool_executor) 튜플
-    """
-    from pathlib import Path as _Path
-
-    from jedisos.forge.generator import SkillGenerator
-    from jedisos.forge.loader import ToolLoader
-
-    data_dir = _Path(os.environ.get("JEDISOS_DATA_DIR", "."))
-    generated_dir = data_dir / "tools" / "generated"
-    generator = SkillGenerator(output_dir=generated_dir, memory=memory, llm_router=llm)
-
-    # 동적 스킬 레지스트리: name → callable
-    skill_registry: dict[str, Any] = {}
-
-    # 기존 생성된 스킬 로드
-    loader = ToolLoader(tools_dir=data_dir / "tools")
-    _load_generated_skills(loader, generated_dir, skill_registry)
-
-    # 내장 도구 정의 (OpenAI function calling)
-    builtin_defs = [
-        {
-            "type": "function",
-            "function": {
-                "name": "recall_memory",
-                "description": "사용자에 대한 장기 기억을 검색합니다. 사용자의 이름, 선호도, 이전 대화에서 언급한 내용 등을 기억해낼 때 사용합니다.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": "검색할 내용 (예: '사용자 이름', '좋아하는 음식')",
-                        },
+# 내장 도구 정의 (OpenAI function calling) - 등록마다 다시 만들지 않도록 모듈 상수로 둠.
+# litellm이 요청 시 JSON 직렬화/deepcopy하므로 MappingProxyType이 아닌 일반 dict이며,
+# 모든 등록이 같은 객체를 공유하므로 수정하지 말 것
+_BUILTIN_DEFS: tuple[dict[str, Any], ...] = (
+    {
+        "type": "function",
+        "function": {
+            "name": "recall_memory",
+            "description": "사용자에 대한 장기 기억을 검색합니다. 사용자의 이름, 선호도, 이전 대화에서 언급한 내용 등을 기억해낼 때 사용합니다.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "query": {
+                        "type": "string",
+                        "description": "검색할 내용 (예: '사용자 이름', '좋아하는 음식')",
                     },
-                    "required": ["query"],
                 },
+                "required": ["query"],
             },
         },
-        {
-            "type": "function",
-            "function": {
-                "name": "retain_memory",
-                "description": "중요한 정보를 장기 기억에 저장합니다. 사용자의 이름, 선호도, 중요한 사실 등을 기억해둘 때 사용합니다.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "content": {"type": "string", "description": "저장할 내용"},
-                    },
-                    "required": ["content"],
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "retain_memory",
+            "description": "중요한 정보를 장기 기억에 저장합니다. 사용자의 이름, 선호도, 중요한 사실 등을 기억해둘 때 사용합니다.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "content": {"type": "string", "description": "저장할 내용"},
                 },
+                "required": ["content"],
             },
         },
-        {
-            "type": "function",
-            "function": {
-                "name": "create_skill",
-                "description": "새로운 도구/스킬을 자동 생성합니다. 사용자가 새 기능을 요청할 때 한 번만 호출하세요. 이미 생성 중이면 중복 호출하지 마세요. 생성은 백그라운드에서 진행되며 완료 시 알림이 갑니다.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "description": {
-                            "type": "string",
-                            "description": "만들 도구에 대한 설명 (예: '현재 날씨를 조회하는 도구')",
-                        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "create_skill",
+            "description": "새로운 도구/스킬을 자동 생성합니다. 사용자가 새 기능을 요청할 때 한 번만 호출하세요. 이미 생성 중이면 중복 호출하지 마세요. 생성은 백그라운드에서 진행되며 완료 시 알림이 갑니다.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "description": {
+                        "type": "string",
+                        "description": "만들 도구에 대한 설명 (예: '현재 날씨를 조회하는 도구')",
                     },
-                    "required": ["description"],
                 },
+                "required": ["description"],
             },
         },
-        {
-            "type": "function",
-            "function": {
-                "name": "list_skills",
-                "description": "현재 설치된 스킬(도구) 목록을 조회합니다. 스킬 이름, 설명, 활성 상태를 확인할 수 있습니다.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {},
-                },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "list_skills",
+            "description": "현재 설치된 스킬(도구) 목록을 조회합니다. 스킬 이름, 설명, 활성 상태를 확인할 수 있습니다.",
+            "parameters": {
+                "type": "object",
+                "properties": {},
             },
         },
-        {
-            "type": "function",
-            "function": {
-                "name": "delete_skill",
-                "description": "설치된 스킬을 삭제합니다. 자동 생성된 스킬만 삭제 가능합니다. 삭제 전 반드시 사용자에게 확인을 받으세요.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "name": {"type": "string", "description": "삭제할 스킬 이름"},
-                    },
-                    "required": ["name"],
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "delete_skill",
+            "description": "설치된 스킬을 삭제합니다. 자동 생성된 스킬만 삭제 가능합니다. 삭제 전 반드시 사용자에게 확인을 받으세요.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string", "description": "삭제할 스킬 이름"},
                 },
+                "required": ["name"],
             },
         },
-        {
-            "type": "function",
-            "function": {
-                "name": "upgrade_skill",
-                "description": "기존 스킬을 개선하거나 버그를 수정합니다. 기존 코드를 기반으로 새 버전을 생성합니다.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "name": {"type": "string", "description": "개선할 스킬 이름"},
-                        "instructions": {
-                            "type": "string",
-                            "description": "개선/수정 지시사항 (예: '에러 처리 추가', '응답 형식 변경')",
-                        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "upgrade_skill",
+            "description": "기존 스킬을 개선하거나 버그를 수정합니다. 기존 코드를 기반으로 새 버전을 생성합니다.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string", "description": "개선할 스킬 이름"},
+                    "instructions": {
+                        "type": "string",
+                        "description": "개선/수정 지시사항 (예: '에러 처리 추가', '응답 형식 변경')",
                     },
-                    "required": ["name", "instructions"],
                 },
+                "required": ["name", "instructions"],
             },
         },
-        {
-            "type": "function",
-            "function": {
-                "name": "search_mcp_servers",
-                "description": (
-                    "MCP 서버를 검색합니다. "
-                    "기본 source='registry'는 큐레이티드 인기 서버 + npm + PyPI를 검색합니다. "
-                    "결과가 부족하면 source='mcp_so'로 mcp.so(17,600+ 서버)를 폴백 검색하세요. "
-                    "검색 결과에서 사용자가 선택하면 add_mcp_server로 등록+실행합니다."
-                ),
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": "검색어 (예: 'weather', 'github', 'database')",
-                        },
-                        "source": {
-                            "type": "string",
-                            "description": "검색 소스: 'registry'(기본, 큐레이티드+npm+pypi) 또는 'mcp_so'(mcp.so 폴백)",
-                        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "search_mcp_servers",
+            "description": (
+                "MCP 서버를 검색합니다. "
+                "기본 source='registry'는 큐레이티드 인기 서버 + npm + PyPI를 검색합니다. "
+                "결과가 부족하면 source='mcp_so'로 mcp.so(17,600+ 서버)를 폴백 검색하세요. "
+                "검색 결과에서 사용자가 선택하면 add_mcp_server로 등록+실행합니다."
+            ),
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "query": {
+                        "type": "string",
+                        "description": "검색어 (예: 'weather', 'github', 'database')",
+                    },
+                    "source": {
+                        "type": "string",
+                        "description": "검색 소스: 'registry'(기본, 큐레이티드+npm+pypi) 또는 'mcp_so'(mcp.so 폴백)",
                     },
-                    "required": ["query"],
                 },
+                "required": ["query"],
             },
         },
-        {
-            "type": "function",
-            "function": {
-                "name": "add_mcp_server",
-                "description": (
-                    "새 MCP 서버를 등록하고 연결합니다. "
-                    "두 가지 방식을 지원합니다: "
-                    "1) remote: 이미 실행 중인 서버의 URL을 등록 (url 필수). "
-                    "2) subprocess: 명령어로 서버를 직접 실행 "
-                    "(server_type='subprocess', command/args 필수, "
-                    "예: command='npx', args=['-y', '@modelcontextprotocol/server-fetch'])."
-                ),
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "name": {"type": "string", "description": "서버 이름 (영문, 밑줄 허용)"},
-                        "server_type": {
-                            "type": "string",
-                            "description": "서버 타입: 'remote'(URL 접속) 또는 'subprocess'(프로세스 실행)",
-                        },
-                        "url": {
-                            "type": "string",
-                            "description": "서버 URL (remote 타입용, 예: http://localhost:8001/mcp)",
-                        },
-                        "command": {
-                            "type": "string",
-                            "description": "실행 명령어 (subprocess 타입용, 예: 'npx', 'uvx', 'python')",
-                        },
-                        "args": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "명령어 인자 (subprocess 타입용, 예: ['-y', '@mcp/server-fetch'])",
-                        },
-                        "env": {
-                            "type": "object",
-                            "description": "환경변수 (subprocess 타입용, 예: {'API_KEY': 'xxx'})",
-                        },
-                        "description": {"type": "string", "description": "서버 설명"},
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "add_mcp_server",
+            "description": (
+                "새 MCP 서버를 등록하고 연결합니다. "
+                "두 가지 방식을 지원합니다: "
+                "1) remote: 이미 실행 중인 서버의 URL을 등록 (url 필수). "
+                "2) subprocess: 명령어로 서버를 직접 실행 "
+                "(server_type='subprocess', command/args 필수, "
+                "예: command='npx', args=['-y', '@modelcontextprotocol/server-fetch'])."
+            ),
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string", "description": "서버 이름 (영문, 밑줄 허용)"},
+                    "server_type": {
+                        "type": "string",
+                        "description": "서버 타입: 'remote'(URL 접속) 또는 'subprocess'(프로세스 실행)",
+                    },
+                    "url": {
+                        "type": "string",
+                        "description": "서버 URL (remote 타입용, 예: http://localhost:8001/mcp)",
+                    },
+                    "command": {
+                        "type": "string",
+                        "description": "실행 명령어 (subprocess 타입용, 예: 'npx', 'uvx', 'python')",
                     },
-                    "required": ["name"],
+                    "args": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "명령어 인자 (subprocess 타입용, 예: ['-y', '@mcp/server-fetch'])",
+                    },
+                    "env": {
+                        "type": "object",
+                        "description": "환경변수 (subprocess 타입용, 예: {'API_KEY': 'xxx'})",
+                    },
+                    "description": {"type": "string", "description": "서버 설명"},
                 },
+                "required": ["name"],
             },
         },
-    ]
+    },
+)
+_BUILTIN_TOOLS: tuple[ToolDef, ...] = tuple(ToolDef(d) for d in _BUILTIN_DEFS)
+
+
+# parameters가 없는 MCP 도구용 공유 스키마 (읽기 전용 - 수정하지 말 것)
+_EMPTY_PARAMS: dict[str, Any] = {"type": "object", "properties": {}}
+
+
+def _mcp_tool_defs(  # [JS-W001.32]
+    server_name: str,
+    tools: list[dict[str, Any]],
+    mcp_tool_map: dict[str, tuple[str, str]],
+) -> list[dict[str, Any]]:
+    """MCP 서버의 도구 목록을 OpenAI function 정의로 변환하고 mcp_tool_map에 등록합니다."""
+    name_prefix = "mcp_" + server_name + "_"
+    desc_prefix = "[MCP:" + server_name + "] "
+    defs: list[dict[str, Any]] = []
+    for tool in tools:
+        original = tool["name"]
+        tool_name = name_prefix + original
+        mcp_tool_map[tool_name] = (server_name, original)
+        defs.append(
+            {
+                "type": "function",
+                "function": {
+                    "name": tool_name,
+                    "description": desc_prefix + tool["description"],
+                    "parameters": tool.get("parameters") or _EMPTY_PARAMS,
+                },
+            }
+        )
+    return defs
+
+
+# 스킬 함수 → ToolDef 캐시. 약한 참조 키라서 삭제/업그레이드로 레지스트리에서 빠진
+# 함수(와 그 모듈)를 캐시가 붙잡아 두지 않음
+_skill_defs: weakref.WeakKeyDictionary[Any, ToolDef] = weakref.WeakKeyDictionary()
 
-    # 생성된 스킬의 OpenAI 정의 추가
-    skill_defs = [_skill_func_to_openai_def(func) for func in skill_registry.values()]
+
+def _skill_tool_def(func: Any) -> ToolDef:  # [JS-W001.29]
+    """스킬 함수의 ToolDef를 함수 객체별로 캐시합니다.
+
+    업그레이드/재생성된 스킬은 새 함수 객체이므로 자연히 새로 변환됩니다.
+    """
+    tool = _skill_defs.get(func)
+    if tool is None:
+        tool = _skill_defs[func] = ToolDef(_skill_func_to_openai_def(func))
+    return tool
+
+
+async def _register_builtin_tools(  # [JS-W001.10]
+    memory: Any,
+    llm: Any,
+    mcp_manager: Any | None = None,
+) -> tuple[list[Any], Any]:
+    """내장 도구 + 생성된 Skill + MCP 도구를 등록합니다.
+
+    Returns:
+        (tool_definitions, tool_executor) 튜플
+    """
+    # 도구 실행마다 import 문을 거치지 않도록 핸들러가 쓰는 모듈을 여기서 한 번만 가져옴
+    from jedisos.forge.generator import SkillGenerator
+    from jedisos.forge.loader import ToolLoader
+    from jedisos.mcp.registry import search_all
+    from jedisos.web.api.mcp import _config_lock, _load_mcp_index, _save_mcp_config
+    from jedisos.web.api.skills import (
+        _SKILL_NAME_RE,
+        _generated_dirs,
+        _invalidate_skill_cache,
+        _scan_skills,
+        _scan_skills_indexed,
+    )
+
+    data_dir = _data_dir()
+    generated_dir = data_dir / "tools" / "generated"
+    generator = SkillGenerator(output_dir=generated_dir, memory=memory, llm_router=llm)
+
+    # 동적 스킬 레지스트리: name → callable
+    skill_registry: dict[str, Any] = {}
+
+    # 기존 생성된 스킬 로드
+    loader = ToolLoader(tools_dir=data_dir / "tools")
+    await _load_generated_skills(loader, generated_dir, skill_registry)
+
+    # 내장 → 생성된 스킬 → MCP 순으로 하나의 리스트에 바로 채움 (중간 리스트 없음)
+    wrapped_tools: list[ToolDef] = list(_BUILTIN_TOOLS)
+    wrapped_tools.extend(_skill_tool_def(func) for func in skill_registry.values())
+    skill_count = len(wrapped_tools) - len(_BUILTIN_TOOLS)
 
     # MCP 도구 수집 + OpenAI function def 변환
     mcp_tool_map: dict[str, tuple[str, str]] = {}  # tool_name → (server_name, original_name)
-    mcp_defs: list[dict[str, Any]] = []
 
     if mcp_manager:
-        for server_name in mcp_manager.connected_servers:
-            tools = await mcp_manager.list_tools(server_name)
-            for tool in tools:
-                tool_name = f"mcp_{server_name}_{tool['name']}"
-                mcp_tool_map[tool_name] = (server_name, tool["name"])
-                mcp_defs.append(
-                    {
-                        "type": "function",
-                        "function": {
-                            "name": tool_name,
-                            "description": f"[MCP:{server_name}] {tool['description']}",
-                            "parameters": tool.get(
-                                "parameters", {"type": "object", "properties": {}}
-                            ),
-                        },
-                    }
-                )
+        # 서버별 list_tools RPC를 동시에 요청 (시작 지연 = 가장 느린 서버 하나)
+        servers = list(mcp_manager.connected_servers)
+        tool_lists = await asyncio.gather(
+            *(mcp_manager.list_tools(server_name) for server_name in servers),
+            return_exceptions=True,
+        )
+        for server_name, tools in zip(servers, tool_lists, strict=True):
+            if isinstance(tools, BaseException):
+                logger.warning("mcp_list_tools_failed", server=server_name, error=str(tools))
+                continue
+            wrapped_tools.extend(map(ToolDef, _mcp_tool_defs(server_name, tools, mcp_tool_map)))
+    mcp_count = len(wrapped_tools) - len(_BUILTIN_TOOLS) - skill_count
+
+    # 이름 → wrapped_tools 내 위치. wrapped_tools는 에이전트/채널이 참조를 들고 있으므로
+    # 객체는 유지하고 내용만 갱신하며, 교체는 to_dict() 스캔 없이 제자리 대입으로 처리
+    tool_pos = {t.to_dict()["function"]["name"]: i for i, t in enumerate(wrapped_tools)}
+
+    def _put_tool(tname: str, tool: ToolDef) -> None:
+        """도구를 추가하거나 같은 이름의 정의를 같은 위치에서 교체합니다."""
+        pos = tool_pos.get(tname)
+        if pos is None:
+            tool_pos[tname] = len(wrapped_tools)
+            wrapped_tools.append(tool)
+        else:
+            wrapped_tools[pos] = tool
+
+    def _drop_tool(tname: str) -> None:
+        """이름으로 도구를 제거하고 뒤쪽 도구들의 위치를 당깁니다."""
+        pos = tool_pos.pop(tname, None)
+        if pos is None:
+            return
+        del wrapped_tools[pos]
+        for other, other_pos in tool_pos.items():
+            if other_pos > pos:
+                tool_pos[other] = other_pos - 1
+
+    # 내장 도구 핸들러
+    async def _recall_memory(arguments: dict) -> Any:
+        query = arguments.get("query", "")
+        try:
+            result = await memory.recall(query)
+            return {"memories": str(result)}
+        except Exception as e:
+            return {"error": str(e)}
 
-    all_defs = builtin_defs + skill_defs + mcp_defs
-    wrapped_tools = [ToolDef(td) for td in all_defs]
+    async def _retain_memory(arguments: dict) -> Any:
+        content = arguments.get("content", "")
+        try:
+            await memory.retain(content)
+            return {"status": "saved", "content": content}
+        except Exception as e:
+            return {"error": str(e)}
 
-    # 도구 실행기
-    async def tool_executor(name: str, arguments: dict) -> Any:
-        if name == "recall_memory":
-            query = arguments.get("query", "")
-            try:
-                result = await memory.recall(query)
-                return {"memories": str(result)}
-            except Exception as e:
-                return {"error": str(e)}
+    async def _create_skill(arguments: dict) -> Any:
+        description = arguments.get("description", "")
 
-        elif name == "retain_memory":
-            content = arguments.get("content", "")
+        # 중복 생성 방지: 이미 생성 중인 스킬이 있으면 거절
+        if _app_state.get("_skill_generating"):
+            logger.warning("skill_creation_blocked_duplicate", description=description)
+            return {
+                "status": "already_generating",
+                "message": "이미 스킬을 생성 중입니다. 완료된 후 다시 시도해 주세요.",
+            }
+
+        _app_state["_skill_generating"] = True
+
+        max_outer_retries = 2
+
+        async def _bg_create_skill() -> None:
+            """백그라운드에서 스킬을 생성하고 완료/실패를 모든 채널에 알립니다.
+
+            generator.generate() 내부에 3회 재시도가 있고,
+            그래도 예외가 발생하면 외부에서 1회 더 재시도합니다.
+            """
             try:
-                await memory.retain(content)
-                return {"status": "saved", "content": content}
-            except Exception as e:
-                return {"error": str(e)}
-
-        elif name == "create_skill":
-            description = arguments.get("description", "")
-
-            # 중복 생성 방지: 이미 생성 중인 스킬이 있으면 거절
-            if _app_state.get("_skill_generating"):
-                logger.warning("skill_creation_blocked_duplicate", description=description)
-                return {
-                    "status": "already_generating",
-                    "message": "이미 스킬을 생성 중입니다. 완료된 후 다시 시도해 주세요.",
-                }
-
-            _app_state["_skill_generating"] = True
-
-            max_outer_retries = 2
-
-            async def _bg_create_skill() -> None:
-                """백그라운드에서 스킬을 생성하고 완료/실패를 모든 채널에 알립니다.
-
-                generator.generate() 내부에 3회 재시도가 있고,
-                그래도 예외가 발생하면 외부에서 1회 더 재시도합니다.
-                """
-                try:
-                    last_outer_error = ""
-                    for outer_attempt in range(1, max_outer_retries + 1):
-                        try:
-                            if outer_attempt > 1:
-                                await _broadcast_notification(
-                                    "skill_retry",
-                                    f"스킬 생성 재시도 중... (시도 {outer_attempt}/{max_outer_retries})\n"
-                                    f"이전 오류: {last_outer_error}",
-                                )
-
-                            result = await generator.generate(description)
-                            if result.success:
-                                for tool_func in result.tools:
-                                    tname = getattr(tool_func, "_tool_name", "")
-                                    if tname:
-                                        skill_registry[tname] = tool_func
-                                        new_def = _skill_func_to_openai_def(tool_func)
-                                        wrapped_tools.append(ToolDef(new_def))
-                                        logger.info("skill_hotloaded", name=tname)
-                                _app_state.pop("_cached_agent", None)
-                                logger.info(
-                                    "skill_created_bg",
-                                    tool_name=result.tool_name,
-                                    tools_count=len(result.tools),
-                                )
-                                tool_func = result.tools[0] if result.tools else None
-                                desc = (
-                                    getattr(tool_func, "_tool_description", "") if tool_func else ""
-                                )
-
-                                msg = (
-                                    f"'{result.tool_name}' 스킬이 생성되었습니다!\n"
-                                    f"{desc}\n"
-                                    f"이제 대화에서 자연스럽게 물어보시면 됩니다."
-                                )
-                                await _broadcast_notification("skill_created", msg)
-                                return  # 성공 → 종료
-                            else:
-                                last_outer_error = "내부 재시도 3회 모두 실패"
-                                logger.warning(
-                                    "skill_creation_failed_bg",
-                                    description=description,
-                                    outer_attempt=outer_attempt,
-                                )
-                                if outer_attempt < max_outer_retries:
-                                    continue  # 외부 재시도
-                                msg = (
-                                    f"'{description}' 스킬 생성에 실패했습니다. "
-                                    f"다른 표현으로 다시 시도해 주세요."
-                                )
-                                await _broadcast_notification("skill_failed", msg)
-                        except Exception as e:
-                            last_outer_error = f"{type(e).__name__}: {e}"
-                            logger.error(
-                                "skill_creation_error_bg",
-                                error=str(e),
+                last_outer_error = ""
+                for outer_attempt in range(1, max_outer_retries + 1):
+                    try:
+                        if outer_attempt > 1:
+                            await _broadcast_notification(
+                                "skill_retry",
+                                f"스킬 생성 재시도 중... (시도 {outer_attempt}/{max_outer_retries})\n"
+                                f"이전 오류: {last_outer_error}",
+                            )
+
+                        result = await generator.generate(description)
+                        if result.success:
+                            for tool_func in result.tools:
+                                tname = getattr(tool_func, "_tool_name", "")
+                                if tname:
+                                    skill_registry[tname] = tool_func
+                                    _bind_handler(tname)
+                                    _put_tool(tname, _skill_tool_def(tool_func))
+                                    logger.info("skill_hotloaded", name=tname)
+                            _invalidate_skill_cache()
+                            _app_state.pop("_cached_agent", None)
+                            logger.info(
+                                "skill_created_bg",
+                                tool_name=result.tool_name,
+                                tools_count=len(result.tools),
+                            )
+                            tool_func = result.tools[0] if result.tools else None
+                            desc = getattr(tool_func, "_tool_description", "") if tool_func else ""
+
+                            msg = (
+                                f"'{result.tool_name}' 스킬이 생성되었습니다!\n"
+                                f"{desc}\n"
+                                f"이제 대화에서 자연스럽게 물어보시면 됩니다."
+                            )
+                            await _broadcast_notification("skill_created", msg)
+                            return  # 성공 → 종료
+                        else:
+                            last_outer_error = "내부 재시도 3회 모두 실패"
+                            logger.warning(
+                                "skill_creation_failed_bg",
+                                description=description,
                                 outer_attempt=outer_attempt,
                             )
                             if outer_attempt < max_outer_retries:
                                 continue  # 외부 재시도
-                            msg = f"스킬 생성 중 오류가 발생했습니다: {e}"
-                            await _broadcast_notification("skill_error", msg)
-                finally:
-                    _app_state["_skill_generating"] = False
-
-            task = asyncio.create_task(_bg_create_skill())
-            _background_tasks.add(task)
-            task.add_done_callback(_background_tasks.discard)
-
-            return {
-                "status": "generating",
-                "message": f"'{description}' 스킬을 백그라운드에서 생성 중입니다. 잠시 후 사용 가능합니다.",
+                            msg = (
+                                f"'{description}' 스킬 생성에 실패했습니다. "
+                                f"다른 표현으로 다시 시도해 주세요."
+                            )
+                            await _broadcast_notification("skill_failed", msg)
+                    except Exception as e:
+                        last_outer_error = f"{type(e).__name__}: {e}"
+                        logger.error(
+                            "skill_creation_error_bg",
+                            error=str(e),
+                            outer_attempt=outer_attempt,
+                        )
+                        if outer_attempt < max_outer_retries:
+                            continue  # 외부 재시도
+                        msg = f"스킬 생성 중 오류가 발생했습니다: {e}"
+                        await _broadcast_notification("skill_error", msg)
+            finally:
+                _app_state["_skill_generating"] = False
+
+        _spawn(_bg_create_skill())
+
+        return {
+            "status": "generating",
+            "message": f"'{description}' 스킬을 백그라운드에서 생성 중입니다. 잠시 후 사용 가능합니다.",
+        }
+
+    async def _list_skills(arguments: dict) -> Any:
+        skills = _scan_skills()
+        summary = [
+            {
+                "name": s["name"],
+                "description": s["description"],
+                "enabled": s["enabled"],
+                "version": s.get("version", ""),
             }
+            for s in skills
+        ]
+        return {"skills": summary, "total": len(summary)}
+
+    async def _delete_skill(arguments: dict) -> Any:
+        skill_name = arguments.get("name", "")
+        if not skill_name:
+            return {"error": "스킬 이름을 지정해주세요."}
+        # 경로 검증 (traversal 방지) - 스캔 전에 이름 형식부터 확인
+        if not _SKILL_NAME_RE.match(skill_name):
+            return {"error": "잘못된 스킬 이름 형식입니다."}
+
+        skill = _scan_skills_indexed().get(skill_name)
+        if not skill:
+            return {"error": f"'{skill_name}' 스킬을 찾을 수 없습니다."}
+
+        if not skill.get("auto_generated"):
+            return {"error": "수동으로 설치한 스킬은 삭제할 수 없습니다."}
+
+        skill_path = Path(skill["path"]).resolve()
+
+        # 같은 접두어의 형제 디렉토리(generated2 등)는 통과하지 않도록 경로 단위 비교
+        if not any(skill_path.is_relative_to(d) for d in _generated_dirs(generated_dir.parent)):
+            logger.warning("skill_delete_path_blocked", name=skill_name, path=str(skill_path))
+            return {"error": "허용되지 않은 경로입니다."}
+
+        if not skill_path.exists():
+            return {"error": "스킬 디렉토리를 찾을 수 없습니다."}
+
+        # 파일 삭제
+        description = skill.get("description", "")
+        shutil.rmtree(skill_path)
+        _invalidate_skill_cache()
+        logger.info("skill_deleted_by_agent", name=skill_name)
+
+        # 레지스트리에서 제거
+        skill_registry.pop(skill_name, None)
+        _bind_handler(skill_name)
+        _drop_tool(skill_name)
+
+        # 캐시 무효화
+        _app_state.pop("_cached_agent", None)
+
+        # 메모리에 삭제 기록
+        try:
+            await generator.retain_skill_deletion(tool_name=skill_name, description=description)
+        except Exception as e:
+            logger.warning("skill_deletion_record_failed", error=str(e))
 
-        elif name == "list_skills":
-            from jedisos.web.api.skills import _scan_skills
-
-            skills = _scan_skills()
-            summary = [
-                {
-                    "name": s["name"],
-                    "description": s["description"],
-                    "enabled": s["enabled"],
-                    "version": s.get("version", ""),
-                }
-                for s in skills
-            ]
-            return {"skills": summary, "total": len(summary)}
-
-        elif name == "delete_skill":
-            import re as _re
-            import shutil
-
-            from jedisos.web.api.skills import _scan_skills
-
-            skill_name = arguments.get("name", "")
-            if not skill_name:
-                return {"error": "스킬 이름을 지정해주세요."}
-
-            skills = _scan_skills()
-            skill = next((s for s in skills if s["name"] == skill_name), None)
-            if not skill:
-                return {"error": f"'{skill_name}' 스킬을 찾을 수 없습니다."}
-
-            if not skill.get("auto_generated"):
-                return {"error": "수동으로 설치한 스킬은 삭제할 수 없습니다."}
-
-            # 경로 검증 (traversal 방지)
-            skill_path = Path(skill["path"]).resolve()
-            if not _re.match(r"^[a-zA-Z0-9_\-]+$", skill_name):
-                return {"error": "잘못된 스킬 이름 형식입니다."}
-
-            data_dir = Path(os.environ.get("JEDISOS_DATA_DIR", "."))
-            allowed_dirs = [
-                (Path("tools") / "generated").resolve(),
-                (data_dir / "tools" / "generated").resolve(),
-            ]
-            if not any(str(skill_path).startswith(str(d)) for d in allowed_dirs):
-                logger.warning("skill_delete_path_blocked", name=skill_name, path=str(skill_path))
-                return {"error": "허용되지 않은 경로입니다."}
-
-            if not skill_path.exists():
-                return {"error": "스킬 디렉토리를 찾을 수 없습니다."}
-
-            # 파일 삭제
-            description = skill.get("description", "")
-            shutil.rmtree(skill_path)
-            logger.info("skill_deleted_by_agent", name=skill_name)
-
-            # 레지스트리에서 제거
-            skill_registry.pop(skill_name, None)
-            wrapped_tools[:] = [
-                t
-                for t in wrapped_tools
-                if t.to_dict().get("function", {}).get("name") != skill_name
-            ]
-
-            # 캐시 무효화
-            _app_state.pop("_cached_agent", None)
+        return {"status": "deleted", "name": skill_name}
 
-            # 메모리에 삭제 기록
-            try:
-                await generator.retain_skill_deletion(tool_name=skill_name, description=description)
-            except Exception as e:
-                logger.warning("skill_deletion_record_failed", error=str(e))
-
-            return {"status": "deleted", "name": skill_name}
-
-        elif name == "upgrade_skill":
-            skill_name = arguments.get("name", "")
-            instructions = arguments.get("instructions", "")
-
-            if not skill_name or not instructions:
-                return {"error": "스킬 이름과 수정 지시사항을 모두 입력해주세요."}
-
-            # 중복 방지
-            if _app_state.get("_skill_generating"):
-                return {
-                    "status": "already_generating",
-                    "message": "이미 스킬을 생성/업그레이드 중입니다. 완료된 후 다시 시도해 주세요.",
-                }
-
-            # 기존 스킬 찾기
-            from jedisos.web.api.skills import _scan_skills
-
-            skills = _scan_skills()
-            skill = next((s for s in skills if s["name"] == skill_name), None)
-            if not skill:
-                return {"error": f"'{skill_name}' 스킬을 찾을 수 없습니다."}
-
-            # 기존 코드 읽기
-            skill_path = Path(skill["path"])
-            tool_py = skill_path / "tool.py"
-            if not tool_py.exists():
-                return {"error": f"'{skill_name}' 스킬의 코드를 찾을 수 없습니다."}
-
-            existing_code = tool_py.read_text()
-
-            # 기존 버전 읽기
-            tool_yaml_path = skill_path / "tool.yaml"
-            prev_version = ""
-            if tool_yaml_path.exists():
-                try:
-                    import yaml as _yaml
-
-                    meta = _yaml.safe_load(tool_yaml_path.read_text())
-                    prev_version = str(meta.get("version", "1.0.0")) if meta else "1.0.0"
-                except Exception:
-                    prev_version = "1.0.0"
-
-            _app_state["_skill_generating"] = True
-
-            async def _bg_upgrade_skill() -> None:
-                """백그라운드에서 스킬을 업그레이드합니다."""
-                try:
-                    upgrade_desc = (
-                        f"[기존 스킬 '{skill_name}' 업그레이드]\n"
-                        f"기존 코드:\n{existing_code}\n\n"
-                        f"수정 지시:\n{instructions}\n\n"
-                        f"중요: tool_name은 반드시 '{skill_name}'을 유지하세요."
-                    )
-                    result = await generator.generate(upgrade_desc, previous_version=prev_version)
-                    if result.success:
-                        # 레지스트리 업데이트
-                        for tool_func in result.tools:
-                            tname = getattr(tool_func, "_tool_name", "")
-                            if tname:
-                                skill_registry[tname] = tool_func
-                                new_def = _skill_func_to_openai_def(tool_func)
-                                # 기존 정의 교체
-                                wrapped_tools[:] = [
-                                    t
-                                    for t in wrapped_tools
-                                    if t.to_dict().get("function", {}).get("name") != tname
-                                ]
-                                wrapped_tools.append(ToolDef(new_def))
-                                logger.info("skill_upgraded", name=tname)
-
-                        _app_state.pop("_cached_agent", None)
-
-                        msg = f"'{result.tool_name}' 스킬이 업그레이드되었습니다! 대화에서 바로 사용해보세요."
-                        await _broadcast_notification("skill_upgraded", msg)
-                    else:
-                        msg = f"'{skill_name}' 스킬 업그레이드에 실패했습니다."
-                        await _broadcast_notification("skill_failed", msg)
-                except Exception as e:
-                    logger.error("skill_upgrade_error", error=str(e))
-                    msg = f"스킬 업그레이드 중 오류가 발생했습니다: {e}"
-                    await _broadcast_notification("skill_error", msg)
-                finally:
-                    _app_state["_skill_generating"] = False
-
-            task = asyncio.create_task(_bg_upgrade_skill())
-            _background_tasks.add(task)
-            task.add_done_callback(_background_tasks.discard)
+    async def _upgrade_skill(arguments: dict) -> Any:
+        skill_name = arguments.get("name", "")
+        instructions = arguments.get("instructions", "")
 
+        if not skill_name or not instructions:
+            return {"error": "스킬 이름과 수정 지시사항을 모두 입력해주세요."}
+
+        # 중복 방지
+        if _app_state.get("_skill_generating"):
             return {
-                "status": "upgrading",
-                "message": f"'{skill_name}' 스킬을 업그레이드 중입니다. 잠시 후 완료됩니다.",
+                "status": "already_generating",
+                "message": "이미 스킬을 생성/업그레이드 중입니다. 완료된 후 다시 시도해 주세요.",
             }
 
-        # search_mcp_servers — MCP 서버 검색 (큐레이티드+npm+pypi / mcp.so 폴백)
-        elif name == "search_mcp_servers":
-            from jedisos.mcp.registry import search_all
+        # 기존 스킬 찾기
+        skill = _scan_skills_indexed().get(skill_name)
+        if not skill:
+            return {"error": f"'{skill_name}' 스킬을 찾을 수 없습니다."}
+
+        # 기존 코드 + 버전 읽기 (파일이 그대로면 캐시)
+        source = _read_skill_source(Path(skill["path"]))
+        if source is None:
+            return {"error": f"'{skill_name}' 스킬의 코드를 찾을 수 없습니다."}
+        existing_code, prev_version = source
 
-            query = arguments.get("query", "")
-            source = arguments.get("source", "registry")
-            if not query:
-                return {"error": "검색어를 입력해주세요."}
+        _app_state["_skill_generating"] = True
+
+        async def _bg_upgrade_skill() -> None:
+            """백그라운드에서 스킬을 업그레이드합니다."""
             try:
-                return await search_all(query, source=source)
+                upgrade_desc = (
+                    f"[기존 스킬 '{skill_name}' 업그레이드]\n"
+                    f"기존 코드:\n{existing_code}\n\n"
+                    f"수정 지시:\n{instructions}\n\n"
+                    f"중요: tool_name은 반드시 '{skill_name}'을 유지하세요."
+                )
+                result = await generator.generate(upgrade_desc, previous_version=prev_version)
+                if result.success:
+                    # 레지스트리 업데이트
+                    for tool_func in result.tools:
+                        tname = getattr(tool_func, "_tool_name", "")
+                        if tname:
+                            skill_registry[tname] = tool_func
+                            _bind_handler(tname)
+                            # 기존 정의 교체
+                            _put_tool(tname, _skill_tool_def(tool_func))
+                            logger.info("skill_upgraded", name=tname)
+
+                    _invalidate_skill_cache()
+                    _app_state.pop("_cached_agent", None)
+
+                    msg = f"'{result.tool_name}' 스킬이 업그레이드되었습니다! 대화에서 바로 사용해보세요."
+                    await _broadcast_notification("skill_upgraded", msg)
+                else:
+                    msg = f"'{skill_name}' 스킬 업그레이드에 실패했습니다."
+                    await _broadcast_notification("skill_failed", msg)
             except Exception as e:
-                logger.error("mcp_search_failed", query=query, error=str(e))
-                return {"error": f"MCP 서버 검색 오류: {e}"}
-
-        # add_mcp_server — LLM이 MCP 서버를 등록+연결 (remote/subprocess)
-        elif name == "add_mcp_server":
-            srv_name = arguments.get("name", "")
-            srv_type = arguments.get("server_type", "remote")
-            srv_url = arguments.get("url", "")
-            srv_cmd = arguments.get("command", "")
-            srv_args = arguments.get("args", [])
-            srv_env = arguments.get("env", {})
-            srv_desc = arguments.get("description", "")
-
-            if not srv_name:
-                return {"error": "서버 이름을 입력해주세요."}
-            if srv_type == "remote" and not srv_url:
-                return {"error": "remote 타입은 URL이 필수입니다."}
-            if srv_type == "subprocess" and not srv_cmd:
-                return {"error": "subprocess 타입은 command가 필수입니다."}
-
-            if not mcp_manager:
-                return {"error": "MCP 매니저가 초기화되지 않았습니다."}
-
-            # config 파일에 저장
-            from jedisos.web.api.mcp import _load_mcp_config, _save_mcp_config
-
-            config = _load_mcp_config()
-            servers = config.get("servers", [])
-            if any(s["name"] == srv_name for s in servers):
+                logger.error("skill_upgrade_error", error=str(e))
+                msg = f"스킬 업그레이드 중 오류가 발생했습니다: {e}"
+                await _broadcast_notification("skill_error", msg)
+            finally:
+                _app_state["_skill_generating"] = False
+
+        _spawn(_bg_upgrade_skill())
+
+        return {
+            "status": "upgrading",
+            "message": f"'{skill_name}' 스킬을 업그레이드 중입니다. 잠시 후 완료됩니다.",
+        }
+
+    # search_mcp_servers — MCP 서버 검색 (큐레이티드+npm+pypi / mcp.so 폴백)
+    async def _search_mcp_servers(arguments: dict) -> Any:
+        query = arguments.get("query", "")
+        source = arguments.get("source", "registry")
+        if not query:
+            return {"error": "검색어를 입력해주세요."}
+        try:
+            return await search_all(query, source=source)
+        except Exception as e:
+            logger.error("mcp_search_failed", query=query, error=str(e))
+            return {"error": f"MCP 서버 검색 오류: {e}"}
+
+    # add_mcp_server — LLM이 MCP 서버를 등록+연결 (remote/subprocess)
+    async def _add_mcp_server(arguments: dict) -> Any:
+        srv_name = arguments.get("name", "")
+        srv_type = arguments.get("server_type", "remote")
+        srv_url = arguments.get("url", "")
+        srv_cmd = arguments.get("command", "")
+        srv_args = arguments.get("args", [])
+        srv_env = arguments.get("env", {})
+        srv_desc = arguments.get("description", "")
+
+        if not srv_name:
+            return {"error": "서버 이름을 입력해주세요."}
+        if srv_type == "remote" and not srv_url:
+            return {"error": "remote 타입은 URL이 필수입니다."}
+        if srv_type == "subprocess" and not srv_cmd:
+            return {"error": "subprocess 타입은 command가 필수입니다."}
+
+        if not mcp_manager:
+            return {"error": "MCP 매니저가 초기화되지 않았습니다."}
+
+        entry: dict[str, Any] = {
+            "name": srv_name,
+            "url": srv_url,
+            "description": srv_desc,
+            "enabled": True,
+            "server_type": srv_type,
+        }
+        if srv_type == "subprocess":
+            entry["command"] = srv_cmd
+            entry["args"] = srv_args
+            entry["env"] = srv_env
+
+        # config 파일에 저장 - MCP API 핸들러와 같은 잠금으로 읽기-수정-쓰기 직렬화.
+        # mtime 캐시된 설정 + 이름 인덱스 (파일이 그대로면 다시 읽지 않음)
+        async with _config_lock:
+            config, by_name = _load_mcp_index()
+            if srv_name in by_name:
                 return {"error": f"'{srv_name}' 서버가 이미 등록되어 있습니다."}
+            servers = config.get("servers", [])
+            _save_mcp_config({**config, "servers": [*servers, entry]})
+
+        # 런타임 등록+연결
+        await mcp_manager.register_server(
+            srv_name,
+            url=srv_url,
+            server_type=srv_type,
+            command=srv_cmd,
+            args=srv_args,
+            env=srv_env,
+        )
+        connected = await mcp_manager.connect(srv_name)
+
+        # 새 도구 목록 가져와서 등록
+        if connected:
+            tools = await mcp_manager.list_tools(srv_name)
+            for new_def in _mcp_tool_defs(srv_name, tools, mcp_tool_map):
+                t_name = new_def["function"]["name"]
+                _bind_handler(t_name)
+                _put_tool(t_name, ToolDef(new_def))
+            _app_state.pop("_cached_agent", None)
 
-            entry: dict[str, Any] = {
-                "name": srv_name,
-                "url": srv_url,
-                "description": srv_desc,
-                "enabled": True,
-                "server_type": srv_type,
-            }
-            if srv_type == "subprocess":
-                entry["command"] = srv_cmd
-                entry["args"] = srv_args
-                entry["env"] = srv_env
-            servers.append(entry)
-            config["servers"] = servers
-            _save_mcp_config(config)
-
-            # 런타임 등록+연결
-            await mcp_manager.register_server(
-                srv_name,
-                url=srv_url,
-                server_type=srv_type,
-                command=srv_cmd,
-                args=srv_args,
-                env=srv_env,
-            )
-            connected = await mcp_manager.connect(srv_name)
-
-            # 새 도구 목록 가져와서 등록
-            if connected:
-                tools = await mcp_manager.list_tools(srv_name)
-                for tool in tools:
-                    t_name = f"mcp_{srv_name}_{tool['name']}"
-                    mcp_tool_map[t_name] = (srv_name, tool["name"])
-                    new_def = {
-                        "type": "function",
-                        "function": {
-                            "name": t_name,
-                            "description": f"[MCP:{srv_name}] {tool['description']}",
-                            "parameters": tool.get(
-                                "parameters", {"type": "object", "properties": {}}
-                            ),
-                        },
-                    }
-                    wrapped_tools.append(ToolDef(new_def))
-                _app_state.pop("_cached_agent", None)
-
-            logger.info(
-                "mcp_server_added_by_agent",
-                name=srv_name,
-                server_type=srv_type,
-                connected=connected,
-            )
-            return {"status": "registered", "connected": connected, "name": srv_name}
+        logger.info(
+            "mcp_server_added_by_agent",
+            name=srv_name,
+            server_type=srv_type,
+            connected=connected,
+        )
+        return {"status": "registered", "connected": connected, "name": srv_name}
+
+    # 내장 도구 디스패치 테이블 (이름 → 핸들러)
+    builtin_handlers: dict[str, Callable[[dict], Awaitable[Any]]] = {
+        "recall_memory": _recall_memory,
+        "retain_memory": _retain_memory,
+        "create_skill": _create_skill,
+        "list_skills": _list_skills,
+        "delete_skill": _delete_skill,
+        "upgrade_skill": _upgrade_skill,
+        "search_mcp_servers": _search_mcp_servers,
+        "add_mcp_server": _add_mcp_server,
+    }
 
-        # 동적 스킬 실행
-        elif name in skill_registry:
-            try:
-                func = skill_registry[name]
-                return await func(**arguments)
-            except Exception as e:
-                logger.error("skill_execution_failed", skill=name, error=str(e))
-                return {"error": f"스킬 실행 오류: {e}"}
+    # 전체 디스패치 테이블 (이름 → 실행기). 스킬/MCP 등록이 바뀔 때마다 _bind_handler로 갱신
+    handlers: dict[str, Callable[[dict], Awaitable[Any]]] = dict(builtin_handlers)
 
-        # MCP 도구 실행
-        elif name in mcp_tool_map:
-            server_name, original_tool_name = mcp_tool_map[name]
-            try:
-                result = await mcp_manager.call_tool(server_name, original_tool_name, arguments)
-                return result
-            except Exception as e:
-                logger.error("mcp_tool_exec_failed", tool=name, error=str(e))
-                return {"error": f"MCP 도구 실행 오류: {e}"}
+    def _bind_handler(tname: str) -> None:
+        """이름의 실행기를 우선순위(내장 > 스킬 > MCP)대로 다시 정합니다."""
+        if tname in builtin_handlers:
+            return
+        if (func := skill_registry.get(tname)) is not None:
+            handlers[tname] = _skill_runner(tname, func)
+        elif (target := mcp_tool_map.get(tname)) is not None:
+            handlers[tname] = _mcp_runner(mcp_manager, tname, *target)
+        else:
+            handlers.pop(tname, None)
 
-        return {"error": f"알 수 없는 도구: {name}"}
+    for tname in (*mcp_tool_map, *skill_registry):
+        _bind_handler(tname)
+
+    # 도구 실행기
+    async def tool_executor(name: str, arguments: dict) -> Any:
+        run = handlers.get(name)
+        if run is None:
+            return {"error": f"알 수 없는 도구: {name}"}
+        return await run(arguments)
 
     # 레지스트리를 app_state에 저장 (외부 접근용)
     _app_state["skill_registry"] = skill_registry
 
     logger.info(
         "tools_registered",
-        builtin=len(builtin_defs),
-        skills=len(skill_defs),
-        mcp=len(mcp_defs),
-        total=len(all_defs),
+        builtin=len(_BUILTIN_TOOLS),
+        skills=skill_count,
+        mcp=mcp_count,
+        total=len(wrapped_tools),
     )
     return wrapped_tools, tool_executor
 
 
-def _load_generated_skills(  # [JS-W001.13]
+def _skill_runner(name: str, func: Any) -> Callable[[dict], Awaitable[Any]]:  # [JS-W001.42]
+    """생성된 스킬 함수를 도구 실행기로 감쌉니다 (오류는 결과 dict로 반환)."""
+
+    async def run(arguments: dict) -> Any:
+        try:
+            return await func(**arguments)
+        except Exception as e:
+            logger.error("skill_execution_failed", skill=name, error=str(e))
+            return {"error": f"스킬 실행 오류: {e}"}
+
+    return run
+
+
+def _mcp_runner(  # [JS-W001.43]
+    mcp_manager: Any, name: str, server_name: str, original_name: str
+) -> Callable[[dict], Awaitable[Any]]:
+    """MCP 서버 도구 호출을 도구 실행기로 감쌉니다 (오류는 결과 dict로 반환)."""
+
+    async def run(arguments: dict) -> Any:
+        try:
+            return await mcp_manager.call_tool(server_name, original_name, arguments)
+        except Exception as e:
+            logger.error("mcp_tool_exec_failed", tool=name, error=str(e))
+            return {"error": f"MCP 도구 실행 오류: {e}"}
+
+    return run
+
+
+# 스킬 소스 캐시: 스킬 경로 → (tool.py mtime_ns, tool.yaml mtime_ns, 코드, 버전)
+_skill_source_cache: dict[str, tuple[int, int, str, str]] = {}
+# tool.yaml 최상위 version 키 (따옴표/주석 제외)
+_VERSION_RE = re.compile(rb"""^version[ \t]*:[ \t]*["']?([^"'\r\n#]+)""", re.M)
+
+
+def _read_skill_source(skill_path: Path) -> tuple[str, str] | None:  # [JS-W001.31]
+    """스킬의 tool.py 코드와 tool.yaml 버전을 반환합니다 (tool.py가 없으면 None).
+
+    두 파일의 mtime_ns가 그대로면 다시 읽거나 YAML을 파싱하지 않습니다.
+    버전은 정규식으로 먼저 찾고, 못 찾을 때만 YAML 전체를 파싱합니다.
+    """
+    tool_py = skill_path / "tool.py"
+    tool_yaml = skill_path / "tool.yaml"
+    try:
+        code_mtime = tool_py.stat().st_mtime_ns
+    except FileNotFoundError:
+        _skill_source_cache.pop(str(skill_path), None)
+        return None
+    try:
+        yaml_mtime = tool_yaml.stat().st_mtime_ns
+    except FileNotFoundError:
+        yaml_mtime = 0
+
+    key = str(skill_path)
+    cached = _skill_source_cache.get(key)
+    if cached is not None and cached[0] == code_mtime and cached[1] == yaml_mtime:
+        return cached[2], cached[3]
+
+    code = tool_py.read_text()
+    version = ""
+    if yaml_mtime:
+        data = tool_yaml.read_bytes()
+        m = _VERSION_RE.search(data)
+        version = m.group(1).decode("utf-8", "replace").strip() if m else ""
+        if not version:
+            try:
+                import yaml
+
+                meta = yaml.safe_load(data)
+                version = str(meta.get("version", "1.0.0")) if meta else "1.0.0"
+            except Exception:
+                version = "1.0.0"
+    _skill_source_cache[key] = (code_mtime, yaml_mtime, code, version)
+    return code, version
+
+
+async def _load_generated_skills(  # [JS-W001.13]
     loader: Any,
     generated_dir: Path,
     registry: dict[str, Any],
 ) -> None:
-    """generated/ 디렉토리의 스킬을 로드하여 레지스트리에 등록합니다."""
-    if not generated_dir.exists():
+    """generated/ 디렉토리의 스킬을 로드하여 레지스트리에 등록합니다.
+
+    os.scandir의 DirEntry는 디렉토리 여부를 d_type으로 알려주므로, 항목당
+    stat은 tool.py / .disabled 확인 두 번뿐입니다. tool.py 읽기/compile/exec는
+    스킬별로 스레드에서 동시에 실행하고, 레지스트리 병합만 이름 순서대로 합니다.
+    """
+    try:
+        with os.scandir(generated_dir) as it:
+            # 디렉토리만 골라서 정렬 (심볼릭 링크로 연결한 스킬 디렉토리도 허용)
+            entries = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+    except (FileNotFoundError, NotADirectoryError):
         return
 
-    for skill_dir in sorted(generated_dir.iterdir()):
-        if not skill_dir.is_dir() or not (skill_dir / "tool.py").exists():
-            continue
+    skill_dirs = [
+        Path(entry.path)
+        for entry in entries
+        if os.path.isfile(os.path.join(entry.path, "tool.py"))
         # .disabled 마커가 있으면 스킵
-        if (skill_dir / ".disabled").exists():
+        and not os.path.exists(os.path.join(entry.path, ".disabled"))
+    ]
+    results = await asyncio.gather(
+        *(asyncio.to_thread(loader.load_tool, d) for d in skill_dirs),
+        return_exceptions=True,
+    )
+    for skill_dir, tools in zip(skill_dirs, results, strict=True):
+        if isinstance(tools, BaseException):
+            logger.warning("generated_skill_load_failed", dir=str(skill_dir), error=str(tools))
             continue
-        try:
-            tools = loader.load_tool(skill_dir)
-            for func in tools:
-                tool_name = getattr(func, "_tool_name", "")
-                if tool_name:
-                    registry[tool_name] = func
-                    logger.info("generated_skill_loaded", name=tool_name, dir=str(skill_dir))
-        except Exception as e:
-            logger.warning("generated_skill_load_failed", dir=str(skill_dir), error=str(e))
+        for func in tools:
+            tool_name = getattr(func, "_tool_name", "")
+            if tool_name:
+                registry[tool_name] = func
+                logger.info("generated_skill_loaded", name=tool_name, dir=str(skill_dir))
 
 
 async def _broadcast_notification(event: str, message: str) -> None:  # [JS-W001.14]
-    """모든 연결된 채널(WebSocket + 텔레그램 + 디스코드 + 슬랙)에 알림을 전송합니다."""
-    # 1) WebSocket 클라이언트
-    try:
-        import contextlib
+    """모든 연결된 채널(WebSocket + 텔레그램 + 디스코드 + 슬랙)에 알림을 전송합니다.
+
+    채널별 전송은 동시에 실행하므로 전체 지연은 가장 느린 채널 하나의 왕복 시간입니다.
+    """
+    results = await asyncio.gather(
+        _notify_websockets(event, message),
+        _notify_telegram(message),
+        return_exceptions=True,
+    )
+    for channel, result in zip(("websocket", "telegram"), results, strict=True):
+        if isinstance(result, BaseException):
+            logger.debug("notification_channel_failed", channel=channel, error=str(result))
+
+
+# 알림 경로에서 쓰는 모듈 (첫 알림 때 한 번 바인딩). web.api.chat은 이 모듈을 import하고
+# channels.telegram은 python-telegram-bot 전체를 불러오므로 모듈 상단에 둘 수 없음.
+# 속성은 호출 시점에 읽음 (모듈 객체만 캐시)
+_chat_api: Any = None
+_telegram_channel: Any = None
+
+
+async def _notify_websockets(event: str, message: str) -> None:  # [JS-W001.34]
+    """연결된 WebSocket 클라이언트의 전송 큐에 알림을 넣습니다 (한 번만 직렬화)."""
+    global _chat_api
+    if _chat_api is None:
+        from jedisos.web.api import chat as _chat_api
 
-        from jedisos.web.api.chat import manager as ws_manager
+    ws_manager = _chat_api.manager
+    if not ws_manager.active_connections:
+        return
+    payload = {"type": "notification", "event": event, "message": message}
+    ws_manager.broadcast(orjson.dumps(payload).decode())
 
-        payload = {"type": "notification", "event": event, "message": message}
-        for conn in list(ws_manager.active_connections):
-            with contextlib.suppress(Exception):
-                await conn.send_json(payload)
-    except Exception:  # nosec B110 — WebSocket 알림 실패는 무시해도 안전
-        pass
 
-    # 2) 텔레그램 — 최근 대화한 사용자에게 알림
+async def _notify_telegram(message: str) -> None:  # [JS-W001.35]
+    """최근 대화한 텔레그램 사용자에게 알림을 보냅니다."""
     tg_app = _app_state.get("telegram_app")
-    if tg_app and hasattr(tg_app, "bot"):
-        from jedisos.channels.telegram import _md_to_telegram_html, _telegram_history
+    if not tg_app or not hasattr(tg_app, "bot"):
+        return
+    global _telegram_channel
+    if _telegram_channel is None:
+        from jedisos.channels import telegram as _telegram_channel
 
-        for chat_id in list(_telegram_history.keys()):
-            try:
-                await tg_app.bot.send_message(
-                    chat_id=int(chat_id),
-                    text=_md_to_telegram_html(message),
-                    parse_mode="HTML",
-                )
-            except Exception as e:
-                logger.debug("telegram_notify_failed", chat_id=chat_id, error=str(e))
+    chat_ids = tuple(_telegram_channel._telegram_chat_ids)
+    if not chat_ids:
+        # 아직 대화한 사용자가 없으면 HTML 변환도 하지 않음
+        return
+    text = _telegram_channel._md_to_telegram_html(message)
+
+    async def _send(chat_id: int) -> None:
+        await tg_app.bot.send_message(chat_id=chat_id, text=text, parse_mode="HTML")
+
+    # 채팅별 전송도 동시에 (지연 = 가장 느린 전송 하나)
+    results = await asyncio.gather(*map(_send, chat_ids), return_exceptions=True)
+    for chat_id, result in zip(chat_ids, results, strict=True):
+        if isinstance(result, Exception):
+            logger.debug("telegram_notify_failed", chat_id=chat_id, error=str(result))
 
 
 async def _stop_channels() -> None:  # [JS-W001.9]
     """실행 중인 채널 봇을 중지합니다."""
+    # 아직 시작 중인 Telegram 부트스트랩은 취소 후 아래에서 정리
+    tg_task = _app_state.pop("telegram_task", None)
+    if tg_task is not None and not tg_task.done():
+        tg_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await tg_task
+
     # Telegram 정리
     tg_app = _app_state.get("telegram_app")
     if tg_app:
@@ -883,6 +1177,250 @@ async def _stop_channels() -> None:  # [JS-W001.9]
             logger.info("channel_task_cancelled", channel=key)
 
 
+def _init_memory(config: Any) -> Any:  # [JS-W001.17]
+    """ZvecMemory를 생성합니다 (zvecsearch import + 인덱서 초기화, 블로킹)."""
+    from jedisos.memory.zvec_memory import ZvecMemory
+
+    return ZvecMemory(config)
+
+
+def _init_llm(config: Any) -> Any:  # [JS-W001.18]
+    """LLMRouter를 생성합니다 (litellm import + 모델 필터링, 블로킹)."""
+    from jedisos.llm.router import LLMRouter
+
+    return LLMRouter(config)
+
+
+class _HealthCheck:  # [JS-W001.4]
+    """헬스 체크 엔드포인트 (순수 ASGI).
+
+    응답 본문이 프로세스 수명 동안 바뀌지 않으므로 본문/헤더 바이트를 한 번만 만듭니다.
+    """
+
+    __slots__ = ("_body", "_headers")
+
+    def __init__(self) -> None:
+        self._body = orjson.dumps({"status": "ok", "version": __version__})
+        self._headers = (
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(self._body)).encode("latin-1")),
+        )
+
+    async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+        # 미들웨어가 헤더 리스트를 수정할 수 있으므로 매번 새 리스트로 전달
+        await send({"type": "http.response.start", "status": 200, "headers": list(self._headers)})
+        await send({"type": "http.response.body", "body": self._body})
+
+
+# /metrics 버퍼 갱신 주기 (초)
+_METRICS_INTERVAL = 5.0
+
+
+class _MetricsEndpoint:  # [JS-W001.25]
+    """Prometheus 텍스트 포맷 /metrics 엔드포인트 (순수 ASGI).
+
+    스크랩마다 포맷하지 않고, 백그라운드 태스크가 갱신한 bytes 버퍼를 그대로 보냅니다.
+    """
+
+    __slots__ = ("body",)
+
+    _CONTENT_TYPE = b"text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self) -> None:
+        self.body = b""
+
+    async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+        body = self.body
+        headers = [
+            (b"content-type", self._CONTENT_TYPE),
+            (b"content-length", str(len(body)).encode("latin-1")),
+        ]
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+
+def _render_metrics(res: AppResources, started_at: float) -> bytes:  # [JS-W001.26]
+    """현재 상태를 Prometheus 텍스트 포맷으로 만듭니다.
+
+    prometheus_client가 설치되어 있으면 기본 레지스트리(process_* 등)도 덧붙입니다.
+    """
+    audit = res.audit
+    lines = [
+        "# TYPE jedisos_info gauge",
+        f'jedisos_info{{version="{__version__}"}} 1',
+        "# TYPE jedisos_uptime_seconds gauge",
+        f"jedisos_uptime_seconds {time.monotonic() - started_at:.3f}",
+        "# TYPE jedisos_llm_models gauge",
+        f"jedisos_llm_models {len(res.llm.models) if res.llm else 0}",
+        "# TYPE jedisos_tools_registered gauge",
+        f"jedisos_tools_registered {len(_app_state.get('builtin_tools') or ())}",
+        "# TYPE jedisos_audit_entries gauge",
+        f"jedisos_audit_entries {audit.entry_count if audit else 0}",
+        "# TYPE jedisos_audit_denied gauge",
+        f"jedisos_audit_denied {len(audit.get_denied_entries()) if audit else 0}",
+    ]
+    body = ("\n".join(lines) + "\n").encode()
+    try:
+        from prometheus_client import generate_latest
+    except ImportError:
+        return body
+    return body + generate_latest()
+
+
+async def _metrics_writer(app: FastAPI, endpoint: _MetricsEndpoint) -> None:  # [JS-W001.27]
+    """_METRICS_INTERVAL마다 /metrics 버퍼를 다시 만듭니다."""
+    started_at = time.monotonic()
+    while True:
+        try:
+            endpoint.body = _render_metrics(app.state.resources, started_at)
+        except Exception as e:
+            logger.warning("metrics_render_failed", error=str(e))
+        await asyncio.sleep(_METRICS_INTERVAL)
+
+
+def _get_templates() -> Any:  # [JS-W001.19]
+    """Jinja2 템플릿 엔진을 반환합니다 (lazy init)."""
+    global _templates
+    if _templates is None:
+        from fastapi.templating import Jinja2Templates
+
+        _templates = Jinja2Templates(directory=str(_WEB_DIR / "templates"))
+    return _templates
+
+
+@functools.lru_cache(maxsize=1)
+def _index_html() -> bytes:  # [JS-W001.44]
+    """메인 웹 UI HTML을 한 번만 렌더링해 재사용합니다 (템플릿 입력은 버전뿐)."""
+    template = _get_templates().get_template("index.html")
+    return template.render(version=__version__, static_url=_static_url).encode("utf-8")
+
+
+def _static_url(path: str) -> str:  # [JS-W001.45]
+    """정적 파일 URL에 내용 해시를 붙입니다 (`/static/js/app.js?v=<hash>`).
+
+    파일이 바뀌면 URL도 바뀌므로 브라우저가 해시 URL을 무기한 캐시해도 됩니다.
+    """
+    digest = hashlib.blake2b((_WEB_DIR / "static" / path).read_bytes(), digest_size=6)
+    return f"/static/{path}?v={digest.hexdigest()}"
+
+
+# 내용 해시 URL(`?v=`)로 요청한 정적 파일의 캐시 정책 (URL이 바뀌므로 무기한 캐시)
+_STATIC_IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+class _VersionedStaticFiles(StaticFiles):  # [JS-W001.46]
+    """버전 쿼리(`?v=`)가 붙은 요청에 장기 캐시 헤더를 붙이는 StaticFiles.
+
+    버전 없는 요청은 no-cache로 매번 ETag 재검증(304)을 하게 합니다.
+    """
+
+    def file_response(
+        self,
+        full_path: Any,
+        stat_result: os.stat_result,
+        scope: Any,
+        status_code: int = 200,
+    ) -> Any:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        query = scope.get("query_string", b"")
+        versioned = query.startswith(b"v=") or b"&v=" in query
+        response.headers["cache-control"] = _STATIC_IMMUTABLE if versioned else "no-cache"
+        return response
+
+
+# SecVault 소켓 파일을 기다리는 최대 시간 (초)
+_VAULT_READY_TIMEOUT = 4.0
+
+
+async def _wait_vault_ready(vault_client: Any) -> None:  # [JS-W001.39]
+    """SecVault 데몬 소켓이 준비될 때까지 기다려 상태를 기록합니다.
+
+    고정 간격 폴링 대신 소켓 파일을 10ms부터 지수 백오프로 확인하므로 실제 데몬
+    준비 시점 직후에 깨어나고, 소켓이 생긴 뒤 status()를 한 번 호출합니다
+    (연결 거부는 클라이언트 자체 재시도가 처리).
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + _VAULT_READY_TIMEOUT
+    delay = 0.01
+    while not vault_client.socket_path.exists() and loop.time() < deadline:
+        await asyncio.sleep(delay)
+        delay = min(delay * 1.5, 0.2)
+    try:
+        vault_status = await vault_client.status()
+    except ConnectionError:
+        _app_state["vault_status"] = "unavailable"
+        logger.warning("secvault_daemon_not_ready")
+        return
+    _app_state["vault_status"] = vault_status.get("status", "unknown")
+    logger.info("secvault_status", vault_status=vault_status)
+
+
+async def _configure_llm_roles(llm: Any, data_dir: Path) -> None:  # [JS-W001.40]
+    """멀티티어 LLM 자동 구성 (모델 조회 → 역할 배정). 실패하면 기본값을 유지합니다."""
+    try:
+        from jedisos.llm.auto_config import auto_configure_roles
+
+        role_mapping = await auto_configure_roles(llm, data_dir=str(data_dir))
+        llm.set_role_models(role_mapping)
+    except Exception as e:
+        logger.warning("auto_config_failed_using_defaults", error=str(e))
+
+
+async def _connect_mcp_servers(data_dir: Path) -> Any:  # [JS-W001.41]
+    """MCP 클라이언트 매니저를 만들고 설정된 서버를 등록/연결합니다.
+
+    설정 파일은 bytes 그대로 orjson으로 파싱합니다 (UTF-8 디코드 단계 없음).
+    """
+    from jedisos.mcp.client import MCPClientManager
+
+    mcp_manager = MCPClientManager()
+    try:
+        mcp_cfg = orjson.loads((data_dir / "config" / "mcp_servers.json").read_bytes())
+    except FileNotFoundError:
+        mcp_cfg = None
+    if mcp_cfg is not None:
+        # 등록은 서로 독립적이므로 동시에 실행 (전체 대기 = 가장 느린 등록 하나)
+        enabled = [srv for srv in mcp_cfg.get("servers", []) if srv.get("enabled", True)]
+        results = await asyncio.gather(
+            *(
+                mcp_manager.register_server(
+                    srv["name"],
+                    url=srv.get("url", ""),
+                    server_type=srv.get("server_type", "remote"),
+                    command=srv.get("command", ""),
+                    args=srv.get("args", []),
+                    env=srv.get("env", {}),
+                )
+                for srv in enabled
+            ),
+            return_exceptions=True,
+        )
+        for srv, result in zip(enabled, results, strict=True):
+            if isinstance(result, Exception):
+                logger.warning("mcp_server_register_failed", name=srv["name"], error=str(result))
+        conn_results = await mcp_manager.connect_all()
+        logger.info("mcp_servers_connected", results=conn_results)
+    return mcp_manager
+
+
+async def _setup_tools(  # [JS-W001.47]
+    memory: Any,
+    llm: Any,
+    data_dir: Path,
+) -> tuple[Any, list[Any], Any]:
+    """MCP 서버를 연결한 뒤 내장 도구 + 생성된 스킬 + MCP 도구를 등록합니다.
+
+    MCP 도구 목록이 필요하므로 두 단계는 순서대로 실행하되, lifespan에서는
+    SecVault 소켓 대기/LLM 역할 구성과 겹쳐서 실행합니다.
+
+    Returns:
+        (mcp_manager, tool_definitions, tool_executor) 튜플
+    """
+    mcp_manager = await _connect_mcp_servers(data_dir)
+    builtin_tools, tool_executor = await _register_builtin_tools(memory, llm, mcp_manager)
+    return mcp_manager, builtin_tools, tool_executor
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:  # [JS-W001.1]
     """앱 시작/종료 시 리소스를 관리합니다."""
@@ -893,25 +1431,39 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:  # [JS-W001.1]
 
     # 시작 시 초기화
     from jedisos.core.config import JedisosConfig, LLMConfig, MemoryConfig, SecurityConfig
-    from jedisos.llm.router import LLMRouter
-    from jedisos.memory.zvec_memory import ZvecMemory
+    from jedisos.llm.cost_map import revalidate_cost_map, use_local_cost_map
     from jedisos.security.audit import AuditLogger
     from jedisos.security.pdp import PolicyDecisionPoint
     from jedisos.security.secvault_client import SecVaultClient
     from jedisos.security.secvault_daemon import start_daemon, stop_daemon
 
     config = JedisosConfig()
-    memory = ZvecMemory(MemoryConfig())
-    llm = LLMRouter(LLMConfig())
-    pdp = PolicyDecisionPoint(SecurityConfig())
-    audit = AuditLogger()
+    memory_config = MemoryConfig()
 
-    # SecVault 데몬 시작
-    data_dir = Path(os.environ.get("JEDISOS_DATA_DIR", memory.config.data_dir))
+    # SecVault 데몬 먼저 시작 (메모리/LLM 초기화와 겹쳐서 소켓 준비)
+    data_dir = _data_dir(memory_config.data_dir)
     secvault_dir = data_dir / ".secvault"
     vault_process = start_daemon(secvault_dir)
     _app_state["vault_process"] = vault_process
 
+    # litellm import 시 비용 맵 원격 fetch를 막고, 캐시 적용/갱신은 백그라운드로
+    refresh_cost_map = use_local_cost_map()
+
+    # 무거운 import + 블로킹 생성자는 스레드풀에서 병렬로 실행
+    try:
+        memory, llm = await asyncio.gather(
+            asyncio.to_thread(_init_memory, memory_config),
+            asyncio.to_thread(_init_llm, LLMConfig()),
+        )
+    except BaseException:
+        stop_daemon(vault_process)
+        raise
+    pdp = PolicyDecisionPoint(SecurityConfig())
+    audit = AuditLogger()
+
+    if refresh_cost_map:
+        _spawn(revalidate_cost_map(data_dir / "cache" / "llm_cost_map.json"))
+
     # SecVault 클라이언트 연결 (데몬 소켓 대기)
     vault_client = SecVaultClient(secvault_dir)
     _app_state["vault_client"] = vault_client
@@ -920,19 +1472,6 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:  # [JS-W001.1]
     memory.set_vault_client(vault_client)
     memory.set_llm_router(llm)
 
-    # SecVault 상태 확인 (소켓 준비 대기)
-    for _retry in range(20):
-        try:
-            vault_status = await vault_client.status()
-            _app_state["vault_status"] = vault_status.get("status", "unknown")
-            logger.info("secvault_status", vault_status=vault_status)
-            break
-        except ConnectionError:
-            await asyncio.sleep(0.2)
-    else:
-        _app_state["vault_status"] = "unavailable"
-        logger.warning("secvault_daemon_not_ready")
-
     # PromptRegistry 초기화
     from jedisos.llm.prompt_registry import PromptRegistry, set_registry
 
@@ -965,62 +1504,44 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:  # [JS-W001.1]
     # 메모리에 DSPy 브릿지 연결
     memory.set_dspy_bridge(dspy_bridge)
 
-    # 멀티티어 LLM 자동 구성 (모델 조회 → 역할 배정)
-    try:
-        from jedisos.llm.auto_config import auto_configure_roles
-
-        role_mapping = await auto_configure_roles(llm, data_dir=str(data_dir))
-        llm.set_role_models(role_mapping)
-    except Exception as e:
-        logger.warning("auto_config_failed_using_defaults", error=str(e))
-
     # 스킬 공유 컨텍스트 초기화 (LLM + 메모리를 스킬에서 사용 가능하게)
     from jedisos.forge.context import initialize as init_skill_context
 
     init_skill_context(llm_router=llm, memory=memory)
 
+    # 서로 독립적인 대기를 동시에 진행 (시작 시간 = 가장 느린 작업 하나):
+    # SecVault 소켓 준비, 멀티티어 LLM 자동 구성, MCP 연결 → 도구 등록(생성된 스킬 로드)
+    _, _, (mcp_manager, builtin_tools, tool_executor) = await asyncio.gather(
+        _wait_vault_ready(vault_client),
+        _configure_llm_roles(llm, data_dir),
+        _setup_tools(memory, llm, data_dir),
+    )
+
+    app.state.resources = AppResources(config=config, memory=memory, llm=llm, pdp=pdp, audit=audit)
     _app_state["config"] = config
     _app_state["memory"] = memory
     _app_state["llm"] = llm
     _app_state["pdp"] = pdp
     _app_state["audit"] = audit
 
-    # MCP 클라이언트 매니저 초기화 + 서버 연결
-    from jedisos.mcp.client import MCPClientManager
-
-    mcp_manager = MCPClientManager()
-    mcp_config_path = data_dir / "config" / "mcp_servers.json"
-    if mcp_config_path.exists():
-        import json as _json
-
-        mcp_cfg = _json.loads(mcp_config_path.read_text())
-        for srv in mcp_cfg.get("servers", []):
-            if srv.get("enabled", True):
-                srv_type = srv.get("server_type", "remote")
-                await mcp_manager.register_server(
-                    srv["name"],
-                    url=srv.get("url", ""),
-                    server_type=srv_type,
-                    command=srv.get("command", ""),
-                    args=srv.get("args", []),
-                    env=srv.get("env", {}),
-                )
-        conn_results = await mcp_manager.connect_all()
-        logger.info("mcp_servers_connected", results=conn_results)
-
     _app_state["mcp_manager"] = mcp_manager
-
-    # 내장 도구 등록 (ZvecMemory + Forge 스킬 + MCP 도구)
-    builtin_tools, tool_executor = await _register_builtin_tools(memory, llm, mcp_manager)
     _app_state["builtin_tools"] = builtin_tools
     _app_state["tool_executor"] = tool_executor
 
     # 채널 봇 시작 (토큰이 있는 경우만)
     await _start_channels()
 
+    metrics_task = None
+    metrics = getattr(app.state, "metrics", None)
+    if metrics is not None:
+        metrics_task = asyncio.create_task(_metrics_writer(app, metrics))
+
     logger.info("web_app_ready")
     yield
 
+    if metrics_task is not None:
+        metrics_task.cancel()
+
     # 종료 시 채널 봇 정리
     await _stop_channels()
 
@@ -1029,12 +1550,18 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:  # [JS-W001.1]
     if mcp_mgr:
         await mcp_mgr.disconnect_all()
 
+    # MCP 서버 검색용 공용 HTTP 클라이언트 종료
+    from jedisos.mcp.registry import aclose_http_client
+
+    await aclose_http_client()
+
     # SecVault 데몬 종료
     vault_proc = _app_state.get("vault_process")
     if vault_proc:
         stop_daemon(vault_proc)
 
     _app_state.clear()
+    app.state.resources = _NO_RESOURCES
     logger.info("web_app_shutdown")
 
 
@@ -1043,67 +1570,274 @@ def get_app_state() -> dict[str, Any]:  # [JS-W001.2]
     return _app_state
 
 
+# /api 라우터 (모듈, 경로 접두어, OpenAPI 태그) - 이 순서대로 등록
+_API_ROUTERS: tuple[tuple[str, str, str], ...] = (
+    ("jedisos.web.api.chat", "/api/chat", "chat"),
+    ("jedisos.web.api.settings", "/api/settings", "settings"),
+    ("jedisos.web.api.mcp", "/api/mcp", "mcp"),
+    ("jedisos.web.api.skills", "/api/skills", "skills"),
+    ("jedisos.web.api.monitoring", "/api/monitoring", "monitoring"),
+    ("jedisos.web.setup_wizard", "/api/setup", "setup"),
+    ("jedisos.web.api.vault", "/api/vault", "vault"),
+)
+
+
+def _preload_modules() -> None:  # [JS-W001.28]
+    """gunicorn --preload 부모에서 무거운 모듈을 미리 import합니다.
+
+    메모리(zvecsearch와 임베딩 라이브러리)와 litellm의 모듈 페이지를 fork 전에 올려
+    워커들이 copy-on-write로 공유합니다. 임베딩 가중치 로딩은 zvecsearch가
+    ZvecMemory 생성 시 하므로 워커별로 남습니다.
+    """
+    from jedisos.llm.cost_map import use_local_cost_map
+
+    # litellm import 시 원격 비용 맵 fetch를 끈 상태로 import (워커가 갱신 담당)
+    use_local_cost_map()
+    for name in ("jedisos.llm.router", "jedisos.memory.zvec_memory"):
+        try:
+            importlib.import_module(name)
+        except ImportError as e:
+            logger.warning("web_preload_failed", module=name, error=str(e))
+    logger.info("web_modules_preloaded")
+
+
+def _warm_routes(routes: list[Any]) -> int:  # [JS-W001.23]
+    """include_router로 등록된 라우트의 경로 정규식/Dependant를 미리 만듭니다.
+
+    FastAPI 0.13x부터 include_router는 라우터를 지연 포함하고, 첫 요청이 매칭될 때
+    라우트 컨텍스트(경로 컴파일, 의존성 트리, 핸들러)를 만듭니다. 워커 시작 시
+    한 번 만들어 두면 첫 요청들의 지연이 튀지 않습니다. 예전 버전처럼 APIRoute가
+    이미 즉시 생성되어 있으면 할 일이 없습니다.
+
+    Returns:
+        미리 만든 라우트 컨텍스트 수
+    """
+    warmed = 0
+    for route in routes:
+        build = getattr(route, "effective_candidates", None)
+        if build is None:
+            continue
+        candidates = build()
+        route.effective_low_priority_routes()
+        warmed += len(candidates)
+        # 중첩 포함된 라우터도 같은 방식으로 처리
+        warmed += _warm_routes(candidates)
+    return warmed
+
+
 def create_app() -> FastAPI:  # [JS-W001.3]
-    """FastAPI 앱을 생성하고 라우터를 등록합니다."""
+    """FastAPI 앱을 생성하고 라우터를 등록합니다.
+
+    JEDISOS_ENV=prod이면 OpenAPI 스키마와 /docs, /redoc을 끕니다.
+    JEDISOS_LOG_FORMAT=json이면 워커의 structlog 출력을 orjson JSON으로 설정합니다.
+    프록시(nginx/envoy)가 CORS를 처리하는 운영 배포는 JEDISOS_CORS=off로 CORS
+    미들웨어 계층을 빼는 것을 권장합니다.
+    JEDISOS_PRELOAD=1(gunicorn --preload 실행 시 설정됨)이면 무거운 모듈을 미리 import합니다.
+    """
+    from jedisos.core.log_config import configure_logging
+
+    configure_logging()
+    if os.environ.get("JEDISOS_PRELOAD") == "1":
+        _preload_modules()
+
+    docs: dict[str, Any] = {}
+    if os.environ.get("JEDISOS_ENV", "dev").lower() == "prod":
+        docs = {"openapi_url": None, "docs_url": None, "redoc_url": None}
+
     app = FastAPI(
         title="JediSOS",
         description="AI Agent System with zvecsearch Memory",
         version=__version__,
         lifespan=lifespan,
+        default_response_class=OrjsonResponse,
+        **docs,
     )
 
-    # CORS 설정 (로컬 개발용)
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"],
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
+    # 요청 ID (CORS 안쪽 - preflight 단락 응답에는 붙지 않음)
+    app.add_middleware(RequestIDMiddleware)
+
+    # CORS 설정 (로컬 개발용) - 리버스 프록시가 CORS를 처리하면 JEDISOS_CORS=off
+    if os.environ.get("JEDISOS_CORS", "on").lower() != "off":
+        app.add_middleware(
+            FastCORSMiddleware,
+            allow_origins=["*"],
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        )
+
+    # 응답 압축 (512바이트 이상 JSON/JS/CSS/HTML). WebSocket 프레임은 대상 아님 -
+    # 리버스 프록시가 압축하면 JEDISOS_GZIP=off
+    if os.environ.get("JEDISOS_GZIP", "on").lower() != "off":
+        from starlette.middleware.gzip import GZipMiddleware
+
+        app.add_middleware(GZipMiddleware, minimum_size=512)
 
     # 라우터 등록
-    from jedisos.web.api.chat import router as chat_router
-    from jedisos.web.api.mcp import router as mcp_router
-    from jedisos.web.api.monitoring import router as monitoring_router
-    from jedisos.web.api.settings import router as settings_router
-    from jedisos.web.api.skills import router as skills_router
-    from jedisos.web.api.vault import router as vault_router
-    from jedisos.web.setup_wizard import router as wizard_router
-
-    app.include_router(chat_router, prefix="/api/chat", tags=["chat"])
-    app.include_router(settings_router, prefix="/api/settings", tags=["settings"])
-    app.include_router(mcp_router, prefix="/api/mcp", tags=["mcp"])
-    app.include_router(skills_router, prefix="/api/skills", tags=["skills"])
-    app.include_router(monitoring_router, prefix="/api/monitoring", tags=["monitoring"])
-    app.include_router(wizard_router, prefix="/api/setup", tags=["setup"])
-    app.include_router(vault_router, prefix="/api/vault", tags=["vault"])
+    for module, prefix, tag in _API_ROUTERS:
+        app.include_router(importlib.import_module(module).router, prefix=prefix, tags=[tag])
 
     @app.get("/", response_class=HTMLResponse)
-    async def serve_index(request: Request) -> HTMLResponse:  # [JS-W001.6]
-        """메인 웹 UI를 렌더링합니다."""
-        return _templates.TemplateResponse(request, "index.html", {"version": __version__})
+    async def serve_index() -> HTMLResponse:  # [JS-W001.6]
+        """메인 웹 UI를 반환합니다 (첫 요청에서 렌더링한 HTML 캐시)."""
+        return HTMLResponse(_index_html())
+
+    # 헬스 체크는 미리 인코딩한 응답을 ASGI 수준에서 바로 전송
+    app.router.routes.append(Route("/health", _HealthCheck(), methods=["GET"]))
 
-    @app.get("/health")
-    async def health_check() -> JSONResponse:  # [JS-W001.4]
-        """헬스 체크 엔드포인트."""
-        return JSONResponse({"status": "ok", "version": __version__})
+    # Prometheus 스크랩용 - lifespan의 백그라운드 태스크가 버퍼를 갱신
+    app.state.metrics = _MetricsEndpoint()
+    app.router.routes.append(Route("/metrics", app.state.metrics, methods=["GET"]))
 
     # 정적 파일 서빙 (/api/* 라우터보다 뒤에 마운트하여 API 경로 우선)
-    app.mount("/static", StaticFiles(directory=str(_WEB_DIR / "static")), name="static")
+    app.mount("/static", _VersionedStaticFiles(directory=str(_WEB_DIR / "static")), name="static")
+
+    _warm_routes(app.router.routes)
 
     logger.info("web_app_created")
     return app
 
 
-def run_server(host: str = "0.0.0.0", port: int = 8866) -> None:  # [JS-W001.5]  # nosec B104
-    """uvicorn으로 서버를 실행합니다."""
+def _uvicorn_impl_options() -> dict[str, str]:  # [JS-W001.15]
+    """uvicorn 이벤트 루프/HTTP/WebSocket 구현을 명시적으로 선택합니다.
+
+    uvicorn[standard]가 설치한 uvloop, httptools, websockets가 있으면 사용하고,
+    Windows이거나 패키지가 없으면 uvicorn 기본값(auto)으로 둡니다.
+    """
+    from importlib.util import find_spec
+
+    options = {"loop": "auto", "http": "auto", "ws": "auto"}
+    if sys.platform != "win32" and find_spec("uvloop") is not None:
+        options["loop"] = "uvloop"
+    if find_spec("httptools") is not None:
+        options["http"] = "httptools"
+    if find_spec("websockets") is not None:
+        options["ws"] = "websockets"
+    return options
+
+
+def _install_uring_policy() -> bool:  # [JS-W001.16]
+    """JEDISOS_EVENT_LOOP=uring이면 io_uring 기반 이벤트 루프 정책을 설치합니다.
+
+    Linux 커널 5.11 이상 + uringcore 패키지가 있어야 하며 (기본 의존성 아님),
+    조건이 맞지 않으면 False를 반환해 uvloop/기본 루프를 그대로 사용합니다.
+    """
+    if os.environ.get("JEDISOS_EVENT_LOOP", "").lower() != "uring":
+        return False
+    if sys.platform != "linux":
+        logger.warning("uring_loop_unsupported", platform=sys.platform)
+        return False
+
+    import platform
+
+    m = re.match(r"(\d+)\.(\d+)", platform.release())
+    if not m or (int(m.group(1)), int(m.group(2))) < (5, 11):
+        logger.warning("uring_loop_kernel_too_old", kernel=platform.release())
+        return False
+
+    try:
+        import uringcore  # type: ignore[import-not-found]
+    except ImportError:
+        logger.warning("uring_loop_unavailable", reason="uringcore not installed")
+        return False
+
+    asyncio.set_event_loop_policy(uringcore.EventLoopPolicy())
+    return True
+
+
+def _gunicorn_preload_command(  # [JS-W001.22]
+    bind: str, workers: int, access_log: bool = False
+) -> list[str]:
+    """부모에서 앱을 한 번 import한 뒤 fork하는 gunicorn --preload 명령을 만듭니다.
+
+    bind는 gunicorn 주소 형식입니다 ("host:port", "unix:/path", "fd://N").
+    """
+    access = ["--access-logfile", "-"] if access_log else []
+    return [
+        sys.executable,
+        "-m",
+        "gunicorn",
+        "jedisos.web.app:create_app()",
+        "--preload",
+        "-k",
+        "uvicorn.workers.UvicornWorker",
+        "-w",
+        str(workers),
+        "-b",
+        bind,
+        *access,
+    ]
+
+
+def run_server(  # [JS-W001.5]
+    host: str = "0.0.0.0",  # nosec B104
+    port: int = 8866,
+    workers: int = 1,
+    uds: str | None = None,
+    fd: int | None = None,
+    access_log: bool | None = None,
+) -> None:
+    """uvicorn으로 서버를 실행합니다.
+
+    access_log를 지정하지 않으면 JEDISOS_ENV=prod에서는 요청별 액세스 로그를 끄고
+    (리버스 프록시 로그 사용), 개발 환경에서는 켭니다.
+
+    같은 호스트의 리버스 프록시(nginx/envoy) 뒤에서는 TCP 대신 UNIX 도메인 소켓
+    바인딩을 권장합니다: `JEDISOS_UDS=/run/jedisos.sock` (또는 uds 인자).
+    systemd 소켓 활성화에서는 fd에 전달받은 파일 디스크립터 번호를 넘깁니다.
+    uds/fd가 있으면 host/port는 무시됩니다.
+
+    JEDISOS_EVENT_LOOP=uring을 설정하면 Linux 5.11+에서 uringcore의 io_uring 루프를
+    사용합니다 (uringcore 별도 설치 필요). 사용할 수 없으면 uvloop로 대체합니다.
+
+    workers > 1이고 gunicorn이 설치되어 있으면 `--preload`로 실행해 라우터 모듈,
+    pydantic 모델, litellm/메모리 모듈을 부모에서 한 번만 import하고 워커가
+    copy-on-write로 공유합니다.
+    gunicorn이 없으면 uvicorn 멀티 워커로 실행합니다 (워커마다 import).
+    """
     import uvicorn
 
-    logger.info("web_server_starting", host=host, port=port)
+    uds = uds or os.environ.get("JEDISOS_UDS") or None
+    if access_log is None:
+        access_log = os.environ.get("JEDISOS_ENV", "dev").lower() != "prod"
+    bind: dict[str, Any] = {"host": host, "port": port}
+    if fd is not None:
+        bind = {"fd": fd}
+    elif uds:
+        bind = {"uds": uds}
+
+    if workers > 1:
+        from importlib.util import find_spec
+
+        if sys.platform != "win32" and find_spec("gunicorn") is not None:
+            import subprocess  # nosec B404
+
+            if fd is not None:
+                address = f"fd://{fd}"
+            elif uds:
+                address = f"unix:{uds}"
+            else:
+                address = f"{host}:{port}"
+            logger.info("web_server_starting", **bind, workers=workers, preload=True)
+            subprocess.run(  # nosec B603
+                _gunicorn_preload_command(address, workers, access_log),
+                check=True,
+                env={**os.environ, "JEDISOS_PRELOAD": "1"},
+            )
+            return
+        logger.warning("gunicorn_not_installed_no_preload", workers=workers)
+
+    impl = _uvicorn_impl_options()
+    if _install_uring_policy():
+        # uvicorn이 설치된 정책을 덮어쓰지 않도록 루프 선택을 끔
+        impl["loop"] = "none"
+    logger.info("web_server_starting", **bind, workers=workers, **impl)
     uvicorn.run(
         "jedisos.web.app:create_app",
         factory=True,
-        host=host,
-        port=port,
+        **bind,
+        workers=workers,
         log_level="info",
+        access_log=access_log,
+        **impl,
     )
@@ -0,0 +1,46 @@
+"""
+[JS-W014] jedisos.web.fileio
+설정 파일 원자적 쓰기 헬퍼
+
+version: 1.1.0
+created: 2026-10-17
+modified: 2026-10-17
+dependencies: 없음 (표준 라이브러리)
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def atomic_write_bytes(path: Path, data: bytes, mode: int = 0o644) -> None:  # [JS-W014.1]
+    """같은 디렉토리의 임시 파일에 쓴 뒤 os.replace로 교체합니다.
+
+    동시에 읽는 쪽은 이전 내용 또는 새 내용 전체만 보게 됩니다.
+    fsync는 하지 않습니다 (설정 파일은 크래시 내구성보다 부분 읽기 방지가 목적).
+    버퍼/인코더 계층 없이 os.write로 직접 기록합니다.
+    교체 시 mtime이 바뀌므로 mtime 기반 캐시는 자동으로 무효화됩니다.
+    """
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def atomic_write_text(path: Path, text: str, mode: int = 0o644) -> None:  # [JS-W014.2]
+    """문자열을 UTF-8로 인코딩해 원자적으로 씁니다."""
+    atomic_write_bytes(path, text.encode("utf-8"), mode)
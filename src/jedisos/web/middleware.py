@@ -0,0 +1,205 @@
+"""
+[JS-W015] jedisos.web.middleware
+순수 ASGI 미들웨어 (CORS, 요청 ID) - 헤더 바이트를 미리 인코딩해 요청당 객체 생성 최소화
+
+version: 1.2.0
+created: 2026-10-17
+modified: 2026-10-17
+dependencies: 없음 (ASGI 인터페이스만 사용)
+"""
+
+from __future__ import annotations
+
+import uuid
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Collection, MutableMapping
+
+    Scope = MutableMapping[str, Any]
+    Message = MutableMapping[str, Any]
+    Receive = Callable[[], Awaitable[Message]]
+    Send = Callable[[Message], Awaitable[None]]
+    ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+_ALL_METHODS = ("DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT")
+_SAFELISTED_HEADERS = frozenset({"accept", "accept-language", "content-language", "content-type"})
+_PREFLIGHT_VARY = b"Origin, Access-Control-Request-Method, Access-Control-Request-Headers"
+# 완성된 preflight 응답 캐시 크기 (origin/method/headers 조합 수, 임의 입력 폭주 방지)
+_PREFLIGHT_CACHE_SIZE = 256
+
+
+class FastCORSMiddleware:  # [JS-W015.1]
+    """Starlette CORSMiddleware와 같은 정책을 scope/send 수준에서 처리합니다.
+
+    Origin 헤더가 없는 요청(같은 출처의 웹 UI 요청 등)은 send 래핑 없이 그대로
+    통과시키고, 응답 헤더는 생성 시 bytes로 미리 만들어 둡니다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        allow_origins: Collection[str] = (),
+        allow_methods: Collection[str] = ("GET",),
+        allow_headers: Collection[str] = (),
+        allow_credentials: bool = False,
+        max_age: int = 600,
+    ) -> None:
+        self.app = app
+        if "*" in allow_methods:
+            allow_methods = _ALL_METHODS
+        self.allow_all_origins = "*" in allow_origins
+        self.allow_all_headers = "*" in allow_headers
+        self.allow_credentials = allow_credentials
+        self.allow_origins = frozenset(o.encode("latin-1") for o in allow_origins)
+        self.allow_methods = frozenset(m.encode("latin-1") for m in allow_methods)
+        self.allow_headers = _SAFELISTED_HEADERS | {h.lower() for h in allow_headers}
+        # 자격 증명을 허용하거나 특정 출처만 허용하면 Origin을 그대로 반사해야 함
+        self.reflect_origin = allow_credentials or not self.allow_all_origins
+
+        simple: list[tuple[bytes, bytes]] = []
+        if allow_credentials:
+            simple.append((b"access-control-allow-credentials", b"true"))
+        self._simple_headers = simple
+
+        preflight: list[tuple[bytes, bytes]] = [
+            (b"vary", _PREFLIGHT_VARY),
+            (b"access-control-allow-methods", ", ".join(allow_methods).encode("latin-1")),
+            (b"access-control-max-age", str(max_age).encode("latin-1")),
+        ]
+        if not self.allow_all_headers:
+            value = ", ".join(sorted(self.allow_headers)).encode("latin-1")
+            preflight.append((b"access-control-allow-headers", value))
+        if allow_credentials:
+            preflight.append((b"access-control-allow-credentials", b"true"))
+        self._preflight_headers = preflight
+        self._preflight_cache: dict[
+            tuple[bytes, bytes, bytes | None], tuple[int, list[tuple[bytes, bytes]], bytes]
+        ] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = request_method = request_headers = None
+        for key, value in scope["headers"]:
+            if key == b"origin":
+                origin = value
+            elif key == b"access-control-request-method":
+                request_method = value
+            elif key == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self._preflight(origin, request_method, request_headers, send)
+            return
+
+        allowed = self._is_allowed_origin(origin)
+        extra = list(self._simple_headers)
+        if self.allow_all_origins and not self.allow_credentials:
+            extra.append((b"access-control-allow-origin", b"*"))
+        elif allowed:
+            extra.append((b"access-control-allow-origin", origin))
+            extra.append((b"vary", b"Origin"))
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *extra]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    def _is_allowed_origin(self, origin: bytes) -> bool:  # [JS-W015.2]
+        """요청 Origin이 허용 목록에 있는지 확인합니다."""
+        return self.allow_all_origins or origin in self.allow_origins
+
+    async def _preflight(  # [JS-W015.3]
+        self,
+        origin: bytes,
+        request_method: bytes,
+        request_headers: bytes | None,
+        send: Send,
+    ) -> None:
+        """OPTIONS preflight 요청에 앱을 거치지 않고 바로 응답합니다.
+
+        브라우저는 같은 조합의 preflight를 반복해 보내므로 완성된 응답을 캐시합니다.
+        """
+        key = (origin, request_method, request_headers)
+        cached = self._preflight_cache.get(key)
+        if cached is None:
+            cached = self._build_preflight(origin, request_method, request_headers)
+            if len(self._preflight_cache) >= _PREFLIGHT_CACHE_SIZE:
+                self._preflight_cache.clear()
+            self._preflight_cache[key] = cached
+        status, headers, body = cached
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+    def _build_preflight(  # [JS-W015.4]
+        self,
+        origin: bytes,
+        request_method: bytes,
+        request_headers: bytes | None,
+    ) -> tuple[int, list[tuple[bytes, bytes]], bytes]:
+        """preflight 응답의 상태 코드, 헤더, 본문을 만듭니다."""
+        headers = list(self._preflight_headers)
+        failures: list[str] = []
+
+        if self._is_allowed_origin(origin):
+            headers.append(
+                (b"access-control-allow-origin", origin if self.reflect_origin else b"*")
+            )
+        else:
+            failures.append("origin")
+
+        if request_method not in self.allow_methods:
+            failures.append("method")
+
+        if request_headers is not None:
+            if self.allow_all_headers:
+                headers.append((b"access-control-allow-headers", request_headers))
+            else:
+                requested = request_headers.decode("latin-1").lower().split(",")
+                if any(h.strip() not in self.allow_headers for h in requested):
+                    failures.append("headers")
+
+        if failures:
+            status, body = 400, ("Disallowed CORS " + ", ".join(failures)).encode()
+        else:
+            status, body = 200, b"OK"
+        headers.append((b"content-type", b"text/plain; charset=utf-8"))
+        headers.append((b"content-length", str(len(body)).encode("latin-1")))
+        return status, headers, body
+
+
+class RequestIDMiddleware:  # [JS-W015.5]
+    """요청마다 ID를 만들어 scope["state"]["request_id"]에 두고 응답 헤더로 돌려줍니다.
+
+    Request 객체나 FastAPI 의존성 없이 scope 수준에서 처리합니다. ID는 16바이트
+    uuid4 bytes이며 (핸들러에서는 request.state.request_id), 응답의
+    x-request-id 헤더에는 hex 문자열로 씁니다.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = uuid.uuid4().bytes
+        scope.setdefault("state", {})["request_id"] = request_id
+        header = (b"x-request-id", request_id.hex().encode("ascii"))
+
+        async def send_with_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), header]
+            await send(message)
+
+        await self.app(scope, receive, send_with_id)
@@ -0,0 +1,27 @@
+"""
+[JS-W013] jedisos.web.responses
+orjson 기반 JSON 응답 클래스
+
+version: 1.0.0
+created: 2026-10-17
+modified: 2026-10-17
+dependencies: fastapi>=0.115, orjson>=3.10
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class OrjsonResponse(JSONResponse):  # [JS-W013.1]
+    """orjson으로 본문을 직렬화하는 JSONResponse.
+
+    라우터의 default_response_class로 사용합니다. FastAPI 내장 ORJSONResponse는
+    최신 버전에서 deprecated 경고를 내므로 동일 동작을 직접 정의합니다.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
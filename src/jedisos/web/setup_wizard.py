@@ -2,9 +2,9 @@
 [JS-W006] jedisos.web.setup_wizard
 첫 실행 Setup Wizard API
 
-version: 1.0.0
+version: 1.1.0
 created: 2026-02-18
-modified: 2026-02-18
+modified: 2026-10-17
 dependencies: fastapi>=0.115
 """
 
@@ -18,12 +18,15 @@ import structlog
 from fastapi import APIRouter
 from pydantic import BaseModel
 
+from jedisos.web.fileio import atomic_write_text
+
 logger = structlog.get_logger()
 
 router = APIRouter()
 
 _DATA_DIR = Path(os.environ.get("JEDISOS_DATA_DIR", "."))
 _ENV_PATH = _DATA_DIR / ".env"
+_ENV_FILE_MODE = 0o600  # API 키 보호
 _CONFIG_DIR = Path(os.environ.get("JEDISOS_CONFIG_DIR", str(_DATA_DIR / "config")))
 
 
@@ -96,7 +99,7 @@ async def complete_setup(request: SetupRequest) -> dict[str, str]:
     env_lines = _update_env_line(env_lines, "SLACK_APP_TOKEN", request.slack_app_token)
     env_lines = _update_env_line(env_lines, "JEDISOS_FIRST_RUN", "false")
 
-    _ENV_PATH.write_text("\n".join(env_lines) + "\n")
+    atomic_write_text(_ENV_PATH, "\n".join(env_lines) + "\n", _ENV_FILE_MODE)
 
     # 2. llm_config.yaml 생성
     models = request.models or ["gpt-5.2", "gemini/gemini-3-flash"]
@@ -107,7 +110,7 @@ async def complete_setup(request: SetupRequest) -> dict[str, str]:
     for m in models:
         lines.append(f"  - {m}\n")
     lines.append("\ntemperature: 0.7\nmax_tokens: 8192\ntimeout: 60\n")
-    llm_config_path.write_text("".join(lines))
+    atomic_write_text(llm_config_path, "".join(lines))
 
     # 3. 현재 프로세스 환경변수에도 반영 (재시작 없이 즉시 적용)
     if request.openai_api_key:
@@ -216,6 +216,31 @@ class TestCLIServe:  # [JS-T010.6]
             assert result.exit_code == 0
             assert "9090" in result.output
 
+    def test_serve_uds_omits_tcp_urls(self, monkeypatch):
+        monkeypatch.delenv("JEDISOS_UDS", raising=False)
+        with patch("jedisos.web.app.run_server"):
+            result = runner.invoke(app, ["serve", "--uds", "/tmp/j.sock"])
+            assert result.exit_code == 0
+            assert "/tmp/j.sock" in result.output
+            assert "http://" not in result.output
+
+    def test_serve_fd_omits_tcp_urls(self, monkeypatch):
+        monkeypatch.delenv("JEDISOS_UDS", raising=False)
+        with patch("jedisos.web.app.run_server"):
+            result = runner.invoke(app, ["serve", "--fd", "3"])
+            assert result.exit_code == 0
+            assert "fd 3" in result.output
+            assert "http://" not in result.output
+
+    def test_serve_prod_omits_docs_url(self, monkeypatch):
+        monkeypatch.delenv("JEDISOS_UDS", raising=False)
+        monkeypatch.setenv("JEDISOS_ENV", "prod")
+        with patch("jedisos.web.app.run_server"):
+            result = runner.invoke(app, ["serve"])
+            assert result.exit_code == 0
+            assert "웹 UI" in result.output
+            assert "/docs" not in result.output
+
 
 class TestCLIUpdate:  # [JS-T010.7]
     """업데이트 명령 테스트."""
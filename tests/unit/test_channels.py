@@ -11,7 +11,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from jedisos.channels.telegram import TelegramChannel
+from jedisos.channels.telegram import TelegramChannel, _telegram_chat_ids
 from jedisos.core.config import LLMConfig, MemoryConfig, SecurityConfig
 from jedisos.core.envelope import Envelope
 from jedisos.core.exceptions import ChannelError
@@ -205,6 +205,7 @@ class TestHandleMessage:  # [JS-T009.4]
         ):
             await channel._handle_message(update, context)
             update.message.reply_text.assert_called_once()
+        assert 12345 in _telegram_chat_ids
 
     @pytest.mark.asyncio
     async def test_handle_message_no_user(self, channel):
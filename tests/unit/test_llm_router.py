@@ -6,6 +6,7 @@ version: 1.0.0
 created: 2026-02-16
 """
 
+import os
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -179,3 +180,60 @@ class TestYAMLConfigChange:  # [JS-T004.5]
         )
         router2 = LLMRouter(LLMConfig(config_file=str(yaml_v2)))
         assert router2.models == ["model-b", "model-a", "model-c"]
+
+
+class TestCostMapCache:  # [JS-T004.6]
+    def test_use_local_respects_explicit_env(self, monkeypatch):
+        from jedisos.llm import cost_map
+        from jedisos.llm.cost_map import use_local_cost_map
+
+        monkeypatch.setattr(cost_map, "_env_owned", False)
+        monkeypatch.setenv("LITELLM_LOCAL_MODEL_COST_MAP", "False")
+        assert use_local_cost_map() is False
+
+        monkeypatch.delenv("LITELLM_LOCAL_MODEL_COST_MAP")
+        assert use_local_cost_map() is True
+        assert os.environ["LITELLM_LOCAL_MODEL_COST_MAP"] == "True"
+        # 같은 프로세스(또는 fork된 워커)의 두 번째 호출도 갱신 담당
+        assert use_local_cost_map() is True
+
+    def test_load_cached_cost_map(self, tmp_path):
+        from jedisos.llm.cost_map import load_cached_cost_map
+
+        cache = tmp_path / "llm_cost_map.json"
+        assert load_cached_cost_map(cache) == 0
+
+        cache.write_text('{"my-model": {"litellm_provider": "openai", "mode": "chat"}}')
+        with patch("litellm.register_model") as register:
+            assert load_cached_cost_map(cache) == 1
+        register.assert_called_once()
+
+        cache.write_text("{broken")
+        assert load_cached_cost_map(cache) == 0
+
+    async def test_refresh_failure_keeps_stale_cache(self, tmp_path):
+        import httpx
+
+        from jedisos.llm.cost_map import refresh_cost_map
+
+        cache = tmp_path / "llm_cost_map.json"
+        cache.write_text('{"old": {}}')
+        with patch("httpx.AsyncClient.get", AsyncMock(side_effect=httpx.ConnectError("down"))):
+            assert await refresh_cost_map(cache) is False
+        assert cache.read_text() == '{"old": {}}'
+
+    async def test_refresh_writes_cache(self, tmp_path):
+        import httpx
+
+        from jedisos.llm.cost_map import refresh_cost_map
+
+        cache = tmp_path / "cache" / "llm_cost_map.json"
+        body = b'{"new-model": {"litellm_provider": "openai", "mode": "chat"}}'
+        resp = httpx.Response(200, content=body, request=httpx.Request("GET", "https://x"))
+        with (
+            patch("httpx.AsyncClient.get", AsyncMock(return_value=resp)),
+            patch("litellm.register_model") as register,
+        ):
+            assert await refresh_cost_map(cache) is True
+        assert cache.read_bytes() == body
+        register.assert_called_once()
@@ -802,13 +802,9 @@ class TestMCPRegistrySearch:  # [JS-T007.10]
             ]
         }
 
-        with patch("jedisos.mcp.registry.httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.get = AsyncMock(return_value=mock_resp)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_cls.return_value = mock_client
-
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(return_value=mock_resp)
+        with patch("jedisos.mcp.registry._http_client", return_value=mock_client):
             results = await search_npm("weather")
 
         assert len(results) == 1
@@ -821,17 +817,25 @@ class TestMCPRegistrySearch:  # [JS-T007.10]
         """npm API 오류 시 빈 결과 반환 (에러 아님)."""
         from jedisos.mcp.registry import search_npm
 
-        with patch("jedisos.mcp.registry.httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.get = AsyncMock(side_effect=httpx.ConnectError("timeout"))
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_cls.return_value = mock_client
-
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(side_effect=httpx.ConnectError("timeout"))
+        with patch("jedisos.mcp.registry._http_client", return_value=mock_client):
             results = await search_npm("weather")
 
         assert results == []
 
+    @pytest.mark.asyncio
+    async def test_http_client_shared_within_loop(self):
+        """같은 이벤트 루프에서는 검색 HTTP 클라이언트(연결 풀)를 재사용."""
+        from jedisos.mcp import registry
+
+        client = registry._http_client()
+        assert registry._http_client() is client
+        await registry.aclose_http_client()
+        assert client.is_closed
+        assert registry._http_client() is not client
+        await registry.aclose_http_client()
+
     @pytest.mark.asyncio
     async def test_search_all_registry(self):
         """search_all(source='registry')가 통합 결과를 반환."""
@@ -158,6 +158,15 @@ class TestPDPDynamicPolicy:  # [JS-T008.5]
         assert "shell_exec" in summary["blocked_tools"]
         assert summary["max_requests_per_minute"] == 30
 
+    def test_policy_summary_cached_until_mutation(self, pdp):
+        first = pdp.get_policy_summary()
+        assert pdp.get_policy_summary() is first
+
+        pdp.add_blocked_tool("new_tool")
+        updated = pdp.get_policy_summary()
+        assert updated is not first
+        assert "new_tool" in updated["blocked_tools"]
+
 
 class TestAuditLogger:  # [JS-T008.6]
     def test_log_tool_call_allowed(self, audit):
@@ -182,7 +191,9 @@ class TestAuditLogger:  # [JS-T008.6]
         for i in range(10):
             audit.log_tool_call(tool_name=f"tool_{i}", allowed=True)
         recent = audit.get_recent(5)
-        assert len(recent) == 5
+        assert [e["tool"] for e in recent] == [f"tool_{i}" for i in range(5, 10)]
+        assert len(audit.get_recent(50)) == 10
+        assert audit.get_recent(0) == []
 
     def test_get_by_user(self, audit):
         audit.log_tool_call(tool_name="echo", user_id="alice", allowed=True)
@@ -197,6 +208,7 @@ class TestAuditLogger:  # [JS-T008.6]
         for i in range(10):
             audit.log_tool_call(tool_name=f"tool_{i}", allowed=True)
         assert audit.entry_count == 5
+        assert audit.get_recent(5)[0]["tool"] == "tool_5"
 
     def test_clear(self, audit):
         audit.log_tool_call(tool_name="echo", allowed=True)
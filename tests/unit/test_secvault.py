@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import json
 from typing import TYPE_CHECKING
 
 import pytest
@@ -24,7 +25,7 @@ from jedisos.security.secvault import (
     find_secdata_markers,
     has_secdata,
 )
-from jedisos.security.secvault_daemon import SecVaultDaemon
+from jedisos.security.secvault_daemon import FrameWriter, SecVaultDaemon
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -239,12 +240,14 @@ class TestSecVaultDaemon:  # [JS-T015.5]
         d = self._make_daemon(tmp_path)
         d._handle_setup("password")
 
-        enc_result = d._handle_encrypt("비밀 데이터")
+        enc_result = json.loads(
+            d._dispatch_frame({"op": "encrypt", "data": "비밀 데이터"}, FrameWriter())
+        )
         assert enc_result["ok"] is True
         marker = enc_result["data"]
         assert marker.startswith("[[SECDATA:")
 
-        dec_result = d._handle_decrypt(marker)
+        dec_result = json.loads(d._dispatch_frame({"op": "decrypt", "data": marker}, FrameWriter()))
         assert dec_result["ok"] is True
         assert dec_result["data"] == "비밀 데이터"
 
@@ -253,10 +256,29 @@ class TestSecVaultDaemon:  # [JS-T015.5]
         d._handle_setup("password")
         d._handle_lock()
 
-        result = d._handle_encrypt("data")
+        result = json.loads(d._dispatch_frame({"op": "encrypt", "data": "data"}, FrameWriter()))
         assert result["ok"] is False
         assert "잠겨" in result["error"]
 
+    def test_decrypt_invalid_marker(self, tmp_path: Path) -> None:
+        d = self._make_daemon(tmp_path)
+        d._handle_setup("password")
+
+        result = json.loads(
+            d._dispatch_frame({"op": "decrypt", "data": "bad", "request_id": "x"}, FrameWriter())
+        )
+        assert result["ok"] is False
+        assert result["error"]
+        assert result["request_id"] == "x"
+
+    def test_dispatch_rejects_crypto_ops(self, tmp_path: Path) -> None:
+        d = self._make_daemon(tmp_path)
+        d._handle_setup("password")
+
+        result = d._dispatch({"op": "encrypt", "data": "x", "request_id": "r"})
+        assert result["ok"] is False
+        assert "알 수 없는" in result["error"]
+
     def test_status_response(self, tmp_path: Path) -> None:
         d = self._make_daemon(tmp_path)
         result = d._handle_status()
@@ -270,6 +292,42 @@ class TestSecVaultDaemon:  # [JS-T015.5]
         assert "알 수 없는" in result["error"]
         assert result["request_id"] == "test-1"
 
+    async def test_respond_crypto_pool(self, tmp_path: Path) -> None:
+        d = self._make_daemon(tmp_path)
+        d._handle_setup("password")
+
+        enc = json.loads(
+            await d._respond({"op": "encrypt", "data": "풀 데이터", "request_id": "e1"})
+        )
+        assert enc["ok"] is True
+        assert enc["request_id"] == "e1"
+
+        dec = json.loads(
+            await d._respond({"op": "decrypt", "data": enc["data"], "request_id": "d1"})
+        )
+        assert dec["data"] == "풀 데이터"
+
+    async def test_respond_crypto_while_locked(self, tmp_path: Path) -> None:
+        d = self._make_daemon(tmp_path)
+        d._handle_setup("password")
+        d._handle_lock()
+
+        resp = json.loads(await d._respond({"op": "decrypt", "data": "x", "request_id": "r"}))
+        assert resp == {"ok": False, "error": resp["error"], "request_id": "r"}
+        assert "잠겨" in resp["error"]
+
+    def test_frame_writer_escapes_fields(self) -> None:
+        fw = FrameWriter()
+        fw.start()
+        fw.field("ok", True)
+        fw.field("data", 'quote " \\ 줄바꿈\n')
+        fw.raw_field("request_id", "abc-123")
+        assert json.loads(fw.end()) == {
+            "ok": True,
+            "data": 'quote " \\ 줄바꿈\n',
+            "request_id": "abc-123",
+        }
+
     def test_lockout_after_max_attempts(self, tmp_path: Path) -> None:
         d = self._make_daemon(tmp_path)
         d._handle_setup("correct")
@@ -6,14 +6,17 @@ version: 1.0.0
 created: 2026-02-18
 """
 
+import json
+import os
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import yaml
 from fastapi.testclient import TestClient
 
 from jedisos import __version__
-from jedisos.web.app import create_app
+from jedisos.web.app import AppResources, create_app
 
 
 @pytest.fixture
@@ -35,6 +38,11 @@ class TestHealthCheck:  # [JS-T011.1]
         data = resp.json()
         assert data["status"] == "ok"
         assert data["version"] == __version__
+        assert resp.headers["content-type"] == "application/json"
+
+    def test_health_head_and_method_not_allowed(self, client):
+        assert client.head("/health").status_code == 200
+        assert client.post("/health").status_code == 405
 
     def test_openapi_docs(self, client):
         resp = client.get("/openapi.json")
@@ -62,6 +70,29 @@ class TestChatAPI:  # [JS-T011.2]
             assert data["response"] == "안녕하세요!"
             assert data["bank_id"] == "test-bank"
 
+    def test_websocket_stream_frames(self, client):
+        async def run_stream(message, bank_id, history):
+            for chunk in ('안녕 "제다이"', "\n끝"):
+                yield chunk
+
+        agent = MagicMock()
+        agent.run_stream = run_stream
+        with (
+            patch("jedisos.web.api.chat._load_history"),
+            patch("jedisos.web.api.chat._add_to_history"),
+            patch("jedisos.web.api.chat._get_history", return_value=[]),
+            patch("jedisos.web.api.chat._get_or_create_agent", return_value=agent),
+            client.websocket_connect("/api/chat/ws") as ws,
+        ):
+            ws.send_json({"message": "hi", "bank_id": "b"})
+            assert ws.receive_json() == {"type": "stream", "content": '안녕 "제다이"'}
+            assert ws.receive_json() == {"type": "stream", "content": "\n끝"}
+            assert ws.receive_json() == {
+                "type": "done",
+                "response": '안녕 "제다이"\n끝',
+                "bank_id": "b",
+            }
+
     def test_get_connections(self, client):
         resp = client.get("/api/chat/connections")
         assert resp.status_code == 200
@@ -77,18 +108,48 @@ class TestSettingsAPI:  # [JS-T011.3]
         assert "models" in data
         assert "temperature" in data
 
-    def test_get_llm_settings_with_state(self, client):
+    def test_get_llm_settings_with_state(self, app, client):
         mock_config = MagicMock()
         mock_config.llm.models = ["gpt-5.2", "gemini/gemini-3-flash"]
         mock_config.llm.temperature = 0.7
         mock_config.llm.max_tokens = 8192
         mock_config.llm.timeout = 60
 
-        with patch("jedisos.web.app._app_state", {"config": mock_config}):
-            resp = client.get("/api/settings/llm")
+        app.state.resources = AppResources(config=mock_config)
+        resp = client.get("/api/settings/llm")
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["models"] == ["gpt-5.2", "gemini/gemini-3-flash"]
+
+    def test_get_model_roles_cached_until_set(self, app, client, tmp_path):
+        class FakeRouter:
+            def __init__(self):
+                self.models = ["gpt-5.2"]
+                self.roles_version = 0
+                self.calls = 0
+                self._roles: dict[str, list[str]] = {}
+
+            def models_for(self, role):
+                self.calls += 1
+                return list(self._roles.get(role, []))
+
+            def set_role_models(self, mapping):
+                self._roles = dict(mapping)
+                self.roles_version += 1
+
+        llm = FakeRouter()
+        app.state.resources = AppResources(llm=llm)
+        with patch("jedisos.web.api.settings._DATA_DIR", tmp_path):
+            first = client.get("/api/settings/llm/roles").json()
+            client.get("/api/settings/llm/roles")
+            assert llm.calls == 5
+            assert first["roles"]["chat"] == []
+
+            resp = client.put("/api/settings/llm/roles", json={"roles": {"chat": ["gpt-5.2"]}})
             assert resp.status_code == 200
-            data = resp.json()
-            assert data["models"] == ["gpt-5.2", "gemini/gemini-3-flash"]
+            data = client.get("/api/settings/llm/roles").json()
+            assert data["roles"]["chat"] == ["gpt-5.2"]
+            assert llm.calls == 10
 
     def test_update_llm_settings(self, client, tmp_path):
         with patch("jedisos.web.api.settings._CONFIG_DIR", tmp_path):
@@ -100,11 +161,19 @@ class TestSettingsAPI:  # [JS-T011.3]
                 },
             )
             assert resp.status_code == 200
-            assert (tmp_path / "llm_config.yaml").exists()
+            saved = yaml.safe_load((tmp_path / "llm_config.yaml").read_text())
+            assert saved["models"] == ["gpt-5.2"]
+            assert saved["temperature"] == 0.5
+
+    def test_update_llm_settings_rejects_unknown_field(self, client, tmp_path):
+        with patch("jedisos.web.api.settings._CONFIG_DIR", tmp_path):
+            resp = client.put("/api/settings/llm", json={"temperature": 0.5, "top_p": 0.9})
+            assert resp.status_code == 422
+            assert not (tmp_path / "llm_config.yaml").exists()
 
     def test_get_env_keys(self, client, tmp_path):
         env_file = tmp_path / ".env"
-        env_file.write_text("OPENAI_API_KEY=sk-test\nDEBUG=false\n")
+        env_file.write_text("OPENAI_API_KEY=sk-test\n# LOG_LEVEL=INFO\n\n  DEBUG = false\n")
 
         with patch("jedisos.web.api.settings._ENV_PATH", env_file):
             resp = client.get("/api/settings/env")
@@ -112,6 +181,10 @@ class TestSettingsAPI:  # [JS-T011.3]
             data = resp.json()
             assert "known_keys" in data
             assert "OPENAI_API_KEY" in data["known_keys"]
+            assert data["configured"] == [
+                {"key": "OPENAI_API_KEY", "configured": True},
+                {"key": "DEBUG", "configured": True},
+            ]
 
     def test_update_env_allowed(self, client, tmp_path):
         env_file = tmp_path / ".env"
@@ -150,6 +223,27 @@ class TestSettingsAPI:  # [JS-T011.3]
             content = env_file.read_text()
             assert "TELEGRAM_BOT_TOKEN=123456:ABC-DEF" in content
 
+    def test_update_env_replaces_in_place(self, client, tmp_path):
+        env_file = tmp_path / ".env"
+        env_file.write_text("# 주석\nDEBUG=false\nLOG_LEVEL=INFO\n")
+        with patch("jedisos.web.api.settings._ENV_PATH", env_file):
+            client.put("/api/settings/env", json={"key": "DEBUG", "value": "C:\\path"})
+            assert env_file.read_text() == "# 주석\nDEBUG=C:\\path\nLOG_LEVEL=INFO\n"
+            assert env_file.stat().st_mode & 0o777 == 0o600
+
+    async def test_concurrent_env_updates_all_persist(self, tmp_path):
+        import asyncio
+
+        from jedisos.web.api.settings import EnvUpdate, update_env_var
+
+        env_file = tmp_path / ".env"
+        env_file.write_text("")
+        keys = ("DEBUG", "LOG_LEVEL", "OPENAI_API_KEY", "GOOGLE_API_KEY")
+        with patch("jedisos.web.api.settings._ENV_PATH", env_file):
+            await asyncio.gather(*(update_env_var(EnvUpdate(key=k, value="v")) for k in keys))
+            content = env_file.read_text()
+            assert all(f"{k}=v" in content for k in keys)
+
     def test_update_env_blocked(self, client):
         resp = client.put("/api/settings/env", json={"key": "DANGEROUS_KEY", "value": "bad"})
         assert resp.status_code == 400
@@ -184,6 +278,20 @@ class TestMCPAPI:  # [JS-T011.4]
             resp2 = client.get("/api/mcp/servers")
             assert resp2.json()["total"] == 1
 
+    def test_install_subprocess_server_fields(self, client, tmp_path):
+        config_path = tmp_path / "mcp.json"
+        with patch("jedisos.web.api.mcp._MCP_CONFIG_PATH", config_path):
+            client.post("/api/mcp/servers", json={"name": "remote", "url": "http://a"})
+            client.post(
+                "/api/mcp/servers",
+                json={"name": "local", "server_type": "subprocess", "command": "npx"},
+            )
+            saved = json.loads(config_path.read_text())
+            servers = {s["name"]: s for s in saved["servers"]}
+            assert "command" not in servers["remote"]
+            assert servers["local"]["command"] == "npx"
+            assert servers["local"]["enabled"] is True
+
     def test_install_duplicate(self, client, tmp_path):
         config_path = tmp_path / "mcp.json"
         with patch("jedisos.web.api.mcp._MCP_CONFIG_PATH", config_path):
@@ -217,6 +325,190 @@ class TestMCPAPI:  # [JS-T011.4]
             resp = client.put("/api/mcp/servers/nope/toggle")
             assert resp.status_code == 404
 
+    def test_config_cache_invalidated_on_external_edit(self, client, tmp_path):
+        config_path = tmp_path / "mcp.json"
+        with patch("jedisos.web.api.mcp._MCP_CONFIG_PATH", config_path):
+            client.post("/api/mcp/servers", json={"name": "cached", "url": "http://a"})
+            assert client.get("/api/mcp/servers").json()["total"] == 1
+
+            config_path.write_text('{"servers": []}')
+            assert client.get("/api/mcp/servers").json()["total"] == 0
+
+    def test_toggle_keeps_server_order(self, client, tmp_path):
+        from jedisos.web.api.mcp import _load_mcp_index
+
+        config_path = tmp_path / "mcp.json"
+        with patch("jedisos.web.api.mcp._MCP_CONFIG_PATH", config_path):
+            for name in ("a", "b", "c"):
+                client.post("/api/mcp/servers", json={"name": name, "url": "http://x"})
+            client.put("/api/mcp/servers/b/toggle")
+
+            config, by_name = _load_mcp_index()
+            assert [s["name"] for s in config["servers"]] == ["a", "b", "c"]
+            assert by_name["b"]["enabled"] is False
+            assert by_name["a"]["enabled"] is True
+
+    async def test_concurrent_installs_all_persist(self, tmp_path):
+        import asyncio
+
+        from jedisos.web.api.mcp import MCPServerInstall, _load_mcp_index, install_server
+
+        config_path = tmp_path / "mcp.json"
+        with patch("jedisos.web.api.mcp._MCP_CONFIG_PATH", config_path):
+            await asyncio.gather(
+                *(install_server(MCPServerInstall(name=f"s{i}", url="http://x")) for i in range(5))
+            )
+            config, _ = _load_mcp_index()
+            assert sorted(s["name"] for s in config["servers"]) == [f"s{i}" for i in range(5)]
+
+
+class TestSkillsAPI:  # [JS-T011.8]
+    @pytest.fixture
+    def tools_dir(self, tmp_path):
+        tools = tmp_path / "tools"
+        for rel in ("generated/gen_skill", "weather"):
+            d = tools / rel
+            d.mkdir(parents=True)
+            (d / "tool.py").write_text("")
+        (tools / "generated" / "gen_skill" / "tool.yaml").write_text("auto_generated: true\n")
+        with (
+            patch("jedisos.web.api.skills._TOOLS_DIR", tools),
+            patch("jedisos.web.api.skills._BUILTIN_TOOLS_DIR", tmp_path / "none"),
+        ):
+            yield tools
+
+    def test_find_skill_matches_scan(self, tools_dir):
+        from jedisos.web.api.skills import _find_skill, _scan_skills
+
+        for info in _scan_skills():
+            assert _find_skill(info["name"]) == info
+        assert _find_skill("missing") is None
+        assert _find_skill("../tools") is None
+
+    def test_scan_skills_indexed(self, tools_dir):
+        from jedisos.web.api.skills import (
+            _invalidate_skill_cache,
+            _scan_skills,
+            _scan_skills_indexed,
+        )
+
+        _invalidate_skill_cache()
+        index = _scan_skills_indexed()
+        assert list(index.values()) == _scan_skills()
+        assert set(index) == {"gen_skill", "weather"}
+        assert _scan_skills_indexed() is index
+
+    def test_toggle_skill(self, client, tools_dir):
+        resp = client.put("/api/skills/weather/toggle")
+        assert resp.status_code == 200
+        assert resp.json()["enabled"] is False
+        assert (tools_dir / "weather" / ".disabled").exists()
+
+    def test_list_skills_cached_until_toggle(self, client, tools_dir):
+        first = client.get("/api/skills/").json()
+        assert first["total"] == 2
+        assert first["active"] == 2
+
+        client.put("/api/skills/weather/toggle")
+        assert client.get("/api/skills/").json()["active"] == 1
+
+    def test_delete_invalid_name_fails_before_lookup(self, client, tools_dir):
+        with patch("jedisos.web.api.skills._find_skill") as find:
+            resp = client.delete("/api/skills/bad.name")
+        assert resp.status_code == 400
+        find.assert_not_called()
+
+    def test_delete_generated_skill(self, client, tools_dir):
+        with patch("jedisos.web.api.skills._record_skill_deletion", new=AsyncMock()):
+            resp = client.delete("/api/skills/gen_skill")
+        assert resp.status_code == 200
+        assert not (tools_dir / "generated" / "gen_skill").exists()
+
+    async def test_record_deletion_reuses_shared_memory(self):
+        from jedisos.web.api.skills import _record_skill_deletion
+
+        memory = MagicMock()
+        memory.close = AsyncMock()
+        with (
+            patch("jedisos.web.app._app_state", {"memory": memory}),
+            patch("jedisos.forge.generator.SkillGenerator") as gen_cls,
+            patch("jedisos.memory.zvec_memory.ZvecMemory") as zvec_cls,
+        ):
+            gen_cls.return_value.retain_skill_deletion = AsyncMock()
+            await _record_skill_deletion("gen_skill", "desc")
+
+        gen_cls.assert_called_once_with(memory=memory)
+        zvec_cls.assert_not_called()
+        memory.close.assert_not_called()
+
+    def test_delete_symlink_outside_generated_forbidden(self, client, tools_dir, tmp_path):
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "tool.py").write_text("")
+        (outside / "tool.yaml").write_text("auto_generated: true\n")
+        (tools_dir / "generated" / "evil").symlink_to(outside, target_is_directory=True)
+
+        resp = client.delete("/api/skills/evil")
+        assert resp.status_code == 403
+        assert outside.exists()
+
+    def test_delete_sibling_prefix_dir_forbidden(self, client, tools_dir):
+        # 문자열 접두어 비교라면 tools/generated-evil이 tools/generated를 통과함
+        sibling = tools_dir / "generated-evil" / "evil"
+        sibling.mkdir(parents=True)
+        (sibling / "tool.py").write_text("")
+        (sibling / "tool.yaml").write_text("auto_generated: true\n")
+        (tools_dir / "generated" / "evil").symlink_to(sibling, target_is_directory=True)
+
+        resp = client.delete("/api/skills/evil")
+        assert resp.status_code == 403
+        assert sibling.exists()
+
+    def test_delete_manual_skill_forbidden(self, client, tools_dir):
+        resp = client.delete("/api/skills/weather")
+        assert resp.status_code == 403
+
+
+class TestOrjsonResponse:  # [JS-T011.9]
+    def test_render_non_ascii_and_int_keys(self):
+        from jedisos.web.responses import OrjsonResponse
+
+        resp = OrjsonResponse({"msg": "한글", 1: True})
+        assert resp.body == '{"msg":"한글","1":true}'.encode()
+        assert resp.media_type == "application/json"
+
+    def test_app_default_response_class(self, client):
+        from jedisos.web.responses import OrjsonResponse
+
+        with patch.object(OrjsonResponse, "render", autospec=True, return_value=b"{}") as render:
+            client.get("/api/chat/connections")
+            client.get("/api/setup/status")
+        assert render.call_count == 2
+
+
+class TestAtomicWrite:  # [JS-T011.10]
+    def test_replaces_without_leftover_tmp(self, tmp_path):
+        from jedisos.web.fileio import atomic_write_text
+
+        target = tmp_path / "conf.yaml"
+        target.write_text("old: 1\n")
+        atomic_write_text(target, "new: 한글\n")
+        assert target.read_text(encoding="utf-8") == "new: 한글\n"
+        assert [p.name for p in tmp_path.iterdir()] == ["conf.yaml"]
+
+    def test_failed_write_keeps_original(self, tmp_path):
+        from jedisos.web.fileio import atomic_write_bytes
+
+        target = tmp_path / "conf.json"
+        target.write_bytes(b"{}")
+        with (
+            patch("jedisos.web.fileio.os.replace", side_effect=OSError("boom")),
+            pytest.raises(OSError),
+        ):
+            atomic_write_bytes(target, b'{"a": 1}')
+        assert target.read_bytes() == b"{}"
+        assert [p.name for p in tmp_path.iterdir()] == ["conf.json"]
+
 
 class TestMonitoringAPI:  # [JS-T011.5]
     def test_status_no_state(self, client):
@@ -225,52 +517,46 @@ class TestMonitoringAPI:  # [JS-T011.5]
         data = resp.json()
         assert data["version"] == __version__
 
-    def test_status_with_state(self, client):
+    def test_status_with_state(self, app, client):
         mock_memory = MagicMock()
         mock_memory.health_check = AsyncMock(return_value=True)
         mock_llm = MagicMock()
         mock_llm.models = ["gpt-5.2"]
 
-        with patch(
-            "jedisos.web.app._app_state",
-            {
-                "memory": mock_memory,
-                "llm": mock_llm,
-            },
-        ):
-            resp = client.get("/api/monitoring/status")
-            assert resp.status_code == 200
-            data = resp.json()
-            assert data["services"]["memory"] == "ok"
-            assert data["models"] == ["gpt-5.2"]
+        app.state.resources = AppResources(memory=mock_memory, llm=mock_llm)
+        resp = client.get("/api/monitoring/status")
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["services"]["memory"] == "ok"
+        assert data["models"] == ["gpt-5.2"]
 
     def test_audit_no_state(self, client):
         resp = client.get("/api/monitoring/audit")
         assert resp.status_code == 200
         assert resp.json()["total"] == 0
 
-    def test_audit_with_entries(self, client):
+    def test_audit_with_entries(self, app, client):
         from jedisos.security.audit import AuditLogger
 
         audit = AuditLogger()
         audit.log_tool_call(tool_name="echo", allowed=True)
         audit.log_tool_call(tool_name="shell_exec", allowed=False, reason="차단됨")
 
-        with patch("jedisos.web.app._app_state", {"audit": audit}):
-            resp = client.get("/api/monitoring/audit")
-            assert resp.status_code == 200
-            assert resp.json()["total"] == 2
+        app.state.resources = AppResources(audit=audit)
+        resp = client.get("/api/monitoring/audit")
+        assert resp.status_code == 200
+        assert resp.json()["total"] == 2
 
-    def test_denied_log(self, client):
+    def test_denied_log(self, app, client):
         from jedisos.security.audit import AuditLogger
 
         audit = AuditLogger()
         audit.log_tool_call(tool_name="shell_exec", allowed=False, reason="차단됨")
 
-        with patch("jedisos.web.app._app_state", {"audit": audit}):
-            resp = client.get("/api/monitoring/audit/denied")
-            assert resp.status_code == 200
-            assert resp.json()["total"] == 1
+        app.state.resources = AppResources(audit=audit)
+        resp = client.get("/api/monitoring/audit/denied")
+        assert resp.status_code == 200
+        assert resp.json()["total"] == 1
 
     def test_policy_no_state(self, client):
         resp = client.get("/api/monitoring/policy")
@@ -400,12 +686,1067 @@ class TestWebUI:  # [JS-T011.7]
         resp = client.get("/")
         assert "tailwindcss" in resp.text
 
+    def test_root_renders_template_once(self, client):
+        from jedisos.web import app as web_app
+
+        web_app._index_html.cache_clear()
+        with patch.object(web_app, "_get_templates", wraps=web_app._get_templates) as get:
+            first = client.get("/").text
+            second = client.get("/").text
+        assert first == second
+        assert f"v{__version__}" in first
+        get.assert_called_once()
+
     def test_static_js_served(self, client):  # [JS-T011.7d]
         """정적 JS 파일이 서빙되어야 합니다."""
         resp = client.get("/static/js/app.js")
         assert resp.status_code == 200
 
+    def test_static_urls_are_content_versioned(self, client):
+        import re
+
+        html = client.get("/").text
+        url = re.search(r'src="(/static/js/app\.js\?v=[0-9a-f]{12})"', html).group(1)
+        assert re.search(r'href="/static/css/app\.css\?v=[0-9a-f]{12}"', html)
+
+        versioned = client.get(url)
+        assert versioned.headers["cache-control"] == "public, max-age=31536000, immutable"
+        plain = client.get("/static/js/app.js")
+        assert plain.headers["cache-control"] == "no-cache"
+        etag = plain.headers["etag"]
+        assert client.get("/static/js/app.js", headers={"If-None-Match": etag}).status_code == 304
+
+    def test_large_responses_are_gzipped(self, client, monkeypatch):
+        resp = client.get("/static/js/app.js", headers={"Accept-Encoding": "gzip"})
+        assert resp.headers["content-encoding"] == "gzip"
+        health = client.get("/health", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in health.headers
+
+        monkeypatch.setenv("JEDISOS_GZIP", "off")
+        plain = TestClient(create_app())
+        resp = plain.get("/static/js/app.js", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in resp.headers
+
     def test_static_css_served(self, client):  # [JS-T011.7e]
         """정적 CSS 파일이 서빙되어야 합니다."""
         resp = client.get("/static/css/app.css")
         assert resp.status_code == 200
+
+
+class TestRunServer:  # [JS-T011.11]
+    def test_uses_uvloop_when_available(self):
+        from jedisos.web.app import run_server
+
+        with (
+            patch("jedisos.web.app.sys.platform", "linux"),
+            patch("importlib.util.find_spec", return_value=object()),
+            patch("uvicorn.run") as run,
+        ):
+            run_server(host="127.0.0.1", port=9999)
+
+        kwargs = run.call_args.kwargs
+        assert kwargs["loop"] == "uvloop"
+        assert kwargs["http"] == "httptools"
+        assert kwargs["ws"] == "websockets"
+        assert kwargs["factory"] is True
+
+    def test_workers_use_gunicorn_preload(self):
+        from jedisos.web.app import run_server
+
+        with (
+            patch("jedisos.web.app.sys.platform", "linux"),
+            patch("importlib.util.find_spec", return_value=object()),
+            patch("subprocess.run") as sub_run,
+            patch("uvicorn.run") as run,
+        ):
+            run_server(host="127.0.0.1", port=9999, workers=4)
+
+        run.assert_not_called()
+        cmd = sub_run.call_args.args[0]
+        assert cmd[1:4] == ["-m", "gunicorn", "jedisos.web.app:create_app()"]
+        assert "--preload" in cmd
+        assert cmd[cmd.index("-w") + 1] == "4"
+        assert cmd[cmd.index("-b") + 1] == "127.0.0.1:9999"
+        assert sub_run.call_args.kwargs["env"]["JEDISOS_PRELOAD"] == "1"
+
+    def test_preload_imports_heavy_modules_in_parent(self, monkeypatch):
+        monkeypatch.setenv("JEDISOS_PRELOAD", "1")
+        import importlib
+
+        with patch("importlib.import_module", wraps=importlib.import_module) as import_module:
+            create_app()
+        imported = [c.args[0] for c in import_module.call_args_list]
+        assert "jedisos.llm.router" in imported
+        assert "jedisos.memory.zvec_memory" in imported
+
+    def test_workers_without_gunicorn_fall_back_to_uvicorn(self):
+        from jedisos.web.app import run_server
+
+        with (
+            patch("jedisos.web.app.sys.platform", "linux"),
+            patch("importlib.util.find_spec", return_value=None),
+            patch("subprocess.run") as sub_run,
+            patch("uvicorn.run") as run,
+        ):
+            run_server(host="127.0.0.1", port=9999, workers=2)
+
+        sub_run.assert_not_called()
+        assert run.call_args.kwargs["workers"] == 2
+
+    def test_uds_from_env_replaces_tcp_bind(self, monkeypatch):
+        from jedisos.web.app import run_server
+
+        monkeypatch.setenv("JEDISOS_UDS", "/run/jedisos.sock")
+        with patch("uvicorn.run") as run:
+            run_server(host="127.0.0.1", port=9999)
+
+        kwargs = run.call_args.kwargs
+        assert kwargs["uds"] == "/run/jedisos.sock"
+        assert "host" not in kwargs
+        assert "port" not in kwargs
+
+    def test_fd_binds_gunicorn_to_inherited_socket(self, monkeypatch):
+        from jedisos.web.app import run_server
+
+        monkeypatch.delenv("JEDISOS_UDS", raising=False)
+        with (
+            patch("jedisos.web.app.sys.platform", "linux"),
+            patch("importlib.util.find_spec", return_value=object()),
+            patch("subprocess.run") as sub_run,
+        ):
+            run_server(workers=2, fd=3)
+
+        cmd = sub_run.call_args.args[0]
+        assert cmd[cmd.index("-b") + 1] == "fd://3"
+
+    def test_access_log_off_in_prod(self, monkeypatch):
+        from jedisos.web.app import run_server
+
+        monkeypatch.delenv("JEDISOS_UDS", raising=False)
+        monkeypatch.setenv("JEDISOS_ENV", "prod")
+        with patch("uvicorn.run") as run:
+            run_server()
+        assert run.call_args.kwargs["access_log"] is False
+
+        monkeypatch.setenv("JEDISOS_ENV", "dev")
+        with patch("uvicorn.run") as run:
+            run_server()
+        assert run.call_args.kwargs["access_log"] is True
+
+    def test_falls_back_on_windows(self):
+        from jedisos.web.app import _uvicorn_impl_options
+
+        with (
+            patch("jedisos.web.app.sys.platform", "win32"),
+            patch("importlib.util.find_spec", return_value=None),
+        ):
+            assert _uvicorn_impl_options() == {"loop": "auto", "http": "auto", "ws": "auto"}
+
+    def test_uring_opt_in_requires_new_kernel(self, monkeypatch):
+        from jedisos.web.app import _install_uring_policy
+
+        monkeypatch.delenv("JEDISOS_EVENT_LOOP", raising=False)
+        assert _install_uring_policy() is False
+
+        monkeypatch.setenv("JEDISOS_EVENT_LOOP", "uring")
+        with (
+            patch("jedisos.web.app.sys.platform", "linux"),
+            patch("platform.release", return_value="5.4.0-generic"),
+            patch("asyncio.set_event_loop_policy") as set_policy,
+        ):
+            assert _install_uring_policy() is False
+        set_policy.assert_not_called()
+
+
+class TestCORS:  # [JS-T011.12]
+    def test_simple_request_reflects_origin(self, client):
+        resp = client.get("/health", headers={"Origin": "http://example.com"})
+        assert resp.headers["access-control-allow-origin"] == "http://example.com"
+        assert resp.headers["access-control-allow-credentials"] == "true"
+        assert "Origin" in resp.headers["vary"]
+
+    def test_same_origin_request_untouched(self, client):
+        resp = client.get("/health")
+        assert "access-control-allow-origin" not in resp.headers
+
+    def test_preflight_short_circuits(self, client):
+        resp = client.options(
+            "/api/settings/env",
+            headers={
+                "Origin": "http://example.com",
+                "Access-Control-Request-Method": "PUT",
+                "Access-Control-Request-Headers": "X-Custom",
+            },
+        )
+        assert resp.status_code == 200
+        assert resp.headers["access-control-allow-origin"] == "http://example.com"
+        assert resp.headers["access-control-allow-headers"] == "X-Custom"
+        assert "PUT" in resp.headers["access-control-allow-methods"]
+
+    def test_preflight_rejects_unknown_origin(self):
+        from starlette.applications import Starlette
+
+        from jedisos.web.middleware import FastCORSMiddleware
+
+        app = Starlette()
+        app.add_middleware(FastCORSMiddleware, allow_origins=["http://ok.test"])
+        resp = TestClient(app).options(
+            "/",
+            headers={"Origin": "http://evil.test", "Access-Control-Request-Method": "GET"},
+        )
+        assert resp.status_code == 400
+        assert resp.text == "Disallowed CORS origin"
+
+    def test_disabled_by_env(self, monkeypatch):
+        from jedisos.web.middleware import FastCORSMiddleware
+
+        monkeypatch.setenv("JEDISOS_CORS", "off")
+        app = create_app()
+        assert all(m.cls is not FastCORSMiddleware for m in app.user_middleware)
+        resp = TestClient(app).get("/health", headers={"Origin": "http://example.com"})
+        assert "access-control-allow-origin" not in resp.headers
+
+    def test_repeated_preflight_served_from_cache(self, client):
+        from jedisos.web.middleware import FastCORSMiddleware
+
+        headers = {"Origin": "http://example.com", "Access-Control-Request-Method": "POST"}
+        with patch.object(
+            FastCORSMiddleware,
+            "_build_preflight",
+            autospec=True,
+            side_effect=FastCORSMiddleware._build_preflight,
+        ) as build:
+            first = client.options("/api/chat/send", headers=headers)
+            second = client.options("/api/chat/send", headers=headers)
+        assert build.call_count == 1
+        assert first.headers == second.headers
+        assert second.status_code == 200
+
+
+class TestRequestID:  # [JS-T011.18]
+    def test_response_carries_unique_id(self, client):
+        first = client.get("/health").headers["x-request-id"]
+        second = client.get("/health").headers["x-request-id"]
+        assert len(first) == 32
+        assert first != second
+
+    def test_handler_sees_raw_bytes(self):
+        from starlette.applications import Starlette
+        from starlette.responses import PlainTextResponse
+        from starlette.routing import Route
+
+        from jedisos.web.middleware import RequestIDMiddleware
+
+        async def echo(request):
+            return PlainTextResponse(request.state.request_id.hex())
+
+        app = Starlette(routes=[Route("/", echo)])
+        app.add_middleware(RequestIDMiddleware)
+        resp = TestClient(app).get("/")
+        assert resp.text == resp.headers["x-request-id"]
+
+
+class TestBuiltinTools:  # [JS-T011.19]
+    async def test_builtin_defs_shared_across_registrations(self, tmp_path, monkeypatch):
+        from jedisos.web.app import _BUILTIN_TOOLS, _register_builtin_tools
+
+        monkeypatch.setenv("JEDISOS_DATA_DIR", str(tmp_path))
+        first, _ = await _register_builtin_tools(MagicMock(), MagicMock())
+        second, _ = await _register_builtin_tools(MagicMock(), MagicMock())
+        assert first[: len(_BUILTIN_TOOLS)] == list(_BUILTIN_TOOLS)
+        assert all(a is b for a, b in zip(first, second, strict=True))
+
+    def test_mcp_tool_defs(self):
+        from jedisos.web.app import _EMPTY_PARAMS, _mcp_tool_defs
+
+        tool_map: dict = {}
+        schema = {"type": "object", "properties": {"q": {"type": "string"}}}
+        defs = _mcp_tool_defs(
+            "gh",
+            [
+                {"name": "search", "description": "검색", "parameters": schema},
+                {"name": "ping", "description": "핑"},
+            ],
+            tool_map,
+        )
+        assert [d["function"]["name"] for d in defs] == ["mcp_gh_search", "mcp_gh_ping"]
+        assert defs[0]["function"]["description"] == "[MCP:gh] 검색"
+        assert defs[0]["function"]["parameters"] is schema
+        assert defs[1]["function"]["parameters"] is _EMPTY_PARAMS
+        assert tool_map == {"mcp_gh_search": ("gh", "search"), "mcp_gh_ping": ("gh", "ping")}
+
+    def test_builtin_defs_stay_wire_compatible(self):
+        import copy
+
+        import orjson
+
+        from jedisos.web.app import _BUILTIN_DEFS, _PY_TO_JSON
+
+        defs = list(_BUILTIN_DEFS)
+        assert orjson.loads(orjson.dumps(defs)) == defs
+        assert json.loads(json.dumps(defs)) == defs
+        assert copy.deepcopy(defs) == defs
+        with pytest.raises(TypeError):
+            _PY_TO_JSON["str"] = "object"  # type: ignore[index]
+
+    async def test_delete_skill_rejects_bad_name_before_scan(self, tmp_path, monkeypatch):
+        from jedisos.web.app import _register_builtin_tools
+
+        monkeypatch.setenv("JEDISOS_DATA_DIR", str(tmp_path))
+        _, executor = await _register_builtin_tools(MagicMock(), MagicMock())
+        with patch("jedisos.web.api.skills._scan_skills") as scan:
+            result = await executor("delete_skill", {"name": "../etc"})
+        assert result == {"error": "잘못된 스킬 이름 형식입니다."}
+        scan.assert_not_called()
+
+    async def test_delete_skill_blocks_sibling_prefix_dir(self, tmp_path, monkeypatch):
+        from jedisos.web.api.skills import _generated_dirs
+        from jedisos.web.app import _register_builtin_tools
+
+        monkeypatch.setenv("JEDISOS_DATA_DIR", str(tmp_path))
+        outside = tmp_path / "tools" / "generated2" / "evil"
+        outside.mkdir(parents=True)
+        skill = {"name": "evil", "auto_generated": True, "path": str(outside)}
+        _, executor = await _register_builtin_tools(MagicMock(), MagicMock())
+        with patch("jedisos.web.api.skills._scan_skills", return_value=[skill]):
+            result = await executor("delete_skill", {"name": "evil"})
+        assert result == {"error": "허용되지 않은 경로입니다."}
+        assert outside.exists()
+        assert _generated_dirs(tmp_path / "tools") is _generated_dirs(tmp_path / "tools")
+
+    async def test_executor_dispatch(self, tmp_path, monkeypatch):
+        from jedisos.web.app import _register_builtin_tools
+
+        monkeypatch.setenv("JEDISOS_DATA_DIR", str(tmp_path))
+        memory = MagicMock()
+        memory.recall = AsyncMock(return_value=["이름: 제다이"])
+        _, executor = await _register_builtin_tools(memory, MagicMock())
+        assert await executor("recall_memory", {"query": "이름"}) == {
+            "memories": "['이름: 제다이']"
+        }
+        assert await executor("nope", {}) == {"error": "알 수 없는 도구: nope"}
+
+    async def test_executor_skill_shadows_mcp_until_deleted(self, tmp_path, monkeypatch):
+        from jedisos.web.app import _register_builtin_tools
+
+        monkeypatch.setenv("JEDISOS_DATA_DIR", str(tmp_path))
+        skill_dir = tmp_path / "tools" / "generated" / "mcp_srv_fetch"
+        skill_dir.mkdir(parents=True)
+
+        async def fetch_skill(url: str) -> dict:
+            return {"from": "skill", "url": url}
+
+        def load_skills(loader, generated_dir, registry):
+            registry["mcp_srv_fetch"] = fetch_skill
+
+        mcp = MagicMock()
+        mcp.connected_servers = ["srv"]
+        mcp.list_tools = AsyncMock(return_value=[{"name": "fetch", "description": "d"}])
+        mcp.call_tool = AsyncMock(return_value={"from": "mcp"})
+        with patch("jedisos.web.app._load_generated_skills", side_effect=load_skills):
+            _, executor = await _register_builtin_tools(MagicMock(), MagicMock(), mcp)
+
+        assert await executor("mcp_srv_fetch", {"url": "u"}) == {"from": "skill", "url": "u"}
+        failed = await executor("mcp_srv_fetch", {"bad": 1})
+        assert failed["error"].startswith("스킬 실행 오류:")
+
+        skill = {"name": "mcp_srv_fetch", "auto_generated": True, "path": str(skill_dir)}
+        with patch("jedisos.web.api.skills._scan_skills", return_value=[skill]):
+            await executor("delete_skill", {"name": "mcp_srv_fetch"})
+        assert await executor("mcp_srv_fetch", {"url": "u"}) == {"from": "mcp"}
+        mcp.call_tool.assert_awaited_once_with("srv", "fetch", {"url": "u"})
+
+    async def test_delete_skill_drops_tool_by_name(self, tmp_path, monkeypatch):
+        from jedisos.web.app import _register_builtin_tools
+
+        monkeypatch.setenv("JEDISOS_DATA_DIR", str(tmp_path))
+        skill_dir = tmp_path / "tools" / "generated" / "mcp_srv_fetch"
+        skill_dir.mkdir(parents=True)
+        mcp = MagicMock()
+        mcp.connected_servers = ["srv"]
+        mcp.list_tools = AsyncMock(return_value=[{"name": "fetch", "description": "d"}])
+        tools, executor = await _register_builtin_tools(MagicMock(), MagicMock(), mcp)
+        assert "mcp_srv_fetch" in [t.to_dict()["function"]["name"] for t in tools]
+
+        skill = {"name": "mcp_srv_fetch", "auto_generated": True, "path": str(skill_dir)}
+        with patch("jedisos.web.api.skills._scan_skills", return_value=[skill]):
+            result = await executor("delete_skill", {"name": "mcp_srv_fetch"})
+
+        assert result == {"status": "deleted", "name": "mcp_srv_fetch"}
+        names = [t.to_dict()["function"]["name"] for t in tools]
+        assert "mcp_srv_fetch" not in names
+        assert names[0] == "recall_memory"
+
+    async def test_delete_skills_keeps_tool_positions_consistent(self, tmp_path, monkeypatch):
+        from jedisos.web.app import _register_builtin_tools
+
+        monkeypatch.setenv("JEDISOS_DATA_DIR", str(tmp_path))
+        skills = []
+        for name in ("mcp_srv_a", "mcp_srv_c"):
+            skill_dir = tmp_path / "tools" / "generated" / name
+            skill_dir.mkdir(parents=True)
+            skills.append({"name": name, "auto_generated": True, "path": str(skill_dir)})
+        mcp = MagicMock()
+        mcp.connected_servers = ["srv"]
+        mcp.list_tools = AsyncMock(
+            return_value=[{"name": n, "description": "d"} for n in ("a", "b", "c", "d")]
+        )
+        tools, executor = await _register_builtin_tools(MagicMock(), MagicMock(), mcp)
+
+        with patch("jedisos.web.api.skills._scan_skills", return_value=skills):
+            await executor("delete_skill", {"name": "mcp_srv_a"})
+            await executor("delete_skill", {"name": "mcp_srv_c"})
+
+        names = [t.to_dict()["function"]["name"] for t in tools]
+        assert names[-2:] == ["mcp_srv_b", "mcp_srv_d"]
+
+    async def test_add_mcp_server_duplicate_uses_index(self, tmp_path, monkeypatch):
+        from jedisos.web.app import _register_builtin_tools
+
+        monkeypatch.setenv("JEDISOS_DATA_DIR", str(tmp_path))
+        config_path = tmp_path / "mcp.json"
+        config_path.write_text(json.dumps({"servers": [{"name": "dup", "url": "http://x"}]}))
+        mcp = MagicMock()
+        mcp.connected_servers = []
+        mcp.register_server = AsyncMock()
+        _, executor = await _register_builtin_tools(MagicMock(), MagicMock(), mcp)
+        with patch("jedisos.web.api.mcp._MCP_CONFIG_PATH", config_path):
+            result = await executor("add_mcp_server", {"name": "dup", "url": "http://y"})
+        assert result == {"error": "'dup' 서버가 이미 등록되어 있습니다."}
+        mcp.register_server.assert_not_called()
+
+    async def test_mcp_list_tools_failure_skips_server(self, tmp_path, monkeypatch):
+        from jedisos.web.app import _register_builtin_tools
+
+        async def list_tools(server):
+            if server == "down":
+                raise ConnectionError("refused")
+            return [{"name": "fetch", "description": "d"}]
+
+        monkeypatch.setenv("JEDISOS_DATA_DIR", str(tmp_path))
+        mcp = MagicMock()
+        mcp.connected_servers = ["down", "up"]
+        mcp.list_tools = AsyncMock(side_effect=list_tools)
+        tools, _ = await _register_builtin_tools(MagicMock(), MagicMock(), mcp)
+        names = {t.to_dict()["function"]["name"] for t in tools}
+        assert "mcp_up_fetch" in names
+        assert not any(n.startswith("mcp_down_") for n in names)
+
+    def test_tooldef_has_no_instance_dict(self):
+        from jedisos.web.app import _BUILTIN_TOOLS
+
+        assert not hasattr(_BUILTIN_TOOLS[0], "__dict__")
+        assert _BUILTIN_TOOLS[0].to_dict()["function"]["name"] == "recall_memory"
+
+    def test_skill_def_cached_per_function(self):
+        from jedisos.web.app import _skill_tool_def
+
+        async def weather(city: str) -> dict:
+            return {}
+
+        weather._tool_name = "weather"
+        weather._tool_parameters = {"city": {"type": "str", "required": True}}
+
+        tool = _skill_tool_def(weather)
+        assert _skill_tool_def(weather) is tool
+        assert tool.to_dict()["function"]["parameters"]["required"] == ["city"]
+
+    def test_skill_def_cache_releases_dropped_function(self):
+        import gc
+        import weakref
+
+        from jedisos.web.app import _skill_defs, _skill_tool_def
+
+        def weather() -> dict:
+            return {}
+
+        _skill_tool_def(weather)
+        ref = weakref.ref(weather)
+        size = len(_skill_defs)
+        del weather
+        gc.collect()
+        assert ref() is None
+        assert len(_skill_defs) <= size - 1
+
+    @pytest.mark.parametrize(
+        ("ptype", "expected"),
+        [
+            ("str | None", "string"),
+            ("Optional[int]", "integer"),
+            ("None | float", "number"),
+            ("list[str]", "array"),
+            ("typing.List[str]", "array"),
+            ("dict[str, Any]", "object"),
+            ("<class 'tuple'>", "array"),
+            ("bool", "boolean"),
+            ("Point", "string"),
+        ],
+    )
+    def test_py_type_to_json(self, ptype, expected):
+        from jedisos.web.app import _py_type_to_json
+
+        assert _py_type_to_json(ptype) == expected
+
+    def test_py_type_to_json_cached(self):
+        from jedisos.web.app import _py_type_to_json
+
+        _py_type_to_json("Optional[int]")
+        hits = _py_type_to_json.cache_info().hits
+        assert _py_type_to_json("Optional[int]") == "integer"
+        assert _py_type_to_json.cache_info().hits == hits + 1
+
+    def test_skill_source_cached_until_file_changes(self, tmp_path):
+        from jedisos.web.app import _read_skill_source
+
+        skill = tmp_path / "weather"
+        skill.mkdir()
+        assert _read_skill_source(skill) is None
+
+        (skill / "tool.py").write_text("v1")
+        (skill / "tool.yaml").write_text("version: 1.2.0\n")
+        assert _read_skill_source(skill) == ("v1", "1.2.0")
+
+        with patch("yaml.safe_load") as safe_load:
+            assert _read_skill_source(skill) == ("v1", "1.2.0")
+        safe_load.assert_not_called()
+
+        (skill / "tool.py").write_text("v2 longer")
+        os.utime(skill / "tool.py", ns=(1, 1))
+        assert _read_skill_source(skill) == ("v2 longer", "1.2.0")
+
+    @pytest.mark.parametrize(
+        ("yaml_text", "expected"),
+        [
+            ('name: w\nversion: "2.1.0"  # bump\n', "2.1.0"),
+            ("meta:\n  version: 9.9.9\nversion: 1.4.0\n", "1.4.0"),
+            ("version:\n  3.0.0\n", "3.0.0"),
+            ("name: w\n", "1.0.0"),
+        ],
+    )
+    def test_skill_source_version_regex(self, tmp_path, yaml_text, expected):
+        from jedisos.web.app import _read_skill_source
+
+        (tmp_path / "tool.py").write_text("code")
+        (tmp_path / "tool.yaml").write_text(yaml_text)
+        assert _read_skill_source(tmp_path) == ("code", expected)
+
+    def test_data_dir_cached_per_env_value(self, tmp_path, monkeypatch):
+        from jedisos.web.app import _data_dir
+
+        monkeypatch.setenv("JEDISOS_DATA_DIR", str(tmp_path))
+        assert _data_dir() == tmp_path
+        assert _data_dir() is _data_dir()
+        monkeypatch.setenv("JEDISOS_DATA_DIR", str(tmp_path / "other"))
+        assert _data_dir() == tmp_path / "other"
+        monkeypatch.delenv("JEDISOS_DATA_DIR")
+        assert _data_dir("/srv/data") == Path("/srv/data")
+
+    def test_env_loader_parses_lines(self, tmp_path, monkeypatch):
+        from jedisos.web.app import _load_env_from_data_dir
+
+        (tmp_path / ".env").write_bytes(
+            "# c\n  # JS_TEST_C=x\nJS_TEST_A=1\r\n\nJS_TEST_B = 두 번째 \nJS_TEST_C=\n"
+            "JUNK\nJS_TEST_SET=new".encode()
+        )
+        monkeypatch.setenv("JEDISOS_DATA_DIR", str(tmp_path))
+        monkeypatch.setenv("JS_TEST_SET", "old")
+        monkeypatch.delenv("JS_TEST_A", raising=False)
+        monkeypatch.delenv("JS_TEST_B", raising=False)
+        monkeypatch.delenv("JS_TEST_C", raising=False)
+        _load_env_from_data_dir()
+        assert os.environ["JS_TEST_A"] == "1"
+        assert os.environ["JS_TEST_B"] == "두 번째"
+        assert "JS_TEST_C" not in os.environ
+        assert "JUNK" not in os.environ
+        assert os.environ["JS_TEST_SET"] == "old"
+        os.environ.pop("JS_TEST_A")
+        os.environ.pop("JS_TEST_B")
+
+
+class TestChannels:  # [JS-T011.20]
+    @pytest.fixture
+    def tg_env(self, monkeypatch):
+        import asyncio
+
+        monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "123:abc")
+        gate = asyncio.Event()
+        tg_app = MagicMock()
+        tg_app.running = False
+        tg_app.updater = None
+        tg_app.initialize = AsyncMock(side_effect=gate.wait)
+        tg_app.start = AsyncMock()
+        tg_app.stop = AsyncMock()
+        tg_app.shutdown = AsyncMock()
+        state = {"memory": MagicMock(), "llm": MagicMock()}
+        with (
+            patch("jedisos.web.app._app_state", state),
+            patch("jedisos.agents.react.ReActAgent"),
+            patch("jedisos.llm.prompts.get_identity_prompt", return_value=""),
+            patch("jedisos.channels.telegram.TelegramChannel") as channel,
+        ):
+            channel.return_value.build_app.return_value = tg_app
+            yield state, tg_app, gate
+
+    async def test_telegram_bootstrap_runs_in_background(self, tg_env):
+        from jedisos.web.app import _start_channels
+
+        state, tg_app, gate = tg_env
+        await _start_channels()
+        task = state["telegram_task"]
+        assert not task.done()
+        tg_app.start.assert_not_called()
+
+        gate.set()
+        await task
+        tg_app.start.assert_awaited_once()
+        assert state["telegram_app"] is tg_app
+
+    async def test_telegram_bootstrap_failure_allows_retry(self, tg_env):
+        from jedisos.web.app import _start_channels
+
+        state, tg_app, _ = tg_env
+        tg_app.initialize.side_effect = RuntimeError("unauthorized")
+        await _start_channels()
+        await state["telegram_task"]
+        assert "telegram_app" not in state
+
+    async def test_stop_cancels_pending_bootstrap(self, tg_env):
+        from jedisos.web.app import _start_channels, _stop_channels
+
+        state, tg_app, _ = tg_env
+        await _start_channels()
+        task = state["telegram_task"]
+        await _stop_channels()
+        assert task.cancelled()
+        tg_app.shutdown.assert_awaited_once()
+        assert "telegram_task" not in state
+
+    async def test_no_channel_token_skips_agent_import(self, monkeypatch):
+        from jedisos.web.app import _start_channels
+
+        monkeypatch.delenv("TELEGRAM_BOT_TOKEN", raising=False)
+        with (
+            patch("jedisos.web.app._app_state", {"memory": MagicMock(), "llm": MagicMock()}),
+            patch.dict("sys.modules", {"jedisos.agents.react": None}),
+        ):
+            # react 모듈을 import하면 ImportError가 나므로 import하지 않았음을 확인
+            await _start_channels()
+
+    @staticmethod
+    def _ws(send_text=None):
+        ws = MagicMock()
+        ws.accept = AsyncMock()
+        ws.send_text = AsyncMock(side_effect=send_text)
+        ws.close = AsyncMock()
+        return ws
+
+    async def test_ws_broadcast_prunes_failed_connections(self):
+        import asyncio
+
+        import orjson
+
+        from jedisos.web.api.chat import ConnectionManager
+        from jedisos.web.app import _notify_websockets
+
+        ok, broken = self._ws(), self._ws(RuntimeError("closed"))
+        manager = ConnectionManager()
+        await manager.connect(ok)
+        await manager.connect(broken)
+        with patch("jedisos.web.api.chat.manager", manager):
+            await _notify_websockets("skill_created", "완료")
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        sent = ok.send_text.await_args.args[0]
+        assert orjson.loads(sent) == {
+            "type": "notification",
+            "event": "skill_created",
+            "message": "완료",
+        }
+        assert broken.send_text.await_args.args[0] is sent
+        assert manager.active_connections == [ok]
+        manager.disconnect(broken)  # 핸들러 쪽 정리가 뒤따라도 안전
+        manager.disconnect(ok)
+
+    async def test_ws_broadcast_drops_slow_consumer(self):
+        import asyncio
+
+        from jedisos.web.api.chat import ConnectionManager
+
+        async def never(text):
+            await asyncio.Event().wait()
+
+        slow, fast = self._ws(never), self._ws()
+        manager = ConnectionManager()
+        with patch("jedisos.web.api.chat._SEND_QUEUE_SIZE", 1):
+            await manager.connect(slow)
+            await manager.connect(fast)
+        for i in range(3):
+            manager.broadcast(str(i))
+            await asyncio.sleep(0)
+        await asyncio.gather(*manager._closing)
+
+        assert manager.active_connections == [fast]
+        assert [c.args[0] for c in fast.send_text.await_args_list] == ["0", "1", "2"]
+        slow.close.assert_awaited_once_with(code=1013)
+        fast.close.assert_not_awaited()
+        manager.disconnect(fast)
+
+    async def test_ws_overflow_close_failure_is_swallowed(self):
+        import asyncio
+
+        from jedisos.web.api.chat import ConnectionManager
+
+        async def never(text):
+            await asyncio.Event().wait()
+
+        slow = self._ws(never)
+        slow.close = AsyncMock(side_effect=RuntimeError("already closed"))
+        manager = ConnectionManager()
+        with patch("jedisos.web.api.chat._SEND_QUEUE_SIZE", 1):
+            await manager.connect(slow)
+        for i in range(3):
+            manager.broadcast(str(i))
+        await asyncio.gather(*manager._closing)
+
+        assert manager.active_connections == []
+        slow.close.assert_awaited_once_with(code=1013)
+        assert not manager._closing
+
+    async def test_telegram_notify_isolates_bad_chat(self):
+        from jedisos.web.app import _notify_telegram
+
+        delivered: list[int] = []
+
+        async def send_message(chat_id, text, parse_mode):
+            if chat_id == 1:
+                raise RuntimeError("blocked")
+            delivered.append(chat_id)
+
+        tg_app = MagicMock()
+        tg_app.bot.send_message = AsyncMock(side_effect=send_message)
+        with (
+            patch("jedisos.channels.telegram._telegram_chat_ids", {1, 7}),
+            patch("jedisos.web.app._app_state", {"telegram_app": tg_app}),
+        ):
+            await _notify_telegram("hi")
+        assert tg_app.bot.send_message.await_count == 2
+        assert delivered == [7]
+
+    async def test_telegram_notify_skips_without_chats(self):
+        from jedisos.web.app import _notify_telegram
+
+        tg_app = MagicMock()
+        tg_app.bot.send_message = AsyncMock()
+        with (
+            patch("jedisos.channels.telegram._telegram_chat_ids", set()),
+            patch("jedisos.channels.telegram._md_to_telegram_html") as to_html,
+            patch("jedisos.web.app._app_state", {"telegram_app": tg_app}),
+        ):
+            await _notify_telegram("hi")
+        to_html.assert_not_called()
+        tg_app.bot.send_message.assert_not_awaited()
+
+    async def test_spawn_holds_task_until_done(self):
+        import asyncio
+        import gc
+
+        from jedisos.web.app import _background_tasks, _spawn
+
+        gate = asyncio.Event()
+        task = _spawn(gate.wait())
+        task_id = id(task)
+        del task
+        gc.collect()
+        assert any(id(t) == task_id for t in _background_tasks)
+
+        gate.set()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert all(id(t) != task_id for t in _background_tasks)
+
+    async def test_broadcast_does_not_wait_for_sockets(self):
+        import asyncio
+
+        from jedisos.web.api.chat import ConnectionManager
+        from jedisos.web.app import _broadcast_notification
+
+        release = asyncio.Event()
+        delivered: list[str] = []
+
+        async def send_text(text):
+            await release.wait()
+            delivered.append(text)
+
+        conn = self._ws(send_text)
+        manager = ConnectionManager()
+        await manager.connect(conn)
+        tg_app = MagicMock()
+        tg_app.bot.send_message = AsyncMock()
+        with (
+            patch("jedisos.web.api.chat.manager", manager),
+            patch("jedisos.channels.telegram._telegram_chat_ids", {42}),
+            patch("jedisos.web.app._app_state", {"telegram_app": tg_app}),
+        ):
+            # 소켓 전송이 막혀 있어도 브로드캐스트는 바로 끝남
+            await asyncio.wait_for(_broadcast_notification("skill_created", "**완료**"), 1)
+
+        tg_app.bot.send_message.assert_awaited_once()
+        assert tg_app.bot.send_message.await_args.kwargs["chat_id"] == 42
+        release.set()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert len(delivered) == 1
+        manager.disconnect(conn)
+
+
+class TestLifespanHelpers:  # [JS-T011.21]
+    async def test_wait_vault_ready_wakes_when_socket_appears(self, tmp_path):
+        import asyncio
+
+        from jedisos.web.app import _wait_vault_ready
+
+        vault = MagicMock()
+        vault.socket_path = tmp_path / "vault.sock"
+        vault.status = AsyncMock(return_value={"status": "locked"})
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.05, vault.socket_path.touch)
+        state: dict = {}
+        started = loop.time()
+        with patch("jedisos.web.app._app_state", state):
+            await _wait_vault_ready(vault)
+        assert loop.time() - started < 1.0
+        assert state["vault_status"] == "locked"
+        vault.status.assert_awaited_once()
+
+    async def test_wait_vault_ready_gives_up(self, tmp_path):
+        from jedisos.web.app import _wait_vault_ready
+
+        vault = MagicMock()
+        vault.socket_path = tmp_path / "vault.sock"
+        vault.status = AsyncMock(side_effect=ConnectionError())
+        state: dict = {}
+        with (
+            patch("jedisos.web.app._app_state", state),
+            patch("jedisos.web.app._VAULT_READY_TIMEOUT", 0.05),
+        ):
+            await _wait_vault_ready(vault)
+        assert state["vault_status"] == "unavailable"
+
+    async def test_connect_mcp_servers_skips_disabled(self, tmp_path):
+        from jedisos.web.app import _connect_mcp_servers
+
+        cfg = tmp_path / "config" / "mcp_servers.json"
+        cfg.parent.mkdir()
+        servers = [{"name": "a", "url": "http://a"}, {"name": "b", "enabled": False}]
+        cfg.write_text(json.dumps({"servers": servers}))
+        with patch("jedisos.mcp.client.MCPClientManager") as manager_cls:
+            manager = manager_cls.return_value
+            manager.register_server = AsyncMock()
+            manager.connect_all = AsyncMock(return_value={"a": True})
+            assert await _connect_mcp_servers(tmp_path) is manager
+        manager.register_server.assert_awaited_once()
+        assert manager.register_server.await_args.args == ("a",)
+
+    async def test_setup_tools_registers_after_mcp_connect(self, tmp_path):
+        from jedisos.web.app import _setup_tools
+
+        manager = MagicMock()
+        calls: list[str] = []
+
+        async def connect(data_dir):
+            calls.append("connect")
+            return manager
+
+        async def register(memory, llm, mcp_manager):
+            calls.append("register")
+            assert mcp_manager is manager
+            return ["tool"], "executor"
+
+        with (
+            patch("jedisos.web.app._connect_mcp_servers", side_effect=connect),
+            patch("jedisos.web.app._register_builtin_tools", side_effect=register),
+        ):
+            result = await _setup_tools(MagicMock(), MagicMock(), tmp_path)
+        assert result == (manager, ["tool"], "executor")
+        assert calls == ["connect", "register"]
+
+    async def test_connect_mcp_servers_registers_concurrently(self, tmp_path):
+        import asyncio
+
+        from jedisos.web.app import _connect_mcp_servers
+
+        cfg = tmp_path / "config" / "mcp_servers.json"
+        cfg.parent.mkdir()
+        servers = [{"name": "a"}, {"name": "b"}, {"name": "c"}]
+        cfg.write_text(json.dumps({"servers": servers}))
+        all_started = asyncio.Event()
+        started: list[str] = []
+
+        async def register(name, **kwargs):
+            started.append(name)
+            if name == "c":
+                raise RuntimeError("bad")
+            if len(started) == 3:
+                all_started.set()
+            # 직렬 실행이면 a가 여기서 영원히 대기
+            await asyncio.wait_for(all_started.wait(), 1)
+
+        with patch("jedisos.mcp.client.MCPClientManager") as manager_cls:
+            manager = manager_cls.return_value
+            manager.register_server = AsyncMock(side_effect=register)
+            manager.connect_all = AsyncMock(return_value={})
+            await _connect_mcp_servers(tmp_path)
+        assert started == ["a", "b", "c"]
+        manager.connect_all.assert_awaited_once()
+
+    async def test_connect_mcp_servers_without_config(self, tmp_path):
+        from jedisos.web.app import _connect_mcp_servers
+
+        with patch("jedisos.mcp.client.MCPClientManager") as manager_cls:
+            manager = manager_cls.return_value
+            manager.connect_all = AsyncMock()
+            assert await _connect_mcp_servers(tmp_path) is manager
+        manager.connect_all.assert_not_awaited()
+
+    async def test_load_generated_skills_skips_non_skill_entries(self, tmp_path):
+        from jedisos.web.app import _load_generated_skills
+
+        for name in ("b_ok", "a_ok", "disabled", "no_tool"):
+            (tmp_path / name).mkdir()
+        for name in ("b_ok", "a_ok", "disabled"):
+            (tmp_path / name / "tool.py").write_text("")
+        (tmp_path / "disabled" / ".disabled").touch()
+        (tmp_path / "stray.py").write_text("")
+
+        loader = MagicMock()
+        loader.load_tool.return_value = []
+        await _load_generated_skills(loader, tmp_path, {})
+        loaded = [c.args[0] for c in loader.load_tool.call_args_list]
+        assert loaded == [tmp_path / "a_ok", tmp_path / "b_ok"]
+
+        await _load_generated_skills(loader, tmp_path / "missing", {})
+        assert loader.load_tool.call_count == 2
+
+    async def test_load_generated_skills_merges_in_name_order(self, tmp_path):
+        import threading
+
+        from jedisos.web.app import _load_generated_skills
+
+        for name in ("a", "b", "c"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "tool.py").write_text("")
+
+        barrier = threading.Barrier(2, timeout=2)
+
+        def load_tool(skill_dir):
+            if skill_dir.name == "c":
+                raise ImportError("broken")
+            # a, b가 동시에 실행되지 않으면 Barrier가 타임아웃됨
+            barrier.wait()
+
+            def func():
+                return skill_dir.name
+
+            func._tool_name = "shared"
+            return [func]
+
+        loader = MagicMock()
+        loader.load_tool.side_effect = load_tool
+        registry: dict = {}
+        await _load_generated_skills(loader, tmp_path, registry)
+        assert list(registry) == ["shared"]
+        assert registry["shared"]() == "b"
+
+
+class TestRouteWarmup:  # [JS-T011.14]
+    def test_routes_built_at_create_app(self, client):
+        import fastapi.routing
+
+        if not hasattr(fastapi.routing, "_EffectiveRouteContext"):
+            pytest.skip("FastAPI가 라우트를 즉시 생성하는 버전")
+        with patch.object(fastapi.routing._EffectiveRouteContext, "from_api_route") as build:
+            assert client.get("/api/chat/connections").status_code == 200
+        build.assert_not_called()
+
+
+class TestLazyLogger:  # [JS-T011.15]
+    def test_import_does_not_load_structlog(self):
+        import subprocess
+        import sys
+
+        code = "import sys, jedisos.web.app; print('structlog' in sys.modules)"
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert out.stdout.strip() == "False"
+
+    def test_first_use_replaces_proxy(self, monkeypatch):
+        import jedisos.web.app as web_app
+
+        monkeypatch.setattr(web_app, "logger", web_app._LazyLogger())
+        web_app.logger.debug("lazy_logger_test")
+        assert not isinstance(web_app.logger, web_app._LazyLogger)
+
+
+class TestLogConfig:  # [JS-T011.16]
+    def test_console_default_leaves_structlog_untouched(self, monkeypatch):
+        from jedisos.core.log_config import configure_logging
+
+        monkeypatch.delenv("JEDISOS_LOG_FORMAT", raising=False)
+        with patch("structlog.configure") as configure:
+            assert configure_logging() is False
+        configure.assert_not_called()
+
+    def test_json_renders_with_orjson(self, capsysbinary):
+        import structlog
+
+        from jedisos.core.log_config import configure_logging
+
+        try:
+            assert configure_logging(fmt="json", level="info") is True
+            log = structlog.get_logger()
+            log.debug("hidden")
+            log.info("web_app_ready", phase="메모리")
+            out = capsysbinary.readouterr().out
+        finally:
+            structlog.reset_defaults()
+
+        line = json.loads(out.decode())
+        assert line["event"] == "web_app_ready"
+        assert line["phase"] == "메모리"
+        assert line["level"] == "info"
+
+
+class TestMetrics:  # [JS-T011.17]
+    def test_serves_prebuilt_buffer(self, app, client):
+        app.state.metrics.body = b"jedisos_info 1\n"
+        resp = client.get("/metrics")
+        assert resp.status_code == 200
+        assert resp.content == b"jedisos_info 1\n"
+        assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+
+    def test_render_counts_audit_entries(self):
+        from jedisos.security.audit import AuditLogger
+        from jedisos.web.app import _render_metrics
+
+        audit = AuditLogger()
+        audit.log_tool_call("shell_exec", allowed=False)
+        audit.log_tool_call("recall")
+        with patch.dict("sys.modules", {"prometheus_client": None}):
+            body = _render_metrics(AppResources(audit=audit), started_at=0.0).decode()
+        assert "jedisos_audit_entries 2\n" in body
+        assert "jedisos_audit_denied 1\n" in body
+        assert "jedisos_llm_models 0\n" in body
+
+
+class TestDocsToggle:  # [JS-T011.13]
+    def test_docs_enabled_by_default(self, client):
+        assert client.get("/openapi.json").status_code == 200
+
+    def test_docs_disabled_in_prod(self, monkeypatch):
+        monkeypatch.setenv("JEDISOS_ENV", "prod")
+        prod = TestClient(create_app(), raise_server_exceptions=False)
+        assert prod.get("/openapi.json").status_code == 404
+        assert prod.get("/docs").status_code == 404
+        assert prod.get("/health").status_code == 200